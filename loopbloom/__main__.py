@@ -6,7 +6,6 @@ storage backend based on the user's configuration.
 
 import importlib
 import logging
-import os
 import pkgutil
 from typing import TYPE_CHECKING
 
@@ -14,17 +13,11 @@ import click
 
 from loopbloom import cli as cli_package
 from loopbloom.cli import ui
-from loopbloom.core import config as cfg
 from loopbloom.logging import setup_logging
+from loopbloom.services.background import BackgroundTasks
+from loopbloom.services.datetime import use_clock
 from loopbloom.storage.base import Storage
-from loopbloom.storage.json_store import DEFAULT_PATH as JSON_DEFAULT_PATH
-from loopbloom.storage.json_store import JSONStore
-from loopbloom.storage.sqlite_store import (
-    DEFAULT_PATH as SQLITE_DEFAULT_PATH,
-)
-from loopbloom.storage.sqlite_store import (
-    SQLiteStore,
-)
+from loopbloom.storage.factory import open_store
 
 
 class AppContext:
@@ -36,6 +29,8 @@ class AppContext:
         self.store = store
         self.debug = debug
         self.dry_run = dry_run
+        # Follow-up jobs run after the command's changes are saved.
+        self.tasks = BackgroundTasks()
 
 
 if TYPE_CHECKING:  # pragma: no cover - hints for mypy
@@ -90,35 +85,21 @@ def cli(
         logging.getLogger().debug("Debug mode is ON")
         click.echo("Debug mode is ON")
 
-    config = cfg.load()
-    storage_backend = os.getenv(
-        "LOOPBLOOM_STORAGE_BACKEND", config.get("storage", "json")
-    )
-    # Precedence: CLI flag > env var > config
-    data_path = data_path_opt or os.getenv(
-        "LOOPBLOOM_DATA_PATH", config.get("data_path")
-    )
-
-    # If an explicit data path is provided, prefer a backend based on
-    # the file extension to avoid mismatches (e.g., tests may set
-    # LOOPBLOOM_DATA_PATH to a JSON file regardless of user config).
-    if data_path:
-        lower = str(data_path).lower()
-        if lower.endswith(".json"):
-            storage_backend = "json"
-        elif lower.endswith(".db") or lower.endswith(".sqlite"):
-            storage_backend = "sqlite"
-
     store: Storage
-    if storage_backend == "sqlite":
-        path = data_path or str(SQLITE_DEFAULT_PATH)
-        store = SQLiteStore(path)
+    if ctx.obj is not None:
+        # Embedding callers (shell, daemon, batch) pass an already-open store
+        # so consecutive commands share one loaded goal graph.
+        store = ctx.obj
     else:
-        path = data_path or str(JSON_DEFAULT_PATH)
-        store = JSONStore(path)
+        store = open_store(data_path_opt)
 
+    # Resolve "now" once so the whole command, including its deferred jobs,
+    # sees the same day.
+    ctx.with_resource(use_clock())
     # Expose the store instance to subcommands via Click's context object.
     ctx.obj = AppContext(store, debug=debug, dry_run=dry_run)
+    # Give queued notifications a bounded chance to finish before exiting.
+    ctx.call_on_close(ctx.obj.tasks.join)
 
 
 register_commands()
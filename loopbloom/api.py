@@ -0,0 +1,315 @@
+"""Embeddable Python API for driving LoopBloom without the CLI.
+
+:class:`Client` keeps one storage session open, so consecutive calls share
+the loaded goal graph and a name index instead of reloading the data file
+each time. Every method returns plain ``dict``/``list`` data that can be
+serialised to JSON as-is; nothing is printed.
+
+Example::
+
+    from loopbloom.api import Client
+
+    with Client() as lb:
+        lb.add_goal("Sleep")
+        lb.add_micro("Lights out by 23:00", goal="Sleep")
+        lb.checkin("Sleep", success=True)
+        print(lb.summary())
+"""
+
+from __future__ import annotations
+
+import os
+from calendar import monthrange
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from loopbloom.constants import DEFAULT_TIMEFRAME, WINDOW_DEFAULT
+from loopbloom.core import config as cfg
+from loopbloom.core.models import GoalArea, MicroGoal, Phase
+from loopbloom.core.progression import current_streak, should_advance
+from loopbloom.core.stats import day_counts, goal_totals, iter_micro_goals, month_start
+from loopbloom.core.talks import TalkPool
+from loopbloom.services.datetime import get_current_datetime
+from loopbloom.storage.base import Storage
+from loopbloom.storage.factory import open_store
+from loopbloom.storage.session import SessionStore
+
+__all__ = ["Client", "ClientError", "NotFoundError"]
+
+
+class ClientError(ValueError):
+    """Raised when a request cannot be applied to the data."""
+
+
+class NotFoundError(ClientError, LookupError):
+    """Raised when a named goal, phase or micro-habit does not exist."""
+
+
+class Client:
+    """Run LoopBloom operations against one open store."""
+
+    def __init__(
+        self,
+        data_path: str | os.PathLike[str] | None = None,
+        *,
+        store: Storage | None = None,
+        write_through: bool = True,
+    ) -> None:
+        """Open the store at ``data_path`` (or the configured one).
+
+        Args:
+            data_path: Data file to use; the extension selects the backend.
+            store: Already-open backend to use instead of ``data_path``.
+            write_through: Save every change immediately; when ``False``
+                changes stay in memory until ``client.session.flush()``.
+        """
+        backend = store if store is not None else open_store(data_path)
+        self.session = SessionStore(backend, write_through=write_through)
+        self._indexed: List[GoalArea] | None = None
+        self._by_name: Dict[str, GoalArea] = {}
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def revision(self) -> int:
+        """Return a counter that changes whenever the data may have changed.
+
+        Changes made by other processes are detected first, so equal values
+        mean every view computed in between is still current.
+        """
+        self._goals()
+        return self.session.revision
+
+    def changes_since(self, generation: int) -> Dict[str, Any]:
+        """Return the store's generation and the goals touched after one.
+
+        ``goals`` is ``None`` when the store cannot tell, in which case
+        everything should be treated as changed.
+        """
+        ids = self.session.changes_since(generation)
+        by_id = {g.id: g.name for g in self._goals()}
+        return {
+            "generation": self.session.generation(),
+            "goals": (
+                None
+                if ids is None
+                else [{"id": i, "name": by_id.get(i)} for i in sorted(ids)]
+            ),
+        }
+
+    def close(self) -> None:
+        """Drop the cached graph and any changes that were not saved."""
+        self.session.discard()
+        self._indexed = None
+        self._by_name = {}
+
+    # -- lookup --------------------------------------------------------------
+
+    def _goals(self) -> List[GoalArea]:
+        """Return the session's goals, re-indexing after a reload."""
+        goals = self.session.load()
+        if goals is not self._indexed:
+            self._by_name = {g.name.lower(): g for g in goals}
+            self._indexed = goals
+        return goals
+
+    def _goal(self, name: str) -> GoalArea:
+        """Return the goal called ``name`` (case-insensitive)."""
+        self._goals()
+        goal = self._by_name.get(name.strip().lower())
+        if goal is None:
+            raise NotFoundError(f"Goal not found: {name}")
+        return goal
+
+    def _save(self, goals: List[GoalArea]) -> None:
+        """Persist ``goals`` and keep the index pointing at them."""
+        self.session.save(goals)
+        self._indexed = goals
+
+    # -- goals ---------------------------------------------------------------
+
+    def goals(self) -> List[Dict[str, Any]]:
+        """Return every goal area as JSON-compatible data."""
+        return [g.model_dump(mode="json") for g in self._goals()]
+
+    def goal(self, name: str) -> Dict[str, Any]:
+        """Return one goal area as JSON-compatible data."""
+        return self._goal(name).model_dump(mode="json")
+
+    def add_goal(self, name: str, notes: str | None = None) -> Dict[str, Any]:
+        """Create a goal area and return it.
+
+        Raises:
+            ClientError: If a goal with that name already exists.
+        """
+        goals = self._goals()
+        if name.strip().lower() in self._by_name:
+            raise ClientError(f"Goal already exists: {name}")
+        goal = GoalArea(name=name.strip(), notes=notes or None)
+        goals.append(goal)
+        self._by_name[goal.name.lower()] = goal
+        self._save(goals)
+        return goal.model_dump(mode="json")
+
+    def add_micro(
+        self, name: str, goal: str, phase: str | None = None
+    ) -> Dict[str, Any]:
+        """Add a micro-habit to ``goal`` (or to its ``phase``) and return it.
+
+        A phase that does not exist yet is created, as ``micro add`` does.
+        """
+        goals = self._goals()
+        target = self._goal(goal)
+        micros = target.micro_goals
+        if phase is not None:
+            ph = next(
+                (p for p in target.phases if p.name.lower() == phase.lower()), None
+            )
+            if ph is None:
+                ph = Phase(name=phase.strip())
+                target.phases.append(ph)
+            micros = ph.micro_goals
+        micro = MicroGoal(name=name)
+        micros.append(micro)
+        self._save(goals)
+        return micro.model_dump(mode="json")
+
+    # -- check-ins -----------------------------------------------------------
+
+    def checkin(
+        self,
+        goal: str,
+        *,
+        success: bool = True,
+        note: str | None = None,
+        day: date | None = None,
+    ) -> Dict[str, Any]:
+        """Record a check-in for the active micro-habit of ``goal``.
+
+        Args:
+            goal: Goal name.
+            success: ``False`` records a skip.
+            note: Optional note stored with the check-in.
+            day: Day to record; defaults to today.
+
+        Returns:
+            The recorded check-in with the goal, micro-habit, pep talk and
+            resulting streak.
+        """
+        goals = self._goals()
+        target = self._goal(goal)
+        micro = target.get_active_micro_goal()
+        if micro is None:
+            raise NotFoundError(f"No active micro-habit in goal: {target.name}")
+        day = day or get_current_datetime().date()
+        ci = micro.record_checkin(day, success, note)
+        streak = current_streak(micro.checkins)
+        ci.self_talk_generated = TalkPool.random(
+            "success" if success else "skip",
+            goal=target.name,
+            micro=micro.name,
+            streak=streak,
+        )
+        self._save(goals)
+        return {
+            "goal": target.name,
+            "micro": micro.name,
+            "date": ci.date.isoformat(),
+            "success": ci.success,
+            "note": ci.note,
+            "talk": ci.self_talk_generated,
+            "streak": streak,
+        }
+
+    # -- views ---------------------------------------------------------------
+
+    def summary(
+        self, *, window: int | None = None, today: date | None = None
+    ) -> List[Dict[str, Any]]:
+        """Return the rows shown by ``loopbloom summary``.
+
+        Each row holds the goal name, successes and check-ins within the
+        advancement window, the active micro-habit and whether it is ready
+        to advance.
+        """
+        if window is None:
+            window = cfg.load().get("advance", {}).get("window", WINDOW_DEFAULT)
+        today = today or get_current_datetime().date()
+        since = today - timedelta(days=window - 1)
+        rows = []
+        for g, successes, total in goal_totals(self._goals(), since):
+            active = g.get_active_micro_goal()
+            rows.append(
+                {
+                    "goal": g.name,
+                    "successes": successes,
+                    "total": total,
+                    "window": window,
+                    "active_micro": active.name if active else None,
+                    "advance": bool(active and should_advance(active)),
+                }
+            )
+        return rows
+
+    def report_data(
+        self,
+        mode: str = "calendar",
+        *,
+        months: int = 1,
+        year: Optional[int] = None,
+        goal: str | None = None,
+        today: date | None = None,
+    ) -> Dict[str, Any]:
+        """Return the numbers behind ``loopbloom report``.
+
+        Args:
+            mode: ``calendar`` (per-day counts for ``months`` months or a
+                whole ``year``), ``success`` (all-time totals per goal) or
+                ``line`` (per-day success rates for the default timeframe).
+            months: Months covered by the calendar, ending this month.
+            year: Calendar year to cover instead of ``months``.
+            goal: Only include this goal.
+            today: Day the report is computed for; defaults to today.
+        """
+        goals = [self._goal(goal)] if goal else self._goals()
+        today = today or get_current_datetime().date()
+        if mode == "success":
+            return {
+                "mode": mode,
+                "goals": [
+                    {"goal": g.name, "successes": s, "total": t}
+                    for g, s, t in goal_totals(goals)
+                ],
+            }
+        if mode == "line":
+            start = today - timedelta(days=DEFAULT_TIMEFRAME - 1)
+            end = today
+        elif mode == "calendar":
+            if year is not None:
+                start, end = date(year, 1, 1), date(year, 12, 31)
+            else:
+                start = month_start(today, months - 1)
+                end = today.replace(day=monthrange(today.year, today.month)[1])
+        else:
+            raise ClientError(f"Unknown report mode: {mode}")
+        counts = day_counts(iter_micro_goals(goals), start, end)
+        days = []
+        for day, s, t in zip(
+            counts.days(), counts.successes, counts.totals, strict=True
+        ):
+            entry: Dict[str, Any] = {"date": day.isoformat()}
+            if mode == "line":
+                entry["rate"] = s / t * 100 if t else 0.0
+            else:
+                entry.update(successes=s, total=t)
+            days.append(entry)
+        return {
+            "mode": mode,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "days": days,
+        }
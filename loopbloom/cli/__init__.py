@@ -5,11 +5,23 @@ commands.  Keeping them here avoids repetition and keeps each command
 implementation focused on its own behaviour.
 """
 
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, Callable
 
 import click
 
+from loopbloom.services.background import BackgroundTasks
+from loopbloom.services.datetime import Clock, current_clock, use_clock
+from loopbloom.storage.base import ConflictError
+from loopbloom.storage.session import SessionStore
+
+
+def _run_tasks(tasks: BackgroundTasks, clock: Clock) -> None:
+    """Run a command's follow-up jobs under its clock and wait for them."""
+    with use_clock(clock):
+        tasks.start()
+        tasks.join()
+
 
 def with_goals(f: Callable[..., Any]) -> Callable[..., Any]:
     """Loads goals from the store in ``ctx.obj`` before running ``f``.
@@ -19,7 +31,14 @@ def with_goals(f: Callable[..., Any]) -> Callable[..., Any]:
     argument. After the command completes, any modifications are persisted
     back to the underlying storage backend. This keeps individual commands
     simple and avoids repetitive load/save boilerplate across the CLI
-    surface.
+    surface. Jobs the command deferred on ``ctx.obj.tasks`` are started only
+    after the save so follow-up work never delays the write. When the save
+    was only held by a :class:`~loopbloom.storage.session.SessionStore`
+    (shell, batch) they wait for its flush and are dropped with a discard.
+
+    Saves are optimistic: if another process saved in the meantime, changes
+    to different goals are merged, and a change to the same goal fails the
+    command with an error instead of silently overwriting it.
     """
 
     @wraps(f)
@@ -28,16 +47,26 @@ def with_goals(f: Callable[..., Any]) -> Callable[..., Any]:
         # ``ctx.obj`` contains the application context created in ``__main__``.
         app = ctx.obj
         store = app.store
-        # Load the entire goal graph before executing the command.
-        goals = store.load()
+        # Load the entire goal graph before executing the command, together
+        # with its generation so a racing save is merged, not overwritten.
+        goals, base = store.snapshot()
         # ``f`` receives the list via the ``goals`` keyword argument so it can
         # mutate the collection in-place.
         result = f(*args, goals=goals, **kwargs)
         # Persist all changes once the command finishes unless dry-run is active.
         if not app.dry_run:
-            store.save(goals)
+            try:
+                store.commit(goals, base)
+            except ConflictError as exc:
+                raise click.ClickException(
+                    f"{exc}. Nothing was saved; run the command again."
+                ) from exc
         else:
             click.echo("[yellow]DRY RUN: Changes not saved.[/yellow]")
+        if not app.dry_run and isinstance(store, SessionStore) and store.dirty:
+            store.after_flush(partial(_run_tasks, app.tasks, current_clock()))
+        else:
+            app.tasks.start()
         return result
 
     return wrapper
@@ -1,7 +1,8 @@
 """Command for saving a timestamped copy of the data file.
 
 The storage backend (JSON or SQLite) is detected at runtime so backups
-always mirror the user's active configuration.
+always mirror the user's active configuration. JSON backups include the
+pep-talk table the data file refers to.
 """
 
 from __future__ import annotations
@@ -17,6 +18,7 @@ import click
 from loopbloom.cli import ui
 from loopbloom.core import config as cfg
 from loopbloom.storage.json_store import DEFAULT_PATH as JSON_DEFAULT_PATH
+from loopbloom.storage.json_store import JSONStore
 from loopbloom.storage.sqlite_store import DEFAULT_PATH as SQLITE_DEFAULT_PATH
 
 logger = logging.getLogger(__name__)
@@ -62,6 +64,13 @@ def backup() -> None:
     logger.info("Copying to %s", dest)
     try:
         shutil.copy2(src, dest)
+        if storage != "sqlite":
+            # Check-ins reference pep talks by id, so the talk table is
+            # copied next to the backup under the name the store expects.
+            # It only ever grows, so copying it second covers the data.
+            talks = JSONStore(src).talks_path
+            if talks.exists():
+                shutil.copy2(talks, JSONStore(dest).talks_path)
         logger.info("Backup saved to %s", dest)
         ui.success(f"Backup saved → {dest}")
     except Exception as exc:
@@ -0,0 +1,69 @@
+"""`loopbloom batch` – run a script of commands as one transaction.
+
+Every non-empty line of the script is a ``loopbloom`` command line without
+the program name; ``#`` starts a comment. The commands share one in-memory
+goal graph and their changes are written with a single save at the end. If
+any command fails, nothing is written.
+"""
+
+from __future__ import annotations
+
+import logging
+import shlex
+from typing import IO, NoReturn
+
+import click
+
+from loopbloom.cli import ui
+from loopbloom.cli.runner import invoke, rejection
+from loopbloom.storage.session import SessionStore
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(name="batch", help="Run commands from a file as one transaction.")
+@click.argument("script", type=click.File("r", encoding="utf-8"))
+@click.pass_context
+def batch(ctx: click.Context, script: IO[str]) -> None:
+    """Run each line of ``SCRIPT`` (``-`` for stdin); save only if all pass."""
+    app = ctx.obj
+    store = SessionStore(app.store, write_through=False)
+    count = 0
+    for lineno, line in enumerate(script, start=1):
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as exc:
+            _fail(ctx, store, lineno, line, str(exc))
+        if not argv:
+            continue
+        reason = rejection(argv, "in a batch")
+        if reason is not None:
+            _fail(ctx, store, lineno, line, reason)
+        # The script may be standard input, so commands must not prompt.
+        result = invoke(argv, store, interactive=False)
+        if result.exit_code != 0:
+            reason = "needs input" if result.aborted else f"exit {result.exit_code}"
+            _fail(ctx, store, lineno, line, reason)
+        store.end_command()
+        count += 1
+
+    if app.dry_run:
+        click.echo("[yellow]DRY RUN: Changes not saved.[/yellow]")
+        return
+    store.flush()
+    logger.info("Batch of %d commands committed", count)
+    ui.success(f"Ran {count} commands; changes saved.")
+
+
+def _fail(
+    ctx: click.Context, store: SessionStore, lineno: int, line: str, reason: str
+) -> NoReturn:
+    """Drop every held change and exit with status 1."""
+    store.discard()
+    logger.error("Batch failed at line %d (%s): %s", lineno, reason, line.strip())
+    ui.error(f"Line {lineno} failed ({reason}): {line.strip()}")
+    ui.error("No changes were saved.")
+    ctx.exit(1)
+
+
+batch_cmd = batch
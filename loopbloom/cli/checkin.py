@@ -1,31 +1,122 @@
 """Daily check-in command.
 
 This subcommand records progress for the active micro-habit under a goal
-and offers a small pep talk to keep momentum going.
+and offers a small pep talk to keep momentum going. Several goals, every
+active micro-habit or a file of check-ins can be recorded in one run, and
+``--date``/``--range`` backfill past days. Batches are applied to a single
+loaded goal graph, saved once, and followed by one pep talk per mood, one
+notification and one progression pass over all touched goals. After the
+check-ins are saved the notification is delivered on the background worker
+while progression feedback is printed in the foreground.
 """
 
+import csv
 import logging
-from typing import List, Optional
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import IO, Any, List, Optional, Tuple
 
 import click
 from rich import print
 
 from loopbloom.cli import with_goals
 from loopbloom.cli.interactive import interactive_select
-from loopbloom.cli.utils import goal_not_found
-from loopbloom.core.models import Checkin, GoalArea, MicroGoal, Status
+from loopbloom.cli.utils import find_goal, goal_not_found
+from loopbloom.core.models import GoalArea, MicroGoal, Status
+from loopbloom.core.progression import current_streak
 from loopbloom.core.talks import TalkPool
 from loopbloom.services.datetime import get_current_datetime
 from loopbloom.services.progression import ProgressionService
 
 logger = logging.getLogger(__name__)
 
+# (goal, micro-goal, success, note) for one requested check-in.
+Target = Tuple[GoalArea, MicroGoal, bool, str]
+
+
+def _parse_range(text: str) -> Tuple[date, date]:
+    """Parse ``START..END`` (inclusive) into a pair of dates."""
+    start_s, sep, end_s = text.partition("..")
+    try:
+        if not sep:
+            raise ValueError
+        start = date.fromisoformat(start_s.strip())
+        end = date.fromisoformat(end_s.strip())
+    except ValueError:
+        raise click.BadParameter(
+            "Use START..END with ISO dates, e.g. 2024-05-01..2024-05-07",
+            param_hint="--range",
+        ) from None
+    if end < start:
+        raise click.BadParameter("END must not be before START", param_hint="--range")
+    return start, end
+
+
+def _active_micro_goals(goals: List[GoalArea]) -> List[Tuple[str, GoalArea, MicroGoal]]:
+    """Return ``(label, goal, micro)`` for every active micro-goal."""
+    active: List[Tuple[str, GoalArea, MicroGoal]] = []
+    for g in goals:
+        for ph in g.phases:
+            for m in ph.micro_goals:
+                if m.status is Status.active:
+                    active.append((f"{g.name} -> {ph.name} -> {m.name}", g, m))
+        for m in g.micro_goals:
+            if m.status is Status.active:
+                active.append((f"{g.name} -> {m.name}", g, m))
+    return active
+
+
+def _resolve_goal(
+    goals: List[GoalArea], name: str
+) -> Optional[Tuple[GoalArea, MicroGoal]]:
+    """Find ``name`` and its active micro-goal, reporting failures."""
+    goal = find_goal(goals, name)
+    if goal is None:
+        logger.error("Goal not found: %s", name)
+        goal_not_found(name, [g.name for g in goals])
+        return None
+    # Once we know the goal, locate its currently active micro-habit so the
+    # check-in updates the right place.
+    mg = goal.get_active_micro_goal()
+    if mg is None:
+        logger.error("No active micro-goal in goal %s", goal.name)
+        click.echo("[red]No active micro-goal found for this goal.")
+        return None
+    return goal, mg
+
+
+def _read_targets(
+    fp: IO[str], goals: List[GoalArea], success: bool, note: str
+) -> Optional[List[Target]]:
+    """Parse ``goal[,success|skip][,note]`` lines from ``fp``."""
+    targets: List[Target] = []
+    for row in csv.reader(fp):
+        if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+            continue
+        resolved = _resolve_goal(goals, row[0].strip())
+        if resolved is None:
+            return None
+        row_success = success
+        if len(row) > 1 and row[1].strip():
+            row_success = row[1].strip().lower() not in ("skip", "fail", "0", "no")
+        row_note = row[2].strip() if len(row) > 2 else note
+        targets.append((*resolved, row_success, row_note))
+    return targets
+
+
+def _pep_talk(success: bool, **context: Any) -> str:
+    """Return a pep talk for the mood, marking successes with a check."""
+    talk = TalkPool.random("success" if success else "skip", **context)
+    if success and "✓" not in talk:
+        talk = "✓ " + talk
+    return talk
+
 
 @click.command(
     name="checkin",
-    help="Record today’s success, skip, or failure for a goal.",
+    help="Record today’s success, skip, or failure for one or more goals.",
 )
-@click.argument("goal_name", required=False)
+@click.argument("goal_names", nargs=-1)
 @click.option("--success/--skip", default=True, help="Mark success or skip.")
 @click.option(
     "--fail",
@@ -34,62 +125,106 @@ logger = logging.getLogger(__name__)
     help="Alias for --skip to record a failed check-in.",
 )
 @click.option("--note", default="", help="Optional note.")
+@click.option(
+    "--all-active",
+    is_flag=True,
+    default=False,
+    help="Check in every active micro-habit.",
+)
+@click.option(
+    "--from-file",
+    "from_file",
+    type=click.File("r"),
+    default=None,
+    help="Read 'goal[,success|skip][,note]' lines from a file ('-' for stdin).",
+)
+@click.option(
+    "--date",
+    "on_date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Record the check-in for this day instead of today.",
+)
+@click.option(
+    "--range",
+    "date_range",
+    default=None,
+    help="Backfill every day in START..END (inclusive).",
+)
 @with_goals
 def checkin(
-    goal_name: Optional[str],
+    goal_names: Tuple[str, ...],
     success: bool,
     fail: bool,
     note: str,
+    all_active: bool,
+    from_file: Optional[IO[str]],
+    on_date: Optional[datetime],
+    date_range: Optional[str],
     goals: List[GoalArea],
 ) -> None:
-    """Append a ``Checkin`` to the active micro-goal.
+    """Append a ``Checkin`` to the active micro-goal of each requested goal.
 
     Args:
-        goal_name: Name of the goal to check in for. When ``None`` an
-            interactive selection is presented.
-        success: Whether the check-in represents a success.
+        goal_names: Names of the goals to check in for. When empty (and no
+            other selector is given) an interactive selection is presented.
+        success: Whether the check-ins represent a success.
         fail: If ``True`` overrides ``success`` to record a failure/skip.
-        note: Optional note stored with the check-in.
+        note: Optional note stored with the check-ins.
+        all_active: Check in every active micro-goal.
+        from_file: File listing check-ins, one goal per line.
+        on_date: Day to record instead of today.
+        date_range: ``START..END`` range of days to backfill.
         goals: List of all goal areas loaded from storage.
     """
     # ``success`` picks the pep-talk mood. ``fail`` is merely an alias for
     # ``--skip`` and flips ``success`` when present. The optional ``note`` is
     # stored verbatim with the check-in.
-    logger.debug("Starting check-in for goal_name=%s", goal_name)
+    logger.debug("Starting check-in for goal_names=%s", goal_names)
     ctx = click.get_current_context()
     logger.debug("Dry run mode is %s", "ON" if ctx.obj.dry_run else "OFF")
     if ctx.obj.debug:
         click.echo(f"Dry run: {ctx.obj.dry_run}")
     if fail:
         success = False
+    if on_date is not None and date_range is not None:
+        raise click.UsageError("Use either --date or --range, not both.")
 
-    mg: MicroGoal | None = None
-    goal: GoalArea | None = None
     today = get_current_datetime().date()
-    logger.debug("Check-in date: %s", today)
+    days = [today]
+    if on_date is not None:
+        days = [on_date.date()]
+    elif date_range is not None:
+        start, end = _parse_range(date_range)
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    logger.debug("Check-in date(s): %s..%s", days[0], days[-1])
     if ctx.obj.debug:
-        click.echo(f"Check-in recorded for date: {today}")
+        click.echo(f"Check-in recorded for date: {days[0]}")
+
+    targets: List[Target] = []
+    if all_active:
+        targets.extend((g, m, success, note) for _, g, m in _active_micro_goals(goals))
+    if from_file is not None:
+        from_targets = _read_targets(from_file, goals, success, note)
+        if from_targets is None:
+            return
+        targets.extend(from_targets)
+    for name in goal_names:
+        resolved = _resolve_goal(goals, name)
+        if resolved is None:
+            return
+        targets.append((*resolved, success, note))
 
     # If the user omitted a goal we ask interactively to ensure the check-in is
     # attributed to the correct micro-habit.
-    if goal_name is None:
+    if not targets and not (all_active or from_file is not None or goal_names):
         if not goals:
             logger.error("No goals available for check-in")
             click.echo("[red]No goals – use `loopbloom goal add`.")
             return
 
         click.echo("Which goal do you want to check in for?")
-
-        active: list[tuple[str, tuple[GoalArea, MicroGoal]]] = []
-        for g in goals:
-            for ph in g.phases:
-                for m in ph.micro_goals:
-                    if m.status is Status.active:
-                        active.append((f"{g.name} -> {ph.name} -> {m.name}", (g, m)))
-            for m in g.micro_goals:
-                if m.status is Status.active:
-                    active.append((f"{g.name} -> {m.name}", (g, m)))
-
+        active = _active_micro_goals(goals)
         if not active:
             logger.info("No active micro-goals for interactive check-in")
             click.echo("No active micro-goals to check in for.")
@@ -97,64 +232,112 @@ def checkin(
 
         selection = interactive_select(
             "Select a micro-goal to check in for",
-            {label: pair for label, pair in active},
+            {label: (g, m) for label, g, m in active},
         )
         if selection is None:
             return
+        targets.append((*selection, success, note))
 
-        goal, mg = selection
-        goal_name = goal.name
+    # A micro-goal named twice (e.g. ``G G`` or ``--all-active G``) is only
+    # recorded once; the first request for it wins.
+    unique: dict[str, Target] = {}
+    for target in targets:
+        unique.setdefault(target[1].id, target)
+    targets = list(unique.values())
+
+    if not targets:
+        logger.info("Nothing to check in")
+        click.echo("No active micro-goals to check in for.")
+        return
+
+    if len(targets) == 1 and days == [today]:
+        _single_checkin(*targets[0], today)
+    else:
+        # Explicit dates backfill history, so days already logged are skipped.
+        _batch_checkin(targets, days, skip_existing=days != [today])
 
-    # Locate the goal by name if it wasn't selected interactively.
-    if goal is None:
-        found = next(
-            (g for g in goals if g.name.lower() == goal_name.lower()),
-            None,
-        )
-        if found is None:
-            logger.error("Goal not found: %s", goal_name)
-            goal_not_found(goal_name, [g.name for g in goals])
-            return
-        goal = found
-        # Once we know the goal, locate its currently active micro-habit so the
-        # check-in updates the right place.
-        mg = goal.get_active_micro_goal()
-
-        if mg is None:
-            logger.error("No active micro-goal in goal %s", goal.name)
-            click.echo("[red]No active micro-goal found for this goal.")
-            return
 
-    assert mg is not None
+def _single_checkin(
+    goal: GoalArea, mg: MicroGoal, success: bool, note: str, today: date
+) -> None:
+    """Record one check-in for today and give full feedback."""
     # Echo the chosen micro-habit so the user can confirm we recorded the
     # intended one.
     logger.info("Checking in for %s", mg.name)
     click.echo(f"Checking in for: [bold]{mg.name}[/bold]")
     # Append the new check-in so progress reports and streak calculations
     # include today's result.
-    talk = TalkPool.random("success" if success else "skip")
-    if success and "\u2713" not in talk:
-        talk = "\u2713 " + talk
-    ci = Checkin(
-        date=today, success=success, note=note or None, self_talk_generated=talk
+    ci = mg.record_checkin(today, success, note, None)
+    talk = _pep_talk(
+        success, goal=goal.name, micro=mg.name, streak=current_streak(mg.checkins)
     )
+    ci.self_talk_generated = talk
     logger.debug("Check-in recorded for date: %s", today)
-    mg.checkins.append(ci)
 
     # Output pep-talk so the user gets immediate encouragement.
     logger.info("Pep talk: %s", talk)
     print(talk)
+    # Once ``with_goals`` has saved the check-in the notification goes to the
+    # background worker, where a stalled channel can be abandoned, while the
+    # progression feedback is printed on this thread.
+    tasks = click.get_current_context().obj.tasks
+    tasks.defer(partial(_notify, talk, goal.name))
+    tasks.after_save(partial(_report_progression, goal))
+
+
+def _batch_checkin(
+    targets: List[Target], days: List[date], *, skip_existing: bool
+) -> None:
+    """Record every target for every day, then give one round of feedback."""
+    # One pep talk per mood, so skipped rows never store a success talk.
+    talks: dict[bool, str] = {}
+    names = {t[0].name for t in targets}
+    context = {"goal": names.pop()} if len(names) == 1 else {}
+    recorded = 0
+    skipped = 0
+    touched: dict[str, GoalArea] = {}
+    for goal, mg, success, note in targets:
+        logged = {ci.date for ci in mg.checkins} if skip_existing else set()
+        for day in days:
+            if day in logged:
+                skipped += 1
+                continue
+            if success not in talks:
+                talks[success] = _pep_talk(success, **context)
+            mg.record_checkin(day, success, note, talks[success])
+            recorded += 1
+        mark = "✓" if success else "–"
+        click.echo(f"{mark} {goal.name} → {mg.name}")
+        touched[goal.id] = goal
+    logger.info("Recorded %d check-in(s), skipped %d", recorded, skipped)
+    summary = f"Recorded {recorded} check-in(s)"
+    if skipped:
+        summary += f" ({skipped} day(s) already logged)"
+    click.echo(summary + ".")
+    for talk in talks.values():
+        print(talk)
+
+    tasks = click.get_current_context().obj.tasks
+    only = next(iter(touched.values())).name if len(touched) == 1 else None
+    message = " ".join([summary + ".", *talks.values()])
+    tasks.defer(partial(_notify, message, only))
+    tasks.after_save(partial(_report_batch_progression, list(touched.values())))
+
+
+def _notify(message: str, goal: Optional[str]) -> None:
+    """Send the check-in notification via the configured channel."""
     from loopbloom.core import config as cfg
     from loopbloom.services import notifier
 
     # Respect the user's preferred notification channel when sending the pep
     # talk.
     notify_mode = cfg.load().get("notify", "terminal")
-    assert goal is not None
-    notifier.send("LoopBloom Check-in", talk, mode=notify_mode, goal=goal.name)
+    notifier.send("LoopBloom Check-in", message, mode=notify_mode, goal=goal)
+
 
-    progression_service = ProgressionService()
-    should_progress, reasons = progression_service.check_progression(goal)
+def _report_progression(goal: GoalArea) -> None:
+    """Explain whether ``goal`` is ready for its next micro-habit."""
+    should_progress, reasons = ProgressionService.check_progression(goal)
 
     if should_progress:
         print(
@@ -175,4 +358,17 @@ def checkin(
             print(f"- {reason}")
 
 
+def _report_batch_progression(goals: List[GoalArea]) -> None:
+    """Summarise progression for every goal touched by a batch."""
+    results = ProgressionService.check_many(goals)
+    ready = [g for g, should_progress, _ in results if should_progress]
+    if ready:
+        print(
+            "\n[bold green]Ready to advance:[/bold green] "
+            + ", ".join(g.name for g in ready)
+        )
+    for g, _, reasons in results:
+        print(f"- {g.name}: {'; '.join(reasons)}")
+
+
 checkin_cmd = checkin
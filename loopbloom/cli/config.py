@@ -135,7 +135,7 @@ def reset(ctx: click.Context, yes: bool) -> None:
             ui.warn("No data found to reset.")
     except Exception as e:
         ui.error(f"Error resetting data: {e}")
-        logger.error(f"Error resetting data: {e}")
+        logger.error("Error resetting data: %s", e)
 
 
 config_cmd = config
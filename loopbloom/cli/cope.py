@@ -2,7 +2,8 @@
 
 These commands provide guided workflows for dealing with stressful or
 overwhelming situations. Plans are defined in YAML so users can add their
-own customised coping strategies.
+own customised coping strategies; ``cope new`` saves them in the user's
+coping directory rather than the installed package.
 """
 
 import logging
@@ -11,7 +12,6 @@ import click
 import yaml
 
 from loopbloom.cli import ui
-from loopbloom.constants import COPING_DIR
 from loopbloom.core.coping import PlanRepository, run_plan
 
 logger = logging.getLogger(__name__)
@@ -52,7 +52,7 @@ def _run(plan_id: str) -> None:
 def _new() -> None:
     """Prompt the user for plan details and save a YAML file."""
     plan_id = click.prompt("Plan ID (no spaces)").strip()
-    if PlanRepository.get(plan_id):
+    if PlanRepository.exists(plan_id):
         logger.error("Plan already exists: %s", plan_id)
         click.echo("[red]Plan already exists.")
         return
@@ -88,7 +88,9 @@ def _new() -> None:
         ui.error("No steps defined; aborting.")
         return
     content = {"id": plan_id, "title": title, "steps": steps}
-    path = COPING_DIR / f"{plan_id}.yml"
+    user_dir = PlanRepository.user_dir()
+    user_dir.mkdir(parents=True, exist_ok=True)
+    path = user_dir / f"{plan_id}.yml"
     dumped = yaml.safe_dump(content, sort_keys=False, allow_unicode=True)
     path.write_text(dumped)
     # Show full path so users know where the YAML file lives
@@ -0,0 +1,181 @@
+"""`loopbloom daemon` – keep LoopBloom warm behind a Unix socket.
+
+``loopbloom daemon run`` loads the configured store once and then executes
+command lines sent by :mod:`loopbloom.client` in-process, writing every
+change straight through to the backend. Config, the talk pool and the
+coping catalog stay cached in the daemon as well; each is re-read when its
+files change on disk, so edits made outside the daemon are picked up.
+
+Requests are handled one at a time. A command that needs to prompt, or
+that targets a different data file than the daemon serves, is declined
+and the client runs it locally instead.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+import click
+
+from loopbloom import client
+from loopbloom.cli import ui
+from loopbloom.cli.runner import Result, invoke
+from loopbloom.storage.factory import open_store, resolve
+from loopbloom.storage.session import SessionStore
+
+logger = logging.getLogger(__name__)
+
+
+def _data_path_arg(argv: List[str]) -> str | None:
+    """Return the ``--data-path`` given before the subcommand, if any."""
+    for i, arg in enumerate(argv):
+        if arg == "--data-path" and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith("--data-path="):
+            return arg.split("=", 1)[1]
+        if not arg.startswith("-"):
+            break
+    return None
+
+
+class Daemon:
+    """Executes forwarded command lines against one warm store."""
+
+    def __init__(self, data_path: str | None = None) -> None:
+        """Open the store selected by ``data_path`` or the usual settings."""
+        self.target = self._target(data_path, os.environ, os.getcwd())
+        self.store = SessionStore(open_store(data_path))
+        self.stopping = False
+
+    @staticmethod
+    def _target(data_path: str | None, env: Mapping[str, str], cwd: str) -> Any:
+        """Return what identifies the store a request would touch."""
+        backend, path = resolve(data_path, env=env)
+        if not path.is_absolute():
+            path = Path(cwd) / path
+        return backend, path.resolve(), env.get("LOOPBLOOM_SQLITE_PATH")
+
+    def handle(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one request from :func:`loopbloom.client.request`."""
+        op = req.get("op", "run")
+        if op == "ping":
+            return {"pid": os.getpid(), "data_path": str(self.target[1])}
+        if op == "stop":
+            self.stopping = True
+            return {"ok": True}
+        argv = [str(a) for a in req.get("argv", [])]
+        cwd = str(req.get("cwd") or os.getcwd())
+        env = {k: str(v) for k, v in (req.get("env") or {}).items()}
+        if self._target(_data_path_arg(argv), env, cwd) != self.target:
+            return {"fallback": True}
+        prev = os.getcwd()
+        try:
+            # Relative paths in arguments (export files, --from-file) refer to
+            # the caller's directory.
+            os.chdir(cwd)
+            result = invoke(argv, self.store, capture=True)
+        except Exception as exc:
+            logger.exception("Daemon command failed: %s", argv)
+            result = Result(1, f"Error: {exc}\n")
+        finally:
+            self.store.end_command()
+            os.chdir(prev)
+        if result.aborted:
+            # The command wanted input; let the client run it interactively.
+            return {"fallback": True}
+        return {"exit_code": result.exit_code, "output": result.output}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON reply line."""
+
+    server: "_Server"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            req = json.loads(line)
+        except ValueError:
+            return
+        reply = self.server.daemon.handle(req)
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class _Server(socketserver.UnixStreamServer):
+    """Single-threaded server so commands never run concurrently."""
+
+    def __init__(self, path: Path, daemon: Daemon) -> None:
+        self.daemon = daemon
+        super().__init__(str(path), _Handler)
+
+
+def serve(path: Path, daemon: Daemon) -> None:
+    """Serve ``daemon`` on the socket at ``path`` until asked to stop."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if client.request({"op": "ping"}, path=path, timeout=1.0) is not None:
+        raise click.ClickException(f"A daemon is already listening on {path}")
+    path.unlink(missing_ok=True)
+    # Only the owner may connect: commands run with the owner's data.
+    old_umask = os.umask(0o177)
+    try:
+        server = _Server(path, daemon)
+    finally:
+        os.umask(old_umask)
+    logger.info("Daemon listening on %s", path)
+    try:
+        with server:
+            while not daemon.stopping:
+                server.handle_request()
+    finally:
+        path.unlink(missing_ok=True)
+        logger.info("Daemon stopped")
+
+
+@click.group(name="daemon", help="Serve commands from a warm background process.")
+def daemon() -> None:
+    """Daemon commands."""
+    pass
+
+
+@daemon.command(name="run", help="Run the daemon in the foreground.")
+@click.pass_context
+def _run(ctx: click.Context) -> None:
+    """Serve forwarded commands until ``daemon stop`` or Ctrl-C."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise click.ClickException("The daemon needs Unix domain sockets.")
+    backend = ctx.obj.store
+    path = client.socket_path()
+    data_path = getattr(backend, "path", None)
+    ui.info(f"LoopBloom daemon serving {data_path} on {path}")
+    try:
+        serve(path, Daemon(str(data_path) if data_path else None))
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon.command(name="stop", help="Stop a running daemon.")
+def _stop() -> None:
+    """Ask the daemon to exit after its current request."""
+    if client.request({"op": "stop"}, timeout=5.0) is None:
+        ui.info("No daemon running.")
+        return
+    ui.success("Daemon stopped.")
+
+
+@daemon.command(name="status", help="Show whether a daemon is running.")
+def _status() -> None:
+    """Report the daemon's pid and data file."""
+    reply = client.request({"op": "ping"}, timeout=2.0)
+    if reply is None:
+        ui.info("No daemon running.")
+        return
+    click.echo(f"Daemon pid {reply['pid']} serving {reply['data_path']}")
+
+
+daemon_cmd = daemon
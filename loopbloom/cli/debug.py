@@ -2,17 +2,34 @@ import json
 import os
 import sqlite3
 from pathlib import Path
+from typing import Any, Dict
 
 import click
 
 from loopbloom.cli import ui
 from loopbloom.core import config as cfg
+from loopbloom.core.models import TALK_ID_KEY
 from loopbloom.storage.json_store import DEFAULT_PATH as JSON_DEFAULT_PATH
+from loopbloom.storage.json_store import JSONStore
 from loopbloom.storage.sqlite_store import DEFAULT_PATH as SQLITE_DEFAULT_PATH
 
 console = ui.console
 
 
+def _inline_talks(state: Any, talks: Dict[str, str]) -> Any:
+    """Return ``state`` with interned pep-talk ids replaced by their text."""
+    if isinstance(state, list):
+        return [_inline_talks(item, talks) for item in state]
+    if not isinstance(state, dict):
+        return state
+    out = {key: _inline_talks(value, talks) for key, value in state.items()}
+    tid = out.get(TALK_ID_KEY)
+    if tid in talks:
+        del out[TALK_ID_KEY]
+        out["self_talk_generated"] = talks[tid]
+    return out
+
+
 @click.command(name="debug-state", help="Dump raw JSON goal state.")
 def debug_state() -> None:
     """Print the contents of the current goals file or SQLite payload."""
@@ -47,15 +64,17 @@ def debug_state() -> None:
                 cur = conn.cursor()
                 cur.execute("SELECT payload FROM raw_json LIMIT 1")
                 row = cur.fetchone()
+                try:
+                    cur.execute("SELECT id, text FROM talks")
+                    talks = dict(cur.fetchall())
+                except sqlite3.OperationalError:
+                    # Databases written before talks were interned.
+                    talks = {}
             payload = row[0] if row and row[0] else "[]"
         except Exception as exc:  # pragma: no cover - rare runtime failures
             ui.error(f"Failed to read SQLite payload: {exc}")
             return
-        # Ensure pretty-printed JSON output; fall back to raw payload if parsing fails.
-        try:
-            console.print_json(payload)
-        except Exception:
-            console.print_json(json.dumps(json.loads(payload)))
+        console.print_json(json.dumps(_inline_talks(json.loads(payload), talks)))
     else:
         data_file = Path(path or str(JSON_DEFAULT_PATH))
         if not data_file.exists():
@@ -63,7 +82,11 @@ def debug_state() -> None:
             return
         with open(data_file, "r", encoding="utf-8") as f:
             state = json.load(f)
-        console.print_json(json.dumps(state))
+        talks_file = JSONStore(data_file).talks_path
+        talks = {}
+        if talks_file.exists():
+            talks = json.loads(talks_file.read_text(encoding="utf-8"))["talks"]
+        console.print_json(json.dumps(_inline_talks(state, talks)))
 
 
 debug_state_cmd = debug_state
@@ -1,25 +1,226 @@
-"""Export goal history to CSV or JSON.
+"""Export goal history to CSV, JSON or NDJSON.
 
 The exported format is intentionally simple so the data can be analysed in
 spreadsheets or external tools without knowing the internal model
-structure.
+structure. Goals are streamed from the storage backend one at a time so
+exporting large histories keeps memory flat, and any format can be gzip
+compressed on the fly.
+
+With ``--since-last`` only check-ins added since the previous incremental
+export are written. A watermark file remembers, per micro-goal, how many
+check-ins were exported, the last exported date and a digest of that
+history so edits to older rows are detected and re-sent.
 """
 
 import csv
+import gzip
+import hashlib
 import json
 import logging
+import os
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, Tuple
 
 import click
 
+from loopbloom import constants
+from loopbloom.core.models import Checkin, GoalArea, MicroGoal
+
 logger = logging.getLogger(__name__)
 
+CSV_HEADER = ["date", "goal", "phase", "micro", "success", "note"]
+# Incremental rows keep the regular columns first so existing consumers can
+# ignore the change-tracking fields appended at the end.
+CHANGE_HEADER = CSV_HEADER + ["op", "micro_id", "previous"]
+
+
+def _row(ci: Checkin, goal: str, phase: str, micro: str) -> list[str]:
+    """Flatten a single check-in into a CSV row."""
+    return [
+        str(ci.date),
+        goal,
+        phase,
+        micro,
+        "1" if ci.success else "0",
+        (ci.note or "").replace("\n", " "),
+    ]
+
+
+def _iter_micro(goals: Iterable[GoalArea]) -> Iterator[Tuple[str, str, MicroGoal]]:
+    """Yield ``(goal, phase, micro)`` for every micro-goal in ``goals``."""
+    for g in goals:
+        # Phases and their micro-habits
+        for ph in g.phases:
+            for m in ph.micro_goals:
+                yield g.name, ph.name, m
+        # Micro-habits directly under the goal (no phase)
+        for m in g.micro_goals:
+            yield g.name, "", m
+
+
+def _iter_rows(goals: Iterable[GoalArea]) -> Iterator[list[str]]:
+    """Yield one flat row per check-in across ``goals``."""
+    for goal, phase, m in _iter_micro(goals):
+        for ci in m.checkins:
+            yield _row(ci, goal, phase, m.name)
+
+
+def _hash_checkin(h: Any, ci: Checkin) -> None:
+    """Feed the exported fields of ``ci`` into the running digest ``h``."""
+    h.update(f"{ci.date}|{int(ci.success)}|{ci.note or ''}\n".encode("utf-8"))
+
+
+def _change_row(
+    op: str,
+    micro_id: str,
+    names: Dict[str, str],
+    ci: Checkin | None = None,
+    previous: str = "",
+) -> Dict[str, str]:
+    """Build one incremental row keyed by :data:`CHANGE_HEADER`."""
+    row = dict.fromkeys(CSV_HEADER, "")
+    row.update(names)
+    if ci is not None:
+        flat = _row(ci, names["goal"], names["phase"], names["micro"])
+        row.update(zip(CSV_HEADER, flat, strict=True))
+    row.update(op=op, micro_id=micro_id, previous=previous)
+    return row
+
+
+def _iter_changes(
+    goals: Iterable[GoalArea],
+    marks: Dict[str, Dict[str, Any]],
+    new_marks: Dict[str, Dict[str, Any]],
+    *,
+    deletions: bool,
+) -> Iterator[Dict[str, str]]:
+    """Yield rows that changed since ``marks`` and record ``new_marks``.
+
+    Ops are ``insert`` for new check-ins, ``reset`` when previously exported
+    history was edited (consumers drop the micro-goal's rows and re-read the
+    inserts that follow) and, when ``deletions`` is set, ``rename`` and
+    ``delete`` for micro-goals that moved or disappeared.
+    """
+    for goal, phase, m in _iter_micro(goals):
+        names = {"goal": goal, "phase": phase, "micro": m.name}
+        prev = marks.get(m.id)
+        count = int(prev["count"]) if prev else 0
+        h = hashlib.sha1()
+        for ci in m.checkins[:count]:
+            _hash_checkin(h, ci)
+        # History is append-only in the common case; anything else means the
+        # exported prefix no longer matches what downstream has.
+        intact = prev is None or (
+            count <= len(m.checkins) and h.hexdigest() == prev["digest"]
+        )
+        if deletions and prev is not None:
+            old = {k: prev[k] for k in names}
+            if old != names:
+                yield _change_row("rename", m.id, names, previous=json.dumps(old))
+        if intact:
+            fresh = m.checkins[count:]
+        else:
+            yield _change_row("reset", m.id, names)
+            fresh = m.checkins
+            h = hashlib.sha1()
+        for ci in fresh:
+            _hash_checkin(h, ci)
+            yield _change_row("insert", m.id, names, ci)
+        new_marks[m.id] = {
+            **names,
+            "count": len(m.checkins),
+            "last_date": str(m.checkins[-1].date) if m.checkins else None,
+            "digest": h.hexdigest(),
+        }
+    if deletions:
+        for micro_id, prev in marks.items():
+            if micro_id not in new_marks:
+                names = {k: prev[k] for k in ("goal", "phase", "micro")}
+                yield _change_row("delete", micro_id, names)
+
+
+def _load_marks(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return the stored per-micro watermarks or an empty mapping."""
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as fp:
+        data: Dict[str, Dict[str, Any]] = json.load(fp).get("micros", {})
+    return data
+
+
+def _save_marks(path: Path, marks: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically replace the watermark file with ``marks``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("w", encoding="utf-8") as fp:
+        json.dump({"version": 1, "micros": marks}, fp)
+    os.replace(tmp, path)
 
-@click.command(name="export", help="Export data to CSV or JSON.")
+
+def _write_changes(rows: Iterable[Dict[str, str]], fmt: str, fp: IO[str]) -> int:
+    """Write incremental ``rows`` in ``fmt`` and return how many were written."""
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(fp, fieldnames=CHANGE_HEADER)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    elif fmt == "ndjson":
+        for row in rows:
+            fp.write(json.dumps(row))
+            fp.write("\n")
+            count += 1
+    else:
+        fp.write("[")
+        sep = "\n"
+        for row in rows:
+            fp.write(sep + json.dumps(row))
+            sep = ",\n"
+            count += 1
+        fp.write("\n]\n")
+    return count
+
+
+def _open_output(out_path: str, compress: bool) -> IO[str]:
+    """Open ``out_path`` for text writing, gzip-compressed when requested."""
+    if compress:
+        return gzip.open(out_path, "wt", encoding="utf-8", newline="")
+    return open(out_path, "w", encoding="utf-8", newline="")
+
+
+def _write_json(goals: Iterable[GoalArea], fp: IO[str]) -> None:
+    """Write ``goals`` as a JSON array without building the list first."""
+    fp.write("[")
+    sep = "\n"
+    for g in goals:
+        fp.write(sep)
+        fp.write(json.dumps(g.model_dump(mode="json"), indent=2))
+        sep = ",\n"
+    fp.write("\n]\n")
+
+
+def _write_ndjson(goals: Iterable[GoalArea], fp: IO[str]) -> None:
+    """Write one compact JSON goal object per line."""
+    for g in goals:
+        fp.write(json.dumps(g.model_dump(mode="json")))
+        fp.write("\n")
+
+
+def _write_csv(goals: Iterable[GoalArea], fp: IO[str]) -> None:
+    """Write a flat table with one row per check-in."""
+    writer = csv.writer(fp)
+    # Header first to enable streaming
+    writer.writerow(CSV_HEADER)
+    writer.writerows(_iter_rows(goals))
+
+
+@click.command(name="export", help="Export data to CSV, JSON or NDJSON.")
 @click.option(
     "--fmt",
-    type=click.Choice(["csv", "json"]),
+    type=click.Choice(["csv", "json", "ndjson"]),
     required=True,
-    help="Output format (csv or json).",
+    help="Output format (csv, json or ndjson).",
 )
 @click.option(
     "--out",
@@ -28,61 +229,88 @@ logger = logging.getLogger(__name__)
     required=True,
     help="File to write exported data to.",
 )
+@click.option(
+    "--gzip",
+    "compress",
+    is_flag=True,
+    default=False,
+    help="Gzip the output (implied when OUT ends with .gz).",
+)
+@click.option(
+    "--since-last",
+    is_flag=True,
+    default=False,
+    help="Only export check-ins added or changed since the last such export.",
+)
+@click.option(
+    "--with-deletions",
+    is_flag=True,
+    default=False,
+    help="With --since-last, also emit rename and delete rows.",
+)
+@click.option(
+    "--watermark",
+    "watermark_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Watermark file used by --since-last.",
+)
 @click.pass_context
-def export(ctx: click.Context, fmt: str, out_path: str) -> None:
+def export(
+    ctx: click.Context,
+    fmt: str,
+    out_path: str,
+    compress: bool,
+    since_last: bool,
+    with_deletions: bool,
+    watermark_path: str | None,
+) -> None:
     """Write all goal history to OUT_PATH in format FMT.
 
     Usage: ``loopbloom export --fmt csv --out progress.csv``
     """
     # Use whichever storage backend the user configured so exports always match
     # their real data.
-    logger.info("Exporting data to %s as %s", out_path, fmt)
+    if with_deletions and not since_last:
+        raise click.UsageError("--with-deletions requires --since-last.")
+    compress = compress or out_path.endswith(".gz")
+    logger.info(
+        "Exporting data to %s as %s%s", out_path, fmt, " (gzip)" if compress else ""
+    )
     store = ctx.obj.store
-    goals = store.load()
+    # ``iter_goals`` yields one validated goal at a time so the full graph is
+    # never materialised.
+    goals = store.iter_goals()
 
-    if fmt == "json":
-        with open(out_path, "w", encoding="utf-8") as fp:
-            json.dump([g.model_dump(mode="json") for g in goals], fp, indent=2)
-        logger.info("JSON export complete")
-        click.echo(f"[green]Exported JSON → {out_path}")
+    if since_last:
+        wm_path = Path(watermark_path or constants.EXPORT_WATERMARK_PATH)
+        marks = _load_marks(wm_path)
+        new_marks: Dict[str, Dict[str, Any]] = {}
+        changes = _iter_changes(goals, marks, new_marks, deletions=with_deletions)
+        with _open_output(out_path, compress) as fp:
+            written = _write_changes(changes, fmt, fp)
+        # Only advance the watermark once the output is completely written so
+        # a failed run is simply repeated next time. Dry runs leave it alone
+        # so the next real export still includes these rows.
+        if ctx.obj.dry_run:
+            click.echo("[yellow]DRY RUN: Watermark not updated.[/yellow]")
+        else:
+            _save_marks(wm_path, new_marks)
+        logger.info("Incremental export wrote %d row(s)", written)
+        click.echo(f"[green]Exported {written} change(s) as {fmt.upper()} → {out_path}")
         return
 
-    # CSV output is a flat table – one row per check-in – to make importing the
-    # data into spreadsheets straightforward. The first row acts as the header.
-    with open(out_path, "w", newline="", encoding="utf-8") as fp:
-        writer = csv.writer(fp)
-        # Header first to enable streaming
-        writer.writerow(["date", "goal", "phase", "micro", "success", "note"])
-        for g in goals:
-            # Phases and their micro-habits
-            for ph in g.phases:
-                for m in ph.micro_goals:
-                    for ci in m.checkins:
-                        writer.writerow(
-                            [
-                                str(ci.date),
-                                g.name,
-                                ph.name,
-                                m.name,
-                                "1" if ci.success else "0",
-                                (ci.note or "").replace("\n", " "),
-                            ]
-                        )
-            # Micro-habits directly under the goal (no phase)
-            for m in g.micro_goals:
-                for ci in m.checkins:
-                    writer.writerow(
-                        [
-                            str(ci.date),
-                            g.name,
-                            "",
-                            m.name,
-                            "1" if ci.success else "0",
-                            (ci.note or "").replace("\n", " "),
-                        ]
-                    )
-    logger.info("CSV export complete")
-    click.echo(f"[green]Exported CSV → {out_path}")
+    with _open_output(out_path, compress) as fp:
+        if fmt == "json":
+            _write_json(goals, fp)
+        elif fmt == "ndjson":
+            _write_ndjson(goals, fp)
+        else:
+            # CSV output is a flat table – one row per check-in – to make
+            # importing the data into spreadsheets straightforward.
+            _write_csv(goals, fp)
+    logger.info("%s export complete", fmt.upper())
+    click.echo(f"[green]Exported {fmt.upper()} → {out_path}")
 
 
 export_cmd = export
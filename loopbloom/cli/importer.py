@@ -0,0 +1,104 @@
+"""Bulk-import check-in history from files.
+
+Accepts LoopBloom exports and common habit-tracker CSVs. All rows are
+merged into the loaded goal graph and written with a single save, so an
+import either lands completely or not at all.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+from pathlib import Path
+from typing import List
+
+import click
+
+from loopbloom.cli import ui, with_goals
+from loopbloom.core.models import GoalArea
+from loopbloom.services.importer import (
+    BulkImporter,
+    ImportFormatError,
+    detect_format,
+    iter_items,
+)
+from loopbloom.storage.base import StorageError
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of validation errors echoed before summarising the rest.
+MAX_ERRORS_SHOWN = 10
+
+
+@click.command(name="import", help="Bulk-import check-ins from CSV/JSON/NDJSON.")
+@click.argument("src", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--fmt",
+    type=click.Choice(["auto", "csv", "json", "ndjson"]),
+    default="auto",
+    show_default=True,
+    help="Input format; auto-detected from the file extension by default.",
+)
+@click.option(
+    "--goal",
+    "default_goal",
+    default="Imported",
+    show_default=True,
+    help="Goal used for rows that don't name one.",
+)
+@click.option(
+    "--skip-invalid",
+    is_flag=True,
+    default=False,
+    help="Skip malformed rows instead of aborting the import.",
+)
+@with_goals
+def import_data(
+    src: str,
+    fmt: str,
+    default_goal: str,
+    skip_invalid: bool,
+    goals: List[GoalArea],
+) -> None:
+    """Load check-ins from SRC into the current data store."""
+    path = Path(src)
+    ctx = click.get_current_context()
+    try:
+        if fmt == "auto":
+            fmt = detect_format(path)
+        importer = BulkImporter(goals, skip_invalid=skip_invalid)
+        report = importer.run(iter_items(path, fmt, default_goal))
+    except (ImportFormatError, StorageError, csv.Error, ValueError) as exc:
+        logger.error("Import of %s failed: %s", path, exc)
+        ui.error(f"Import failed: {exc}")
+        ctx.exit(1)
+        return
+
+    if report.errors:
+        for err in report.errors[:MAX_ERRORS_SHOWN]:
+            ui.warn(f"Invalid row {err}")
+        hidden = len(report.errors) - MAX_ERRORS_SHOWN
+        if hidden > 0:
+            ui.warn(f"... and {hidden} more invalid row(s).")
+        if not skip_invalid:
+            logger.error("Import aborted with %d invalid row(s)", len(report.errors))
+            ui.error("Nothing imported. Fix the rows above or use --skip-invalid.")
+            # Exiting before ``with_goals`` saves discards every merged row.
+            ctx.exit(1)
+            return
+
+    logger.info(
+        "Imported %d check-in(s) from %s (%d duplicate(s))",
+        report.added,
+        path,
+        report.duplicates,
+    )
+    ui.success(
+        f"Imported {report.added} check-in(s) "
+        f"({report.duplicates} duplicate(s) skipped, "
+        f"{report.goals_created} new goal(s), "
+        f"{report.micros_created} new micro-habit(s))."
+    )
+
+
+import_cmd = import_data
@@ -1,8 +1,9 @@
-"""Add free-form journal entries."""
+"""Add and list free-form journal entries."""
 
 from __future__ import annotations
 
 import logging
+from typing import List
 
 import click
 
@@ -12,7 +13,22 @@ from loopbloom.core import journal as jr
 logger = logging.getLogger(__name__)
 
 
-@click.command(name="journal", help="Record a journal entry.")
+class _DefaultToAdd(click.Group):
+    """Group that treats ``journal TEXT`` as ``journal add TEXT``."""
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        if args and args[0] not in self.commands and args[0] not in ("-h", "--help"):
+            args = ["add", *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(name="journal", cls=_DefaultToAdd, help="Record or list journal entries.")
+def journal() -> None:
+    """Journal commands; plain ``journal TEXT`` adds an entry."""
+    pass
+
+
+@journal.command(name="add", help="Record a journal entry.")
 @click.argument("text")
 @click.option(
     "--goal",
@@ -20,7 +36,7 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Tag entry with a goal.",
 )
-def journal(text: str, goal_name: str | None) -> None:
+def journal_add(text: str, goal_name: str | None) -> None:
     """Save ``text`` as a journal entry optionally linked to ``goal_name``."""
     logger.info(
         "Adding journal entry%s",
@@ -30,4 +46,28 @@ def journal(text: str, goal_name: str | None) -> None:
     ui.success("Entry saved.")
 
 
+@journal.command(name="list", help="Show the most recent journal entries.")
+@click.option(
+    "--last",
+    "last",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of entries to show.",
+)
+@click.option("--goal", "goal_name", default=None, help="Only entries for this goal.")
+def journal_list(last: int, goal_name: str | None) -> None:
+    """Print the newest ``last`` entries, oldest of them first."""
+    # Entries are read backwards from the end of the journal, so only the
+    # requested ones are ever parsed.
+    entries = jr.recent(last, goal_name)
+    logger.info("Listing %d journal entries", len(entries))
+    if not entries:
+        ui.info("No journal entries yet.")
+        return
+    for entry in entries:
+        tag = f" [{entry.goal}]" if entry.goal else ""
+        click.echo(f"{entry.timestamp:%Y-%m-%d %H:%M}{tag}  {entry.text}")
+
+
 journal_cmd = journal
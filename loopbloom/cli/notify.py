@@ -0,0 +1,68 @@
+"""`loopbloom notify` commands for the notification outbox.
+
+When ``notify_outbox`` is enabled, notifications are queued on disk rather
+than delivered immediately. ``notify flush`` sends everything queued as one
+digest per channel and is safe to schedule from cron, e.g.::
+
+    */30 * * * * loopbloom notify flush
+"""
+
+from __future__ import annotations
+
+import logging
+
+import click
+
+from loopbloom.cli import ui
+from loopbloom.services import outbox
+
+logger = logging.getLogger(__name__)
+
+
+@click.group(name="notify", help="Inspect or deliver queued notifications.")
+def notify() -> None:
+    """Manage the notification outbox."""
+    pass
+
+
+@notify.command(name="status", help="Show how many notifications are queued.")
+def _status() -> None:
+    """Print the number of queued events per channel."""
+    events = outbox.pending()
+    if not events:
+        ui.info("Outbox empty.")
+        return
+    counts: dict[str, int] = {}
+    for event in events:
+        for channel in event.get("channels", []):
+            counts[channel] = counts.get(channel, 0) + 1
+    click.echo(f"{len(events)} queued notification(s):")
+    for channel, n in sorted(counts.items()):
+        click.echo(f"  {channel}: {n}")
+
+
+@notify.command(name="flush", help="Deliver queued notifications as digests.")
+@click.pass_context
+def _flush(ctx: click.Context) -> None:
+    """Coalesce the outbox per channel and deliver each digest once."""
+    if ctx.obj.dry_run:
+        n = len(outbox.pending())
+        ui.info(f"DRY RUN: {n} queued notification(s) left undelivered.")
+        return
+    report = outbox.flush()
+    if report.skipped:
+        ui.warn("Another flush is already running; nothing delivered.")
+        return
+    if not report.events:
+        ui.info("Outbox empty.")
+        return
+    logger.info("Flushed %d queued notification(s)", report.events)
+    ui.success(
+        f"Delivered {report.events} notification(s) in {report.digests} digest(s)."
+    )
+    if report.failed:
+        ui.warn(f"{report.failed} notification(s) re-queued after delivery errors.")
+        ctx.exit(1)
+
+
+notify_cmd = notify
@@ -1,24 +1,35 @@
 """Advanced reports for LoopBloom.
 
 Depending on the selected ``--mode`` this command can render a calendar
-heatmap, bar chart or simple line graph to visualise progress.
+heatmap, bar chart or simple line graph to visualise progress. The calendar
+covers any number of recent months or, with ``--year``, a whole year laid
+out GitHub-style with one column per week.
 """
 
 from __future__ import annotations
 
-from calendar import Calendar, month_name
-from datetime import timedelta
-from typing import Iterable, Iterator, List
+from calendar import Calendar, day_abbr, month_abbr, month_name, monthrange
+from datetime import date, timedelta
+from typing import Any, Iterable, Iterator, List
 
 import click
 from rich.console import Group, RenderableType
 from rich.progress_bar import ProgressBar
 from rich.table import Table
 
-from loopbloom.cli import ui, with_goals
+from loopbloom.cli import ui
+from loopbloom.cli.utils import find_goal, goal_not_found
 from loopbloom.constants import DEFAULT_TIMEFRAME
 from loopbloom.core.models import GoalArea, MicroGoal
+from loopbloom.core.stats import (
+    DayCounts,
+    day_counts,
+    goal_totals,
+    iter_micro_goals,
+    month_start,
+)
 from loopbloom.services.datetime import get_current_datetime
+from loopbloom.services.view_cache import Views
 
 console = ui.console
 
@@ -33,90 +44,185 @@ console = ui.console
     default="calendar",
     help="Report type to display.",
 )
-@with_goals
-def report(mode: str, goals: List[GoalArea]) -> None:
+@click.option(
+    "--months",
+    type=click.IntRange(1, 120),
+    default=None,
+    help="Number of months (ending this month) shown by the calendar [default: 1].",
+)
+@click.option(
+    "--year",
+    type=click.IntRange(1, 9999),
+    default=None,
+    help="Render a year-long heatmap for YEAR instead of monthly grids.",
+)
+@click.option(
+    "--goal",
+    "goal_name",
+    default=None,
+    help="Only include check-ins from this goal.",
+)
+@click.pass_context
+def report(
+    ctx: click.Context,
+    mode: str,
+    months: int | None,
+    year: int | None,
+    goal_name: str | None,
+) -> None:
     """Display advanced reports based on ``mode``."""
+    # Calendar-only flags are rejected elsewhere rather than silently ignored.
+    if mode != "calendar" and (months is not None or year is not None):
+        raise click.UsageError("--months and --year only apply to --mode calendar.")
+    if months is not None and year is not None:
+        raise click.UsageError("Use either --months or --year, not both.")
+    # Read-only: the history is only parsed when a view is not cached. The
+    # data is fingerprinted before it is read so a racing save can only
+    # cause a miss.
+    store = ctx.obj.store
+    views = Views.for_store(store, get_current_datetime().date())
+    goals: Iterable[GoalArea] = store.iter_goals()
+    if goal_name:
+        everything = list(goals)
+        goal = find_goal(everything, goal_name)
+        if goal is None:
+            goal_not_found(goal_name, [g.name for g in everything])
+            return
+        goals = [goal]
+        views.scope["goal"] = goal.id
     if mode == "success":
-        _success_bars(goals)
+        _success_bars(goals, views=views)
     elif mode == "line":
-        _line_chart(goals)
+        _line_chart(goals, views=views)
+    elif year is not None:
+        _year_heatmap(goals, year, views=views)
     else:
-        _calendar_heatmap(goals)
+        _calendar_heatmap(goals, months=months or 1, views=views)
 
 
 def _gather_all_micro(goals: Iterable[GoalArea]) -> Iterator[MicroGoal]:
     """Yield all micro-goals from ``goals``."""
     # Flatten the nested goal/phase structure so reporting code can
     # iterate over every micro-habit uniformly.
-    for g in goals:
-        for ph in g.phases:
-            for m in ph.micro_goals:
-                yield m
-        for m in g.micro_goals:
-            yield m
+    return iter_micro_goals(goals)
+
+
+def _day_counts(
+    goals: Iterable[GoalArea], start: date, end: date, views: Views | None
+) -> DayCounts:
+    """Return per-day counts for ``start``..``end``, cached in ``views``."""
 
+    def compute() -> List[List[int]]:
+        counts = day_counts(_gather_all_micro(goals), start, end)
+        return [counts.successes, counts.totals]
 
-def _calendar_heatmap(goals: List[GoalArea]) -> None:
-    """Print an ASCII calendar heatmap of the current month."""
+    if views is None:
+        successes, totals = compute()
+    else:
+        successes, totals = views.get(
+            "days", compute, start=start.isoformat(), end=end.isoformat()
+        )
+    return DayCounts(start=start, end=end, successes=successes, totals=totals)
+
+
+def _cell(succ: int, tot: int) -> str:
+    """Return the heatmap glyph for a day's success and check-in counts."""
+    if not tot:
+        return "·"  # dot
+    # Dark shade when anything succeeded, light shade for skips only.
+    return "▓" if succ else "░"
+
+
+def _calendar_heatmap(
+    goals: Iterable[GoalArea], *, months: int = 1, views: Views | None = None
+) -> None:
+    """Print ASCII calendar heatmaps for the last ``months`` months."""
     today = get_current_datetime().date()
-    cal = Calendar()
+    first = month_start(today, months - 1)
+    last_day = monthrange(today.year, today.month)[1]
     # Track both successes and total check-ins per day so the heatmap can
-    # shade each cell based on performance rather than mere activity.
-    stats: dict[int, tuple[int, int]] = {}
-    for m in _gather_all_micro(goals):
-        for ci in m.checkins:
-            if ci.date.year == today.year and ci.date.month == today.month:
-                succ, tot = stats.get(ci.date.day, (0, 0))
-                if ci.success:
-                    succ += 1
-                tot += 1
-                stats[ci.date.day] = (succ, tot)
-
-    weeks = cal.monthdayscalendar(today.year, today.month)
-    title = "LoopBloom Check-in Heatmap – " f"{month_name[today.month]} {today.year}"
-    console.print(f"[bold]{title}[/bold]")
-    for week in weeks:
-        line = ""
-        for day in week:
-            if day == 0:
-                line += "   "
-                continue
-            succ, tot = stats.get(day, (0, 0))
-            char = "·"  # dot
-            if tot:
-                char = "░"  # light shade for skips
-                if succ:
-                    char = "▓"  # dark shade
-            line += f"{char} "
-        console.print(line.rstrip())
-
-
-def _success_bars(goals: List[GoalArea]) -> None:
+    # shade each cell based on performance rather than mere activity. One
+    # pass over the history covers every month being rendered.
+    counts = _day_counts(goals, first, today.replace(day=last_day), views)
+    cal = Calendar()
+    for offset in range(months - 1, -1, -1):
+        start = month_start(today, offset)
+        weeks = cal.monthdatescalendar(start.year, start.month)
+        title = (
+            "LoopBloom Check-in Heatmap – " f"{month_name[start.month]} {start.year}"
+        )
+        console.print(f"[bold]{title}[/bold]")
+        for week in weeks:
+            line = ""
+            for day in week:
+                if day.month != start.month:
+                    line += "   "
+                    continue
+                line += f"{_cell(*counts.at(day))} "
+            console.print(line.rstrip())
+
+
+def _year_heatmap(
+    goals: Iterable[GoalArea], year: int, *, views: Views | None = None
+) -> None:
+    """Print a GitHub-style heatmap with one column per week of ``year``."""
+    jan1 = date(year, 1, 1)
+    dec31 = date(year, 12, 31)
+    # Columns start on the Monday on or before January 1st so every row
+    # lines up with a weekday.
+    grid_start = jan1 - timedelta(days=jan1.weekday())
+    counts = _day_counts(goals, jan1, dec31, views)
+    weeks = (dec31.toordinal() - grid_start.toordinal()) // 7 + 1
+
+    console.print(f"[bold]LoopBloom Check-in Heatmap – {year}[/bold]")
+    # Month labels are placed above the week in which the month begins.
+    labels = [" "] * weeks
+    for month in range(1, 13):
+        col = (date(year, month, 1).toordinal() - grid_start.toordinal()) // 7
+        abbr = month_abbr[month]
+        if all(c == " " for c in labels[col : col + len(abbr)]):
+            labels[col : col + len(abbr)] = list(abbr)
+    console.print(("    " + "".join(labels[:weeks])).rstrip())
+    for weekday in range(7):
+        row = day_abbr[weekday][:3] if weekday % 2 == 0 else "   "
+        cells = []
+        for week in range(weeks):
+            day = grid_start + timedelta(days=week * 7 + weekday)
+            cells.append(_cell(*counts.at(day)) if day.year == year else " ")
+        console.print(f"{row} {''.join(cells)}".rstrip())
+
+    total = sum(counts.totals)
+    successes = sum(counts.successes)
+    active_days = sum(1 for t in counts.totals if t)
+    console.print(
+        f"{successes}/{total} successful check-ins across {active_days} day(s)"
+    )
+
+
+def _success_bars(goals: Iterable[GoalArea], *, views: Views | None = None) -> None:
     """Show a bar chart of success rates per goal."""
+
+    def compute() -> List[List[Any]]:
+        # Check-ins from every micro-habit are combined so the bar reflects
+        # the goal's overall success rate.
+        return [[g.name, s, t] for g, s, t in goal_totals(goals)]
+
+    rows = compute() if views is None else views.get("success", compute)
     table = Table(title="Success Rates per Goal")
     table.add_column("Goal")
     table.add_column("Rate")
-    for g in goals:
-        successes = 0
-        total = 0
-        # Combine check-ins from every micro-habit so the bar reflects the
-        # goal's overall success rate.
-        for m in _gather_all_micro([g]):
-            for ci in m.checkins:
-                total += 1
-                if ci.success:
-                    successes += 1
+    for name, successes, total in rows:
         ratio: RenderableType
         if total:
             bar = ProgressBar(total=total, completed=successes, width=20)
             ratio = Group(bar, f" {successes}/{total}")
         else:
             ratio = "–"
-        table.add_row(g.name, ratio)
+        table.add_row(name, ratio)
     console.print(table)
 
 
-def _line_chart(goals: List[GoalArea]) -> None:
+def _line_chart(goals: Iterable[GoalArea], *, views: Views | None = None) -> None:
     """Show a line chart of daily success rates."""
     # ``plotext`` is a lightweight plotting library used only for this view.
     # It's an optional dependency so ``report --mode line`` can be skipped if
@@ -126,17 +232,9 @@ def _line_chart(goals: List[GoalArea]) -> None:
     today = get_current_datetime().date()
     start = today - timedelta(days=DEFAULT_TIMEFRAME - 1)
 
+    counts = _day_counts(goals, start, today, views)
     rates: list[float] = []
-    for i in range(DEFAULT_TIMEFRAME):
-        day = start + timedelta(days=i)
-        successes = 0
-        total = 0
-        for m in _gather_all_micro(goals):
-            for ci in m.checkins:
-                if ci.date == day:
-                    total += 1
-                    if ci.success:
-                        successes += 1
+    for successes, total in zip(counts.successes, counts.totals, strict=True):
         rate = (successes / total) * 100 if total else 0
         rates.append(rate)
 
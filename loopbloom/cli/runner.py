@@ -0,0 +1,107 @@
+"""Run CLI commands in-process against a shared store.
+
+The daemon, the interactive shell and batch scripts execute ordinary
+``loopbloom`` command lines without starting a new process. They pass a
+:class:`~loopbloom.storage.session.SessionStore` to the top-level group,
+which then uses it instead of opening the configured backend, so every
+command sees the same loaded goal graph.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from typing import Sequence
+
+import click
+
+from loopbloom.storage.base import Storage
+
+# Commands that manage their own session and cannot run through
+# :func:`invoke` from another one.
+SESSION_COMMANDS = frozenset({"batch", "daemon", "serve", "shell"})
+
+# Global options choosing the store; a shared store ignores them.
+STORE_OPTIONS = frozenset({"--data-path"})
+
+
+@dataclass
+class Result:
+    """Outcome of one in-process command."""
+
+    exit_code: int
+    # Combined stdout and stderr when the output was captured.
+    output: str = ""
+    # ``True`` when the command asked for input that was not available.
+    aborted: bool = False
+
+
+def rejection(argv: Sequence[str], where: str) -> str | None:
+    """Return why ``argv`` cannot run ``where`` on a shared store, if it can't.
+
+    Args:
+        argv: Command line without the program name.
+        where: Phrase naming the session in the message, e.g. "in a batch".
+    """
+    for arg in argv:
+        if not arg.startswith("-"):
+            if arg in SESSION_COMMANDS:
+                return f"'{arg}' cannot run {where}"
+            return None
+        option = arg.split("=", 1)[0]
+        if option in STORE_OPTIONS:
+            return f"'{option}' cannot be used {where}; the store is already open"
+    return None
+
+
+def invoke(
+    argv: Sequence[str],
+    store: Storage,
+    *,
+    capture: bool = False,
+    interactive: bool = True,
+) -> Result:
+    """Run ``loopbloom <argv>`` using ``store`` and return its outcome.
+
+    Args:
+        argv: Command line without the program name.
+        store: Store handed to every command in place of the configured one.
+        capture: Collect output instead of writing to the terminal. Implies
+            ``interactive=False``.
+        interactive: When ``False`` standard input is empty, so prompts
+            abort instead of blocking or consuming the caller's input.
+    """
+    # Imported lazily: ``__main__`` imports every CLI module, this one too.
+    from loopbloom.__main__ import cli
+
+    buf = io.StringIO()
+    aborted = False
+    with ExitStack() as stack:
+        if capture:
+            stack.enter_context(redirect_stdout(buf))
+            stack.enter_context(redirect_stderr(buf))
+        if capture or not interactive:
+            stdin = sys.stdin
+            sys.stdin = io.StringIO("")
+            stack.callback(setattr, sys, "stdin", stdin)
+        try:
+            rv = cli.main(
+                args=list(argv),
+                prog_name="loopbloom",
+                obj=store,
+                standalone_mode=False,
+            )
+            # ``ctx.exit(n)`` surfaces as the return value outside
+            # standalone mode.
+            code = rv if isinstance(rv, int) else 0
+        except click.Abort:
+            aborted = True
+            code = 1
+        except click.ClickException as exc:
+            exc.show()
+            code = exc.exit_code
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else 1
+    return Result(code, buf.getvalue(), aborted)
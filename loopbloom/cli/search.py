@@ -0,0 +1,77 @@
+"""Search journal entries, reviews and check-in notes."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+import click
+
+from loopbloom.cli import ui
+from loopbloom.services import search as srch
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(name="search", help="Full-text search of journal, reviews and notes.")
+@click.argument("query", nargs=-1, required=True)
+@click.option("--goal", "goal_name", default=None, help="Only results for this goal.")
+@click.option(
+    "--since",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Only results on or after this day.",
+)
+@click.option(
+    "--until",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Only results on or before this day.",
+)
+@click.option(
+    "--kind",
+    "kinds",
+    type=click.Choice(list(srch.KINDS)),
+    multiple=True,
+    help="Restrict to journal, review or checkin (repeatable).",
+)
+@click.option("--limit", type=click.IntRange(min=1), default=20, show_default=True)
+@click.pass_context
+def search(
+    ctx: click.Context,
+    query: tuple[str, ...],
+    goal_name: str | None,
+    since: datetime | None,
+    until: datetime | None,
+    kinds: tuple[str, ...],
+    limit: int,
+) -> None:
+    """Print the newest entries matching every word of QUERY.
+
+    A trailing ``*`` on a word matches any word starting with it.
+    """
+    terms = srch.parse_query(" ".join(query))
+    if not terms:
+        ui.warn("Nothing to search for.")
+        return
+    with srch.open_index() as index:
+        # Bring the index up to date; only new or edited text is read.
+        index.sync(ctx.obj.store)
+        hits = index.search(
+            terms,
+            goal=goal_name,
+            since=since.date() if since else None,
+            until=until.date() if until else None,
+            kinds=kinds or srch.KINDS,
+            limit=limit,
+        )
+    logger.info("Search %r returned %d hit(s)", " ".join(query), len(hits))
+    if not hits:
+        ui.info("No matches.")
+        return
+    for hit in hits:
+        tag = f" [{hit.goal}]" if hit.goal else ""
+        click.echo(f"{hit.day}  {hit.kind:<7}{tag}  {srch.snippet(hit.text, terms)}")
+
+
+search_cmd = search
@@ -0,0 +1,203 @@
+"""`loopbloom serve` – local HTTP JSON API for dashboards and tools.
+
+Routes (all JSON)::
+
+    GET  /goals                 every goal area
+    GET  /goals/<name>          one goal area
+    GET  /summary[?window=N]    rows of ``loopbloom summary``
+    GET  /report[?mode=calendar|success|line&months=N&year=Y&goal=G]
+    GET  /changes?since=N       goals touched after store generation N
+    POST /checkins              {"goal": ..., "success": true, "note": ...,
+                                 "date": "YYYY-MM-DD"}
+
+GET responses carry an ``ETag`` built from the data revision, the config
+file and today's date. Bodies are cached per URL under that tag, so a
+repeated request is answered without recomputing, and a client sending
+``If-None-Match`` with the current tag gets an empty ``304``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import secrets
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import click
+
+from loopbloom.api import Client, ClientError, NotFoundError
+from loopbloom.cli import ui
+from loopbloom.core import config as cfg
+from loopbloom.services.datetime import get_current_datetime, use_clock
+from loopbloom.storage.base import ConflictError
+from loopbloom.storage.session import file_signature
+
+logger = logging.getLogger(__name__)
+
+# Largest accepted request body in bytes.
+MAX_BODY = 64 * 1024
+# Cached response bodies kept before the cache is emptied.
+CACHE_ENTRIES = 256
+
+
+class ApiServer(HTTPServer):
+    """Single-threaded server sharing one :class:`Client` between requests."""
+
+    def __init__(self, address: Tuple[str, int], client: Client) -> None:
+        self.client = client
+        # Tags from an earlier server run must never match this one's.
+        self.boot = secrets.token_hex(4)
+        self.cache: Dict[str, Tuple[str, bytes]] = {}
+        super().__init__(address, _Handler)
+
+    def etag(self) -> str:
+        """Return the tag for every view of the data as it is right now."""
+        config = file_signature([cfg.CONFIG_PATH])[0][1:]
+        today = get_current_datetime().date().isoformat()
+        tag = f"{self.boot}-{self.client.revision}-{today}-{hash(config):x}"
+        return f'"{tag}"'
+
+
+def _int(query: Dict[str, str], key: str) -> int | None:
+    """Return ``query[key]`` as an int, or ``None`` when absent."""
+    if key not in query:
+        return None
+    try:
+        return int(query[key])
+    except ValueError:
+        raise ClientError(f"'{key}' must be an integer") from None
+
+
+def _route(client: Client, path: str, query: Dict[str, str]) -> Any:
+    """Return the data for a GET of ``path``."""
+    parts = [unquote(p) for p in path.strip("/").split("/") if p]
+    if parts == ["goals"]:
+        return client.goals()
+    if len(parts) == 2 and parts[0] == "goals":
+        return client.goal(parts[1])
+    if parts == ["summary"]:
+        return client.summary(window=_int(query, "window"))
+    if parts == ["report"]:
+        return client.report_data(
+            query.get("mode", "calendar"),
+            months=_int(query, "months") or 1,
+            year=_int(query, "year"),
+            goal=query.get("goal"),
+        )
+    if parts == ["changes"]:
+        return client.changes_since(_int(query, "since") or 0)
+    raise NotFoundError(f"No such resource: {path}")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Translate HTTP requests into :class:`Client` calls."""
+
+    server: ApiServer
+    server_version = "LoopBloom"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.info("%s " + format, self.address_string(), *args)
+
+    def _send(self, status: int, body: Any = None, etag: str | None = None) -> None:
+        data = b"" if body is None else body
+        if not isinstance(data, bytes):
+            data = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _guard(self, action: Callable[[], None]) -> None:
+        """Run ``action`` mapping client errors to HTTP statuses."""
+        try:
+            # Each request sees one "now", however long the server runs.
+            with use_clock():
+                action()
+        except NotFoundError as exc:
+            self._send(HTTPStatus.NOT_FOUND, {"error": str(exc)})
+        except ClientError as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        except ConflictError as exc:
+            # Another process changed the same goal; the client may retry.
+            self._send(HTTPStatus.CONFLICT, {"error": str(exc)})
+        except Exception:
+            logger.exception("Request failed: %s %s", self.command, self.path)
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"})
+
+    def do_GET(self) -> None:
+        self._guard(self._get)
+
+    def _get(self) -> None:
+        url = urlsplit(self.path)
+        etag = self.server.etag()
+        if self.headers.get("If-None-Match") == etag:
+            self._send(HTTPStatus.NOT_MODIFIED, etag=etag)
+            return
+        cached = self.server.cache.get(self.path)
+        if cached is None or cached[0] != etag:
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            body = json.dumps(_route(self.server.client, url.path, query))
+            cached = (etag, body.encode("utf-8"))
+            if len(self.server.cache) >= CACHE_ENTRIES:
+                self.server.cache.clear()
+            self.server.cache[self.path] = cached
+        self._send(HTTPStatus.OK, cached[1], etag=etag)
+
+    def do_POST(self) -> None:
+        self._guard(self._post)
+
+    def _post(self) -> None:
+        if urlsplit(self.path).path.rstrip("/") != "/checkins":
+            raise NotFoundError(f"No such resource: {self.path}")
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            raise ClientError("Request body too large")
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            goal = payload["goal"]
+            day = payload.get("date")
+            result = self.server.client.checkin(
+                str(goal),
+                success=bool(payload.get("success", True)),
+                note=payload.get("note"),
+                day=date.fromisoformat(day) if day else None,
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            if isinstance(exc, ClientError):
+                raise
+            raise ClientError(f"Invalid check-in: {exc}") from None
+        # Views computed before the check-in are stale now.
+        self.server.cache.clear()
+        self._send(HTTPStatus.CREATED, result)
+
+
+@click.command(name="serve", help="Serve a local HTTP JSON API.")
+@click.option("--host", default="127.0.0.1", show_default=True, help="Bind address.")
+@click.option("--port", default=8765, show_default=True, help="TCP port.")
+@click.pass_context
+def serve(ctx: click.Context, host: str, port: int) -> None:
+    """Serve goals, summaries and reports until interrupted."""
+    app = ctx.obj
+    client = Client(store=app.store, write_through=not app.dry_run)
+    server = ApiServer((host, port), client)
+    ui.info(f"Serving LoopBloom on http://{host}:{server.server_port}/")
+    if app.dry_run:
+        ui.warn("DRY RUN: check-ins are kept in memory only.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+serve_cmd = serve
@@ -0,0 +1,189 @@
+"""`loopbloom shell` – run many commands against one loaded store.
+
+Each line typed at the prompt is an ordinary ``loopbloom`` command line
+(without the program name). The goal graph is loaded once and changes are
+held in memory until ``save`` or until the shell exits, so a command costs
+only the work it does. Goal, phase and micro-habit names tab-complete
+from the loaded graph.
+"""
+
+from __future__ import annotations
+
+import cmd
+import logging
+import shlex
+from typing import Iterable, List
+
+import click
+
+from loopbloom.cli import ui
+from loopbloom.cli.runner import invoke, rejection
+from loopbloom.storage.session import SessionStore
+
+logger = logging.getLogger(__name__)
+
+INTRO = (
+    "LoopBloom shell. Type a command without 'loopbloom', "
+    "'save' to write changes, 'exit' to save and quit."
+)
+
+
+def _quote(name: str) -> str:
+    """Return ``name`` quoted if it needs quoting on the command line."""
+    return shlex.quote(name) if any(c.isspace() for c in name) else name
+
+
+class Shell(cmd.Cmd):
+    """Line-oriented front end dispatching to the Click commands."""
+
+    prompt = "loopbloom> "
+    intro = INTRO
+
+    def __init__(self, store: SessionStore, *, dry_run: bool = False) -> None:
+        """Run commands against ``store``; never flush when ``dry_run``."""
+        super().__init__()
+        self.store = store
+        self.dry_run = dry_run
+
+    # -- dispatch ------------------------------------------------------------
+
+    def default(self, line: str) -> None:
+        """Run ``line`` as a ``loopbloom`` command."""
+        try:
+            argv = shlex.split(line)
+        except ValueError as exc:
+            ui.error(str(exc))
+            return
+        reason = rejection(argv, "inside the shell")
+        if reason is not None:
+            ui.error(f"{reason}.")
+            return
+        self.store.begin_command()
+        try:
+            result = invoke(argv, self.store)
+        except Exception as exc:
+            logger.exception("Shell command failed: %s", line)
+            ui.error(str(exc))
+        else:
+            if result.aborted:
+                click.echo("Aborted!")
+        finally:
+            self.store.end_command()
+
+    def emptyline(self) -> bool:
+        """Do nothing instead of repeating the previous command."""
+        return False
+
+    def do_help(self, arg: str) -> bool | None:
+        """Show help for the shell or a command."""
+        invoke([*shlex.split(arg), "--help"], self.store)
+        if not arg:
+            click.echo("\nShell commands: save, exit (or quit, Ctrl-D).")
+        return False
+
+    def do_save(self, arg: str) -> bool:
+        """Write held changes to the data file."""
+        if self.dry_run:
+            ui.warn("DRY RUN: Changes not saved.")
+        elif self.store.flush():
+            ui.success("Saved.")
+        else:
+            ui.info("No changes to save.")
+        return False
+
+    def do_exit(self, arg: str) -> bool:
+        """Save held changes and leave the shell."""
+        if self.store.dirty:
+            self.do_save("")
+        return True
+
+    do_quit = do_exit
+
+    def do_EOF(self, arg: str) -> bool:
+        """Leave on Ctrl-D."""
+        click.echo()
+        return self.do_exit(arg)
+
+    def cmdloop(self, intro: str | None = None) -> None:
+        """Loop until ``exit``; Ctrl-C only cancels the current line."""
+        while True:
+            try:
+                super().cmdloop(intro)
+                return
+            except KeyboardInterrupt:
+                click.echo("^C")
+                intro = ""
+
+    # -- completion ----------------------------------------------------------
+
+    def _names(self) -> List[str]:
+        """Return goal, phase and micro-habit names from the loaded graph."""
+        names = set()
+        for goal in self.store.iter_goals():
+            names.add(goal.name)
+            names.update(m.name for m in goal.micro_goals)
+            for phase in goal.phases:
+                names.add(phase.name)
+                names.update(m.name for m in phase.micro_goals)
+        return sorted(names, key=str.lower)
+
+    def _command_at(self, words: Iterable[str]) -> click.Command:
+        """Return the (sub)command the last complete word selects."""
+        from loopbloom.__main__ import cli
+
+        command: click.Command = cli
+        for word in words:
+            if not isinstance(command, click.Group):
+                break
+            sub = command.commands.get(word)
+            if sub is None:
+                if word.startswith("-"):
+                    continue
+                break
+            command = sub
+        return command
+
+    def completenames(self, text: str, *ignored: object) -> List[str]:
+        """Complete the first word from the CLI and shell commands."""
+        from loopbloom.__main__ import cli
+
+        names = {*cli.commands, "save", "exit", "quit", "help"}
+        return sorted(n for n in names if n.startswith(text))
+
+    def completedefault(
+        self, text: str, line: str, begidx: int, endidx: int
+    ) -> List[str]:
+        """Complete subcommands, options and names from the graph."""
+        try:
+            words = shlex.split(line[:begidx])
+        except ValueError:
+            # The cursor is inside an open quote spanning several words.
+            return []
+        command = self._command_at(words)
+        if text.startswith("-"):
+            opts = [o for p in command.params for o in getattr(p, "opts", [])]
+            return sorted(o for o in opts if o.startswith(text))
+        if isinstance(command, click.Group):
+            return sorted(n for n in command.commands if n.startswith(text))
+        prefix = text.lstrip("\"'").lower()
+        return [_quote(n) for n in self._names() if n.lower().startswith(prefix)]
+
+
+@click.command(name="shell", help="Interactive shell keeping data loaded.")
+@click.pass_context
+def shell(ctx: click.Context) -> None:
+    """Start the REPL on the current store."""
+    app = ctx.obj
+    store = SessionStore(app.store, write_through=False)
+    repl = Shell(store, dry_run=app.dry_run)
+    try:
+        import readline
+    except ImportError:  # pragma: no cover - e.g. Windows without pyreadline
+        pass
+    else:
+        # Names may contain punctuation; only whitespace separates words.
+        readline.set_completer_delims(" \t\n")
+    repl.cmdloop()
+
+
+shell_cmd = shell
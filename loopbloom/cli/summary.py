@@ -8,21 +8,23 @@ checks whether it should be advanced.
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
-from typing import List
+from datetime import date, timedelta
+from typing import Any, Iterable, List
 
 import click
 from rich.console import Group
 from rich.progress_bar import ProgressBar
 from rich.table import Table
 
-from loopbloom.cli import ui, with_goals
+from loopbloom.cli import ui
 from loopbloom.cli.utils import goal_not_found
 from loopbloom.constants import WINDOW_DEFAULT
 from loopbloom.core import config as cfg
 from loopbloom.core.models import GoalArea
 from loopbloom.core.progression import should_advance
+from loopbloom.core.stats import goal_totals
 from loopbloom.services.datetime import get_current_datetime
+from loopbloom.services.view_cache import Views
 
 console = ui.console
 
@@ -39,45 +41,49 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Show detail for one goal.",
 )
-@with_goals
-def summary(goal_name: str | None, goals: List[GoalArea]):  # type: ignore
+@click.pass_context
+def summary(ctx: click.Context, goal_name: str | None) -> None:
     """Display a progress overview or detail view for a specific goal."""
+    # Read-only: nothing is saved, and on a view cache hit the overview
+    # never parses the data at all.
+    store = ctx.obj.store
     if goal_name:
-        _detail_view(goal_name, goals)
+        _detail_view(goal_name, list(store.iter_goals()))
     else:
-        _overview(goals)
+        views = Views.for_store(store, get_current_datetime().date())
+        _overview(store.iter_goals(), views=views)
+
+
+def _overview_rows(
+    goals: Iterable[GoalArea], window: int, today: date
+) -> List[List[Any]]:
+    """Return ``[name, successes, total, advance]`` for each goal."""
+    # Check-ins from every micro-habit count towards the goal's progress.
+    since = today - timedelta(days=window - 1)
+    rows = []
+    for g, successes, total in goal_totals(goals, since):
+        # Determine which micro-habit is currently active so we can suggest
+        # whether the goal should advance.
+        active = g.get_active_micro_goal()
+        rows.append([g.name, successes, total, bool(active and should_advance(active))])
+    return rows
 
 
-def _overview(goals: List[GoalArea]) -> None:
+def _overview(goals: Iterable[GoalArea], views: Views | None = None) -> None:
     # Show a compact summary row for each goal. Successes are calculated using
     # the configured window so the overview matches the user's advancement
     # settings.
     window = cfg.load().get("advance", {}).get("window", WINDOW_DEFAULT)
+    today = get_current_datetime().date()
+    views = views or Views(None, today)
+    rows = views.get(
+        "summary", lambda: _overview_rows(goals, window, today), window=window
+    )
     table = Table(title=f"LoopBloom Progress (last {window}\u00a0days)")
     table.add_column("Goal")
     table.add_column("Successes")
     table.add_column("Next Action")
-    today = get_current_datetime().date()
-
-    for g in goals:
-        successes = 0
-        total = 0
-        # Collect check-ins from every micro-habit so the goal's progress
-        # reflects all activity beneath it.
-        all_checkins = []
-        # Grab check-ins from phases first
-        for ph in g.phases:
-            for m in ph.micro_goals:
-                all_checkins.extend(m.checkins)
-        # Then include micro-goals attached directly to the goal
-        for m in g.micro_goals:
-            all_checkins.extend(m.checkins)
-
-        for ci in all_checkins:
-            if ci.date >= today - timedelta(days=window - 1):
-                total += 1
-                if ci.success:
-                    successes += 1
+    for name, successes, total, advance in rows:
         ratio: Group | str
         if total:
             # Display a progress bar to make the ratio easier to scan at a
@@ -86,12 +92,7 @@ def _overview(goals: List[GoalArea]) -> None:
             ratio = Group(bar, f" {successes}/{total}")
         else:
             ratio = "\u2013"
-
-        # Determine which micro-habit is currently active so we can suggest
-        # whether the goal should advance.
-        active = g.get_active_micro_goal()
-        flag = "Advance?" if active and should_advance(active) else "\u2014"
-        table.add_row(g.name, ratio, flag)
+        table.add_row(name, ratio, "Advance?" if advance else "\u2014")
     console.print(table)
 
 
@@ -0,0 +1,120 @@
+"""Thin ``loopbloom`` entry point that prefers a running daemon.
+
+When ``loopbloom daemon run`` is serving on the socket, the command line is
+forwarded there and its output replayed, skipping interpreter-heavy
+imports and the store load. If no daemon answers, it declines the request
+(e.g. the command needs a terminal or another data file) or
+``LOOPBLOOM_NO_DAEMON`` is set, the command runs in this process as usual.
+
+Only the standard library is imported here so forwarding stays cheap.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Environment variables that select the data file and backend; they are
+# sent along so the daemon can tell whether it serves the same store.
+FORWARDED_ENV = (
+    "LOOPBLOOM_DATA_PATH",
+    "LOOPBLOOM_SQLITE_PATH",
+    "LOOPBLOOM_STORAGE_BACKEND",
+)
+
+# Commands that need a terminal or manage processes themselves.
+LOCAL_COMMANDS = frozenset({"batch", "cope", "daemon", "serve", "shell"})
+
+# Seconds to wait for the daemon to answer one command.
+TIMEOUT = 30.0
+
+
+def socket_path() -> Path:
+    """Return the Unix socket the daemon listens on."""
+    explicit = os.getenv("LOOPBLOOM_SOCKET")
+    if explicit:
+        return Path(explicit)
+    runtime = os.getenv("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "loopbloom.sock"
+    cache = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache) / "loopbloom" / "daemon.sock"
+
+
+def request(
+    payload: Dict[str, Any], *, path: Path | None = None, timeout: float = TIMEOUT
+) -> Optional[Dict[str, Any]]:
+    """Send ``payload`` to the daemon and return its reply.
+
+    Returns ``None`` when no daemon is listening.
+    """
+    path = path or socket_path()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as fp:
+                line = fp.readline()
+    except OSError:
+        # A stale socket file or a daemon that died mid-request.
+        return None
+    if not line:
+        return None
+    reply: Dict[str, Any] = json.loads(line)
+    return reply
+
+
+def _forwardable(argv: List[str]) -> bool:
+    """Return ``True`` if ``argv`` can run without this process's terminal."""
+    if os.getenv("LOOPBLOOM_NO_DAEMON"):
+        return False
+    # ``-`` reads standard input, which is not forwarded.
+    if "-" in argv:
+        return False
+    args = iter(argv)
+    for arg in args:
+        if arg == "--data-path":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg not in LOCAL_COMMANDS
+    return False
+
+
+def forward(argv: List[str]) -> Optional[int]:
+    """Run ``argv`` on the daemon; return its exit code or ``None``."""
+    if not _forwardable(argv):
+        return None
+    reply = request(
+        {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": {k: os.environ[k] for k in FORWARDED_ENV if k in os.environ},
+        }
+    )
+    if reply is None or reply.get("fallback"):
+        return None
+    sys.stdout.write(reply.get("output", ""))
+    sys.stdout.flush()
+    return int(reply.get("exit_code", 0))
+
+
+def main() -> None:
+    """Console-script entry point."""
+    argv = sys.argv[1:]
+    code = forward(argv)
+    if code is not None:
+        sys.exit(code)
+    from loopbloom.__main__ import cli
+
+    cli()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-from loopbloom.core.config import APP_DIR
+from loopbloom.core.config import APP_DIR, CACHE_DIR
 
 # Base package directory
 PACKAGE_DIR = Path(__file__).resolve().parent
@@ -13,11 +13,43 @@ DATA_DIR = PACKAGE_DIR / "data"
 COPING_DIR = DATA_DIR / "coping"
 TALKS_PATH = DATA_DIR / "default_talks.json"
 
-# User data files
+# Extra pep-talk packs merged with the bundled talks.
+USER_TALKS_DIR = APP_DIR / "talks"
+# Compiled talk pool and the ring of recently shown talks.
+TALK_CACHE_PATH = CACHE_DIR / "talks.marshal"
+TALK_RECENT_PATH = CACHE_DIR / "talks_recent.json"
+
+# Personal coping plans; ``cope new`` writes here and these override team
+# and bundled plans with the same ID.
+USER_COPING_DIR = APP_DIR / "coping"
+
+# Parsed coping plans keyed by file path, mtime and size.
+PLAN_CACHE_PATH = CACHE_DIR / "coping_plans.json"
+
+# User data files. Reviews and journal entries live in monthly NDJSON
+# segments; the ``*_PATH`` files are the legacy single-file layout that is
+# migrated on first use.
+REVIEW_DIR = APP_DIR / "reviews"
 REVIEW_PATH = APP_DIR / "reviews.json"
 
+JOURNAL_DIR = APP_DIR / "journal"
 JOURNAL_PATH = APP_DIR / "journal.json"
 
+# Per micro-goal high-water marks used by ``export --since-last``.
+EXPORT_WATERMARK_PATH = APP_DIR / "export_watermark.json"
+
+# Full-text search index, rebuilt on demand; the suffix is chosen by the
+# backend.
+SEARCH_INDEX_PATH = CACHE_DIR / "search_index"
+
+# Computed summary and report views, evicted least recently used first once
+# the directory grows past the byte budget.
+VIEW_CACHE_DIR = CACHE_DIR / "views"
+VIEW_CACHE_BYTES = 4 * 1024 * 1024
+
+# Pending notifications queued for ``loopbloom notify flush``.
+OUTBOX_PATH = APP_DIR / "outbox.ndjson"
+
 JSON_STORE_PATH = Path(os.getenv("LOOPBLOOM_DATA_PATH", APP_DIR / "data.json"))
 
 SQLITE_STORE_PATH = Path(os.getenv("LOOPBLOOM_SQLITE_PATH", APP_DIR / "data.db"))
@@ -6,10 +6,12 @@ specified by ``XDG_CONFIG_HOME``) so multiple tools can share settings.
 
 from __future__ import annotations
 
+import copy
 import os
+import time
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import tomli_w
 import tomllib
@@ -25,6 +27,10 @@ APP_DIR = XDG_CONFIG_HOME / "loopbloom"
 # Full path to the TOML configuration file.
 # Used by :func:`load` and :func:`save`.
 CONFIG_PATH = APP_DIR / "config.toml"
+# Derived data that can be rebuilt at any time (parsed plans, indexes) lives
+# under ``XDG_CACHE_HOME`` so it is never mixed with user settings.
+XDG_CACHE_HOME = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+CACHE_DIR = XDG_CACHE_HOME / "loopbloom"
 
 # Built-in defaults used when ``config.toml`` does not exist or omits keys.
 # New keys should be added here with sensible values so older configs remain
@@ -36,8 +42,28 @@ DEFAULTS: Dict[str, Any] = {
     # Optional path override for the selected storage back-end.
     # When empty, defaults described in README are used.
     "data_path": "",
-    # How progress notifications are delivered.
-    "notify": "terminal",  # terminal | desktop | none
+    # How progress notifications are delivered. Several channels may be
+    # combined with commas, e.g. "terminal,file".
+    "notify": "terminal",  # terminal | desktop | file | webhook | none
+    # NDJSON feed for the 'file' channel; empty means notifications.ndjson in
+    # the config directory.
+    "notify_file": "",
+    # URL receiving a JSON POST per notification for the 'webhook' channel.
+    "notify_webhook": "",
+    # Queue notifications in the outbox and deliver them as digests on
+    # ``loopbloom notify flush`` instead of immediately.
+    "notify_outbox": False,
+    # Per-channel delivery timeouts in seconds.
+    "notify_timeouts": {
+        "terminal": 1.0,
+        "desktop": 5.0,
+        "file": 2.0,
+        "webhook": 3.0,
+    },
+    # Extra coping-plan directories shared by a team, searched after the
+    # user's own plans and before the bundled ones. A list or a string
+    # separated like PATH; LOOPBLOOM_COPING_PATH is searched first.
+    "coping_dirs": [],
     # Parameters for the auto-progression engine.
     "advance": {
         "threshold": 0.80,
@@ -45,6 +71,8 @@ DEFAULTS: Dict[str, Any] = {
         "strategy": "ratio",
         "streak_to_advance": 10,
     },
+    # Log file format: "text" lines or one JSON object per line ("json").
+    "log_format": "text",
     # Notification pause settings
     "pause_until": "",  # ISO date string when global pause expires
     "goal_pauses": {},  # Mapping of goal name -> ISO date
@@ -75,14 +103,37 @@ def _deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     return res
 
 
+# Parsed ``config.toml`` keyed by (path, mtime, size), with the time it was
+# read, so long-running processes re-parse only after the file changes.
+_parsed: Tuple[Tuple[str, int, int], Dict[str, Any], int] | None = None
+
+# A file modified this recently (ns) may change again within the same mtime
+# tick, so its cached parse is not trusted.
+_RACY_NS = 1_000_000_000
+
+
+def _read() -> Dict[str, Any]:
+    """Return the parsed config file, reusing the last parse if unchanged."""
+    global _parsed
+    st = CONFIG_PATH.stat()
+    key = (str(CONFIG_PATH), st.st_mtime_ns, st.st_size)
+    if _parsed is not None and _parsed[0] == key:
+        if _parsed[2] - st.st_mtime_ns > _RACY_NS:
+            return copy.deepcopy(_parsed[1])
+    read_at = time.time_ns()
+    with CONFIG_PATH.open("rb") as fp:
+        data = tomllib.load(fp)
+    _parsed = (key, data, read_at)
+    return copy.deepcopy(data)
+
+
 def load() -> Dict[str, Any]:
     """Load the user configuration merged with built-in defaults."""
     # Missing files are treated as empty configs so first-run works without
     # requiring any setup from the user.
     if not CONFIG_PATH.exists():
         return DEFAULTS.copy()
-    with CONFIG_PATH.open("rb") as fp:
-        data = tomllib.load(fp)
+    data = _read()
     # Merge user values over the built-in defaults.
     return _deep_merge(DEFAULTS, data)
 
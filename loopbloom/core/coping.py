@@ -3,16 +3,52 @@
 Each coping plan consists of a series of prompts/messages stored in a
 YAML file. This module loads those files and provides minimal runtime
 logic to execute the steps.
+
+Plans are looked up along a search path: the user's own directory, any
+team-shared directories from ``LOOPBLOOM_COPING_PATH`` or the
+``coping_dirs`` config key, and finally the bundled plans. The first
+directory holding a plan ID wins, so personal copies override shared and
+built-in ones.
+
+Parsed plans are kept in a :class:`PlanIndex` keyed by file path, mtime
+and size, and each directory's file listing is keyed by the directory's
+mtime. The index lives in memory and is persisted to the cache directory,
+so directories are only re-scanned when plans are added or removed and
+YAML is only parsed again when a plan file changes.
 """
 
 from __future__ import annotations
 
+import json
+import logging
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence, Tuple
 
 import yaml
 
-from loopbloom.constants import COPING_DIR
+from loopbloom.constants import COPING_DIR, PLAN_CACHE_PATH, USER_COPING_DIR
+from loopbloom.core import config as cfg
+
+logger = logging.getLogger(__name__)
+
+# Prefer libyaml's C parser; fall back to the pure-Python one when PyYAML
+# was built without it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+PLAN_SUFFIX = ".yml"
+
+# Directory listings younger than this (in ns) are re-scanned on use.
+_RACY_NS = 1_000_000_000
+
+# Listing of a missing directory; shared so catalogs built on it stay valid.
+_NO_NAMES: Sequence[str] = ()
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse ``path`` with the fastest available safe loader."""
+    return yaml.load(path.read_text(), Loader=_YamlLoader)
 
 
 class CopingPlanError(RuntimeError):
@@ -42,21 +78,228 @@ class Step:
 class CopingPlan:
     """Parsed coping plan from YAML."""
 
-    def __init__(self, path: Path):
-        """Load plan metadata and steps from a YAML file."""
-        content = yaml.safe_load(path.read_text())
+    def __init__(self, path: Path, content: Dict[str, Any] | None = None):
+        """Load plan metadata and steps from a YAML file.
+
+        Args:
+            path: Location of the plan file.
+            content: Already parsed file contents; read from ``path`` when
+                omitted.
+        """
+        if content is None:
+            content = _load_yaml(path)
+        self.path = path
         self.id = content["id"]
         self.title = content["title"]
         self.steps = [Step(s) for s in content["steps"]]
 
 
+class PlanIndex:
+    """Parsed coping plans keyed by file, invalidated by mtime and size."""
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        """Create the index, seeding it from ``cache_path`` when present."""
+        self._cache_path = cache_path
+        # path -> {"mtime": ns, "size": bytes, "content": parsed YAML}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # directory -> {"mtime": ns, "scanned": ns, "names": plan file names}
+        self._dirs: Dict[str, Dict[str, Any]] = {}
+        self._plans: Dict[str, CopingPlan] = {}
+        # directories -> (listings the catalog was built from, catalog)
+        self._catalogs: Dict[
+            Tuple[Path, ...], Tuple[List[Sequence[str]], Dict[str, Path]]
+        ] = {}
+        self._dirty = False
+        if cache_path is not None and cache_path.exists():
+            try:
+                with cache_path.open("r", encoding="utf-8") as fp:
+                    raw = json.load(fp)
+                self._files = raw.get("files", {})
+                self._dirs = raw.get("dirs", {})
+            except (OSError, ValueError):
+                # The cache is disposable; rebuild it from the YAML files.
+                logger.debug("Ignoring unreadable plan cache %s", cache_path)
+
+    def _plan(self, path: Path, st: os.stat_result) -> CopingPlan:
+        """Return the plan at ``path``, parsing only if the file changed."""
+        key = str(path)
+        entry = self._files.get(key)
+        if (
+            entry is not None
+            and entry["mtime"] == st.st_mtime_ns
+            and entry["size"] == st.st_size
+        ):
+            plan = self._plans.get(key)
+            if plan is None:
+                plan = self._plans[key] = CopingPlan(path, entry["content"])
+            return plan
+        content = _load_yaml(path)
+        plan = CopingPlan(path, content)
+        self._files[key] = {
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size,
+            "content": content,
+        }
+        self._plans[key] = plan
+        self._dirty = True
+        return plan
+
+    def _names(self, directory: Path) -> Sequence[str]:
+        """Return plan file names in ``directory``, re-scanning on change.
+
+        The same sequence object is returned for as long as the listing is
+        unchanged, which lets :meth:`catalog` reuse its merged result.
+        """
+        key = str(directory)
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            if self._dirs.pop(key, None) is not None:
+                self._dirty = True
+            return _NO_NAMES
+        entry = self._dirs.get(key)
+        # A listing taken within a second of the directory's last change may
+        # have missed a file added in the same mtime tick, so it is not trusted.
+        if (
+            entry is not None
+            and entry["mtime"] == mtime
+            and entry["scanned"] - mtime > _RACY_NS
+        ):
+            return entry["names"]  # type: ignore[no-any-return]
+        scanned = time.time_ns()
+        with os.scandir(directory) as it:
+            names = sorted(
+                e.name for e in it if e.name.endswith(PLAN_SUFFIX) and e.is_file()
+            )
+        if entry is not None and entry["names"] == names:
+            names = entry["names"]
+        # Only persist listings that changed or just became trusted.
+        if (
+            entry is None
+            or names is not entry["names"]
+            or entry["mtime"] != mtime
+            or scanned - mtime > _RACY_NS
+        ):
+            self._dirty = True
+        self._dirs[key] = {"mtime": mtime, "scanned": scanned, "names": names}
+        return names
+
+    def catalog(self, directories: Sequence[Path]) -> Dict[str, Path]:
+        """Map each plan ID to its file, earlier directories taking precedence.
+
+        The merged catalog is rebuilt only when one of the directory
+        listings changed; otherwise the previous result is returned.
+
+        Args:
+            directories: Search path, highest precedence first.
+
+        Returns:
+            dict: Plan ID (the file stem) to plan path, ordered by ID.
+        """
+        key = tuple(directories)
+        listings = [self._names(directory) for directory in key]
+        cached = self._catalogs.get(key)
+        if cached is not None and all(
+            new is old for new, old in zip(listings, cached[0], strict=True)
+        ):
+            return cached[1]
+        found: Dict[str, Path] = {}
+        for directory, names in zip(key, listings, strict=True):
+            for name in names:
+                found.setdefault(name[: -len(PLAN_SUFFIX)], directory / name)
+        catalog = dict(sorted(found.items()))
+        self._catalogs[key] = (listings, catalog)
+        return catalog
+
+    def get(self, directory: Path, plan_id: str) -> CopingPlan | None:
+        """Return the plan stored as ``<plan_id>.yml`` in ``directory``."""
+        return self.find([directory], plan_id)
+
+    def find(self, directories: Sequence[Path], plan_id: str) -> CopingPlan | None:
+        """Return the highest-precedence plan ``plan_id`` in ``directories``."""
+        path = self.catalog(directories).get(plan_id)
+        plan = None
+        if path is not None:
+            try:
+                plan = self._plan(path, path.stat())
+            except FileNotFoundError:
+                # Removed within the directory's mtime resolution.
+                plan = None
+        self.save()
+        return plan
+
+    def list(self, *directories: Path) -> List[CopingPlan]:
+        """Return the merged plans in ``directories`` ordered by ID."""
+        plans = []
+        for path in self.catalog(directories).values():
+            try:
+                plans.append(self._plan(path, path.stat()))
+            except FileNotFoundError:
+                continue
+        self.save()
+        return plans
+
+    def save(self) -> None:
+        """Persist newly parsed plans to the cache file."""
+        if not self._dirty or self._cache_path is None:
+            return
+        # Forget files that were deleted so the cache does not grow forever.
+        self._files = {k: v for k, v in self._files.items() if Path(k).exists()}
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as fp:
+                # YAML dates and timestamps are stored as their ISO strings.
+                json.dump(
+                    {"version": 2, "files": self._files, "dirs": self._dirs},
+                    fp,
+                    default=str,
+                )
+            os.replace(tmp, self._cache_path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug("Could not write plan cache: %s", exc)
+        self._dirty = False
+
+
+_index: PlanIndex | None = None
+
+
+def plan_index() -> PlanIndex:
+    """Return the process-wide plan index, creating it on first use."""
+    global _index
+    if _index is None:
+        _index = PlanIndex(PLAN_CACHE_PATH)
+    return _index
+
+
+def search_path() -> List[Path]:
+    """Return coping-plan directories in precedence order.
+
+    The user's directory comes first, then team directories from
+    ``LOOPBLOOM_COPING_PATH`` and the ``coping_dirs`` config key, then the
+    bundled plans.
+    """
+    team: List[str] = []
+    env = os.getenv("LOOPBLOOM_COPING_PATH", "")
+    team.extend(p for p in env.split(os.pathsep) if p)
+    configured = cfg.load().get("coping_dirs") or []
+    if isinstance(configured, str):
+        configured = configured.split(os.pathsep)
+    team.extend(str(p) for p in configured if p)
+    dirs: List[Path] = []
+    for d in [USER_COPING_DIR, *(Path(t).expanduser() for t in team), COPING_DIR]:
+        if d not in dirs:
+            dirs.append(d)
+    return dirs
+
+
 class PlanRepository:
     """Access coping plans stored on disk."""
 
     @staticmethod
     def list_plans() -> List[CopingPlan]:
-        """Return all available coping plans found on disk."""
-        return [CopingPlan(p) for p in COPING_DIR.glob("*.yml")]
+        """Return all coping plans on the search path, one per ID."""
+        return plan_index().list(*search_path())
 
     @staticmethod
     def get(plan_id: str) -> CopingPlan | None:
@@ -68,10 +311,17 @@ class PlanRepository:
         Returns:
             CopingPlan instance when found, otherwise ``None``.
         """
-        for p in COPING_DIR.glob("*.yml"):
-            if p.stem == plan_id:
-                return CopingPlan(p)
-        return None
+        return plan_index().find(search_path(), plan_id)
+
+    @staticmethod
+    def exists(plan_id: str) -> bool:
+        """Return ``True`` if any directory on the search path has ``plan_id``."""
+        return any((d / f"{plan_id}{PLAN_SUFFIX}").is_file() for d in search_path())
+
+    @staticmethod
+    def user_dir() -> Path:
+        """Return the directory new plans are written to."""
+        return USER_COPING_DIR
 
 
 def run_plan(plan: CopingPlan) -> None:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
-from typing import List
+from itertools import islice
+from typing import Iterator, List
 
 from pydantic import BaseModel, Field
 
-from loopbloom.constants import JOURNAL_PATH
+from loopbloom.constants import JOURNAL_DIR, JOURNAL_PATH
+from loopbloom.core import segments
 
 
 class JournalEntry(BaseModel):
@@ -17,28 +18,55 @@ class JournalEntry(BaseModel):
     goal: str | None = None
 
 
+def iter_entries() -> Iterator[JournalEntry]:
+    """Stream stored journal entries from the monthly segments.
+
+    Yields:
+        JournalEntry: Entries in the order they were written.
+    """
+    segments.migrate_legacy(JOURNAL_PATH, JOURNAL_DIR)
+    for obj in segments.iter_records(JOURNAL_DIR):
+        yield JournalEntry.model_validate(obj)
+
+
 def load_entries() -> List[JournalEntry]:
     """Load all stored journal entries from disk.
 
     Returns:
         list[JournalEntry]: Chronologically ordered journal entries.
     """
-    if not JOURNAL_PATH.exists():
-        return []
-    with JOURNAL_PATH.open("r", encoding="utf-8") as fp:
-        raw = json.load(fp)
-    return [JournalEntry.model_validate(obj) for obj in raw]
+    return list(iter_entries())
+
+
+def iter_recent(goal: str | None = None) -> Iterator[JournalEntry]:
+    """Stream journal entries newest first, optionally for one ``goal``.
+
+    Entries are read backwards from the end of the latest segment, so the
+    cost depends on how many entries are consumed rather than on the size
+    of the journal.
+    """
+    segments.migrate_legacy(JOURNAL_PATH, JOURNAL_DIR)
+    wanted = goal.lower() if goal else None
+    for obj in segments.iter_records_reversed(JOURNAL_DIR):
+        if wanted is not None and (obj.get("goal") or "").lower() != wanted:
+            continue
+        yield JournalEntry.model_validate(obj)
+
+
+def recent(n: int, goal: str | None = None) -> List[JournalEntry]:
+    """Return the last ``n`` entries (for ``goal``) in chronological order."""
+    entries = list(islice(iter_recent(goal), n))
+    entries.reverse()
+    return entries
 
 
 def add_entry(text: str, goal: str | None = None) -> None:
-    """Append a new journal entry to the journal file.
+    """Append a new journal entry to the current month's segment.
 
     Args:
         text: Entry text supplied by the user.
         goal: Optional goal name associated with the entry.
     """
-    entries = load_entries()
-    entries.append(JournalEntry(text=text.strip(), goal=goal))
-    JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with JOURNAL_PATH.open("w", encoding="utf-8") as fp:
-        json.dump([e.model_dump(mode="json") for e in entries], fp, indent=2)
+    segments.migrate_legacy(JOURNAL_PATH, JOURNAL_DIR)
+    entry = JournalEntry(text=text.strip(), goal=goal)
+    segments.append(JOURNAL_DIR, entry.timestamp, entry.model_dump_json())
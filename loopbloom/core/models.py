@@ -6,12 +6,24 @@ persisted via the storage backends.
 
 from __future__ import annotations
 
+import bisect
+import hashlib
 from datetime import date as dt_date
 from datetime import datetime
 from enum import Enum
+from typing import Any, Dict
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    ValidationInfo,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 
 from loopbloom.services.datetime import get_current_datetime
 
@@ -24,6 +36,15 @@ class Status(str, Enum):
     complete = "complete"
 
 
+# Key used in place of ``self_talk_generated`` when talks are interned.
+TALK_ID_KEY = "self_talk_id"
+
+
+def talk_id(text: str) -> str:
+    """Return the stable id under which ``text`` is interned."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
 class Checkin(BaseModel):
     """A single daily micro-goal check-in."""
 
@@ -36,6 +57,40 @@ class Checkin(BaseModel):
     # displayed alongside the check-in history.
     self_talk_generated: str | None = None
 
+    # Storage backends keep each distinct pep talk once in a talk table and
+    # write only its id with the check-in. They pass the table as the
+    # ``talks`` context entry when dumping and loading; without it the text
+    # is inlined as before, which is also how older data files look.
+
+    @model_validator(mode="before")
+    @classmethod
+    def _resolve_talk(cls, data: Any, info: ValidationInfo) -> Any:
+        """Replace a stored ``self_talk_id`` with the text it refers to."""
+        if isinstance(data, dict) and TALK_ID_KEY in data:
+            table: Dict[str, str] = (info.context or {}).get("talks") or {}
+            data = dict(data)
+            tid = data.pop(TALK_ID_KEY)
+            if tid is not None and tid not in table:
+                # Loading it as ``None`` would erase the talk on the next save.
+                raise ValueError(f"unknown pep talk id {tid!r}")
+            data["self_talk_generated"] = None if tid is None else table[tid]
+        return data
+
+    @model_serializer(mode="wrap")
+    def _intern_talk(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Dict[str, Any]:
+        """Write the talk as an id into the ``talks`` context table if given."""
+        data: Dict[str, Any] = handler(self)
+        table = (info.context or {}).get("talks")
+        text = data.get("self_talk_generated")
+        if table is not None and text is not None:
+            tid = talk_id(text)
+            table[tid] = text
+            del data["self_talk_generated"]
+            data[TALK_ID_KEY] = tid
+        return data
+
 
 class MicroGoal(BaseModel):
     """A very small behavioural target the user wants to track."""
@@ -68,6 +123,25 @@ class MicroGoal(BaseModel):
         # leading/trailing whitespace when models are parsed or created.
         return v.strip()
 
+    def record_checkin(
+        self,
+        day: dt_date,
+        success: bool,
+        note: str | None = None,
+        talk: str | None = None,
+    ) -> Checkin:
+        """Insert a check-in for ``day`` keeping the history chronological."""
+        ci = Checkin(
+            date=day, success=success, note=note or None, self_talk_generated=talk
+        )
+        if not self.checkins or self.checkins[-1].date <= day:
+            self.checkins.append(ci)
+        else:
+            # Backfilled days slot in before later entries.
+            idx = bisect.bisect_right(self.checkins, day, key=lambda c: c.date)
+            self.checkins.insert(idx, ci)
+        return ci
+
 
 class Phase(BaseModel):
     """A collection of micro-goals grouped under a named phase."""
@@ -7,7 +7,7 @@ If an active micro-habit hits ≥ `threshold` success ratio within the last
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import List
+from typing import Any, Dict, List
 
 from loopbloom.constants import THRESHOLD_DEFAULT, WINDOW_DEFAULT
 from loopbloom.core import config as cfg
@@ -33,7 +33,7 @@ def _recent_checkins(checkins: List[Checkin], window: int) -> List[Checkin]:
     return [ci for ci in checkins if ci.date >= cutoff]
 
 
-def _current_streak(checkins: List[Checkin]) -> int:
+def current_streak(checkins: List[Checkin]) -> int:
     """Calculate consecutive successes at the end of ``checkins``.
 
     Args:
@@ -57,6 +57,7 @@ def should_advance(
     *,
     window: int | None = None,
     threshold: float | None = None,
+    conf: Dict[str, Any] | None = None,
 ) -> bool:
     """Determine if ``micro`` should progress to the next stage.
 
@@ -69,6 +70,8 @@ def should_advance(
             read from the micro-goal or global config.
         threshold: Optional ratio required to progress. Falls back to the
             micro-goal's value or the global default when not provided.
+        conf: Pre-loaded ``advance`` config section. Callers evaluating many
+            micro-goals pass it to avoid re-reading ``config.toml`` each time.
 
     Returns:
         bool: ``True`` when the micro-goal meets the configured progression
@@ -80,7 +83,8 @@ def should_advance(
         window = micro.advancement_window
     if threshold is None:
         threshold = micro.advancement_threshold
-    conf = cfg.load().get("advance", {})
+    if conf is None:
+        conf = cfg.load().get("advance", {})
     strategy = ProgressionStrategy(conf.get("strategy", "ratio"))
     if window is None or threshold is None:
         if window is None:
@@ -90,7 +94,7 @@ def should_advance(
 
     if strategy is ProgressionStrategy.STREAK:
         streak_target = int(conf.get("streak_to_advance", 10))
-        return _current_streak(micro.checkins) >= streak_target
+        return current_streak(micro.checkins) >= streak_target
 
     recent = _recent_checkins(micro.checkins, window)
     if len(recent) < window:
@@ -104,6 +108,7 @@ def get_progression_reasons(
     *,
     window: int | None = None,
     threshold: float | None = None,
+    conf: Dict[str, Any] | None = None,
 ) -> list[str]:
     """Explain why a micro-goal should or should not progress.
 
@@ -111,6 +116,7 @@ def get_progression_reasons(
         micro: The micro-goal under evaluation.
         window: Optional window override in days.
         threshold: Optional success ratio required to progress.
+        conf: Pre-loaded ``advance`` config section.
 
     Returns:
         list[str]: Human-readable messages describing the evaluation.
@@ -119,7 +125,8 @@ def get_progression_reasons(
         window = micro.advancement_window
     if threshold is None:
         threshold = micro.advancement_threshold
-    conf = cfg.load().get("advance", {})
+    if conf is None:
+        conf = cfg.load().get("advance", {})
     strategy = ProgressionStrategy(conf.get("strategy", "ratio"))
     if window is None or threshold is None:
         if window is None:
@@ -130,7 +137,7 @@ def get_progression_reasons(
     reasons: list[str] = []
     if strategy is ProgressionStrategy.STREAK:
         streak_target = int(conf.get("streak_to_advance", 10))
-        streak = _current_streak(micro.checkins)
+        streak = current_streak(micro.checkins)
         reasons.append(f"Current streak {streak}/{streak_target}")
         return reasons
 
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
-from typing import List
+from typing import Iterator, List
 
 from pydantic import BaseModel, Field
 
-from loopbloom.constants import REVIEW_PATH
+from loopbloom.constants import REVIEW_DIR, REVIEW_PATH
+from loopbloom.core import segments
 
 
 class ReviewEntry(BaseModel):
@@ -17,13 +17,16 @@ class ReviewEntry(BaseModel):
     went_well: str
 
 
+def iter_entries() -> Iterator[ReviewEntry]:
+    """Stream saved reflection entries from the monthly segments."""
+    segments.migrate_legacy(REVIEW_PATH, REVIEW_DIR)
+    for obj in segments.iter_records(REVIEW_DIR):
+        yield ReviewEntry.model_validate(obj)
+
+
 def load_entries() -> List[ReviewEntry]:
     """Load saved reflection entries from disk."""
-    if not REVIEW_PATH.exists():
-        return []
-    with REVIEW_PATH.open("r", encoding="utf-8") as fp:
-        raw = json.load(fp)
-    return [ReviewEntry.model_validate(obj) for obj in raw]
+    return list(iter_entries())
 
 
 def add_entry(period: str, went_well: str) -> None:
@@ -33,8 +36,6 @@ def add_entry(period: str, went_well: str) -> None:
         period: Period covered by the reflection.
         went_well: Summary of what went well during that period.
     """
-    entries = load_entries()
-    entries.append(ReviewEntry(period=period, went_well=went_well.strip()))
-    REVIEW_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with REVIEW_PATH.open("w", encoding="utf-8") as fp:
-        json.dump([e.model_dump(mode="json") for e in entries], fp, indent=2)
+    segments.migrate_legacy(REVIEW_PATH, REVIEW_DIR)
+    entry = ReviewEntry(period=period, went_well=went_well.strip())
+    segments.append(REVIEW_DIR, entry.timestamp, entry.model_dump_json())
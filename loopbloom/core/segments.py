@@ -0,0 +1,144 @@
+"""Append-only NDJSON files rotated by month.
+
+Journal and review entries are stored one JSON object per line in
+``<root>/YYYY-MM.ndjson``. Adding a record is a single append to the
+current month's segment and reading streams the segments in order, so
+neither operation has to load or rewrite the full history.
+
+Older releases kept each history as one pretty-printed JSON array; the
+first access migrates such a file into segments and renames it with a
+``.migrated`` suffix.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+SUFFIX = ".ndjson"
+
+
+def segment_path(root: Path, ts: datetime) -> Path:
+    """Return the segment file that holds records stamped ``ts``."""
+    return root / f"{ts:%Y-%m}{SUFFIX}"
+
+
+def segments(root: Path) -> List[Path]:
+    """Return all segment files under ``root`` oldest first."""
+    if not root.is_dir():
+        return []
+    # ``YYYY-MM`` names sort chronologically as plain strings.
+    return sorted(root.glob(f"*{SUFFIX}"))
+
+
+def append(root: Path, ts: datetime, line: str) -> Path:
+    """Append one serialized record to the segment for ``ts``.
+
+    Args:
+        root: Directory holding the segments.
+        ts: Timestamp selecting the monthly segment.
+        line: JSON document for the record, without a trailing newline.
+
+    Returns:
+        Path: The segment that was written.
+    """
+    path = segment_path(root, ts)
+    root.mkdir(parents=True, exist_ok=True)
+    # One ``write`` per record keeps appends from interleaving.
+    with path.open("a", encoding="utf-8") as fp:
+        fp.write(line + "\n")
+    return path
+
+
+def iter_records(root: Path) -> Iterator[Dict[str, Any]]:
+    """Yield every record under ``root`` in file order."""
+    for path in segments(root):
+        with path.open("r", encoding="utf-8") as fp:
+            for lineno, line in enumerate(fp, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted append is skipped
+                    # rather than hiding the rest of the history.
+                    logger.warning("Skipping corrupt line %d in %s", lineno, path)
+
+
+def iter_lines_reversed(path: Path) -> Iterator[bytes]:
+    """Yield the non-empty lines of ``path`` from last to first.
+
+    The file is memory-mapped and scanned backwards for newlines, so only
+    the pages holding the lines actually consumed are read.
+    """
+    with path.open("rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0:
+                start = mm.rfind(b"\n", 0, end - 1) + 1
+                line = mm[start:end].strip()
+                if line:
+                    yield line
+                end = start
+
+
+def iter_records_reversed(root: Path) -> Iterator[Dict[str, Any]]:
+    """Yield every record under ``root`` newest first.
+
+    Segments are visited from the latest month backwards and stop being
+    read as soon as the caller stops iterating.
+    """
+    for path in reversed(segments(root)):
+        for line in iter_lines_reversed(path):
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping corrupt line in %s", path)
+
+
+def migrate_legacy(legacy: Path, root: Path, *, ts_key: str = "timestamp") -> None:
+    """Move records from a legacy JSON array file into monthly segments.
+
+    Legacy records are older than anything appended since, so they are
+    written ahead of existing segment content. The legacy file is first
+    claimed by renaming it to ``.migrating``; an interrupted migration
+    resumes from that file, and segments that already start with their
+    legacy records are left alone, so running it again never duplicates
+    entries.
+    """
+    claim = legacy.with_name(legacy.name + ".migrating")
+    if legacy.exists() and not claim.exists():
+        try:
+            legacy.rename(claim)
+        except FileNotFoundError:
+            # Another process claimed it first.
+            pass
+    if not claim.exists():
+        return
+    with claim.open("r", encoding="utf-8") as fp:
+        raw = json.load(fp)
+    by_month: Dict[Path, List[str]] = defaultdict(list)
+    for obj in raw:
+        ts = datetime.fromisoformat(str(obj[ts_key]))
+        by_month[segment_path(root, ts)].append(json.dumps(obj))
+    root.mkdir(parents=True, exist_ok=True)
+    for path, lines in by_month.items():
+        block = "\n".join(lines) + "\n"
+        existing = path.read_text(encoding="utf-8") if path.exists() else ""
+        if existing.startswith(block):
+            continue
+        tmp = path.with_suffix(SUFFIX + ".tmp")
+        tmp.write_text(block + existing, encoding="utf-8")
+        os.replace(tmp, path)
+    os.replace(claim, legacy.with_name(legacy.name + ".migrated"))
+    logger.info("Migrated %d record(s) from %s to %s", len(raw), legacy, root)
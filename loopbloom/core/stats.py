@@ -0,0 +1,99 @@
+"""Aggregate check-in statistics shared by reports and summaries.
+
+Counts are accumulated into flat lists indexed by day ordinal so a whole
+range can be computed in a single pass over the check-in history instead
+of rescanning it for every day or cell that gets rendered.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterable, Iterator
+
+from loopbloom.core.models import GoalArea, MicroGoal
+
+
+def iter_micro_goals(goals: Iterable[GoalArea]) -> Iterator[MicroGoal]:
+    """Yield every micro-goal in ``goals`` including phase-less ones."""
+    for g in goals:
+        for ph in g.phases:
+            yield from ph.micro_goals
+        yield from g.micro_goals
+
+
+@dataclass
+class DayCounts:
+    """Per-day success and check-in totals for ``start``..``end``."""
+
+    start: date
+    end: date
+    successes: list[int]
+    totals: list[int]
+
+    def at(self, day: date) -> tuple[int, int]:
+        """Return ``(successes, total)`` for ``day`` or zeros if out of range."""
+        i = day.toordinal() - self.start.toordinal()
+        if 0 <= i < len(self.totals):
+            return self.successes[i], self.totals[i]
+        return 0, 0
+
+    def days(self) -> Iterator[date]:
+        """Yield every day covered by the range in order."""
+        for i in range(len(self.totals)):
+            yield self.start + timedelta(days=i)
+
+
+def day_counts(micros: Iterable[MicroGoal], start: date, end: date) -> DayCounts:
+    """Count successes and check-ins per day between ``start`` and ``end``.
+
+    Args:
+        micros: Micro-goals whose check-ins should be counted.
+        start: First day of the range (inclusive).
+        end: Last day of the range (inclusive).
+
+    Returns:
+        DayCounts: Totals indexed by ``day.toordinal() - start.toordinal()``.
+    """
+    base = start.toordinal()
+    span = max(end.toordinal() - base + 1, 0)
+    successes = [0] * span
+    totals = [0] * span
+    for m in micros:
+        for ci in m.checkins:
+            i = ci.date.toordinal() - base
+            # Check-ins outside the requested range are ignored.
+            if 0 <= i < span:
+                totals[i] += 1
+                if ci.success:
+                    successes[i] += 1
+    return DayCounts(start=start, end=end, successes=successes, totals=totals)
+
+
+def goal_totals(
+    goals: Iterable[GoalArea], since: date | None = None
+) -> list[tuple[GoalArea, int, int]]:
+    """Return ``(goal, successes, total)`` over every micro-goal of each goal.
+
+    Args:
+        goals: Goal areas to summarise.
+        since: Only count check-ins on or after this day when given.
+    """
+    rows = []
+    for g in goals:
+        successes = 0
+        total = 0
+        for m in iter_micro_goals([g]):
+            for ci in m.checkins:
+                if since is None or ci.date >= since:
+                    total += 1
+                    if ci.success:
+                        successes += 1
+        rows.append((g, successes, total))
+    return rows
+
+
+def month_start(day: date, offset: int) -> date:
+    """Return the first day of the month ``offset`` months before ``day``."""
+    index = day.year * 12 + (day.month - 1) - offset
+    return date(index // 12, index % 12 + 1, 1)
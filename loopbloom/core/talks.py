@@ -1,41 +1,274 @@
 """Pep-talk template library + weighted random selector.
 
-Short motivational messages are stored in a JSON file and loaded lazily on
-first use.
+Short motivational messages are grouped by mood (``success`` | ``skip``)
+in JSON talk packs. The bundled ``default_talks.json`` is merged with any
+``*.json`` packs in the user's ``talks`` directory; an entry is either a
+plain string or ``{"text": ..., "weight": ...}``. Texts may use
+placeholders such as ``{goal}``, ``{micro}`` or ``{streak}``, which are
+parsed once when the pool is compiled.
+
+Each mood is sampled in O(1) with Walker's alias method. The compiled
+pool is cached in a ``marshal`` file keyed by the packs' mtimes and sizes,
+so the JSON is not re-parsed on every check-in, and the last few talks
+shown are kept in a small persisted ring so they are not repeated.
 """
 
 from __future__ import annotations
 
 import json
+import logging
+import marshal
+import os
 import random
-from typing import Dict, List
+import string
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Sequence, Tuple
+
+from loopbloom.constants import (
+    TALK_CACHE_PATH,
+    TALK_RECENT_PATH,
+    TALKS_PATH,
+    USER_TALKS_DIR,
+)
+
+logger = logging.getLogger(__name__)
+
+# Talks shown recently are skipped until this many others were shown.
+RECENT_WINDOW = 3
+
+# Values used for placeholders the caller does not supply.
+DEFAULT_CONTEXT: Dict[str, Any] = {
+    "goal": "your goal",
+    "micro": "your habit",
+    "streak": 0,
+}
+
+# Bumped whenever the compiled layout changes.
+_CACHE_VERSION = 1
+
+_FORMATTER = string.Formatter()
+
+
+@dataclass(frozen=True)
+class Talk:
+    """One pep-talk template."""
+
+    text: str
+    weight: float = 1.0
+    # Placeholder names found in ``text``; empty for plain messages.
+    fields: Tuple[str, ...] = ()
+
+    def render(self, context: Dict[str, Any] | None = None) -> str:
+        """Return the text with placeholders filled from ``context``."""
+        if not self.fields:
+            return self.text
+        values = {**DEFAULT_CONTEXT, **(context or {})}
+        try:
+            return self.text.format_map(values)
+        except (KeyError, IndexError, ValueError):
+            # A pack with an unknown placeholder still shows something.
+            return self.text
+
+
+def compile_talk(entry: Any) -> Talk:
+    """Build a :class:`Talk` from a pack entry, parsing its placeholders."""
+    if isinstance(entry, dict):
+        text, weight = str(entry["text"]), float(entry.get("weight", 1.0))
+    else:
+        text, weight = str(entry), 1.0
+    try:
+        fields = tuple(dict.fromkeys(f for _, f, _, _ in _FORMATTER.parse(text) if f))
+    except ValueError:
+        # Stray braces: treat the text literally.
+        fields = ()
+    return Talk(text, max(weight, 0.0), fields)
+
+
+def build_alias(weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Return Vose alias tables for sampling ``weights`` in O(1).
+
+    Returns:
+        tuple: ``(prob, alias)`` lists of the same length as ``weights``.
+    """
+    n = len(weights)
+    total = sum(weights)
+    if n == 0 or total <= 0:
+        return [1.0] * n, list(range(n))
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, g = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = g
+        scaled[g] -= 1.0 - scaled[s]
+        (small if scaled[g] < 1.0 else large).append(g)
+    # Leftovers are 1.0 up to rounding error.
+    return prob, alias
+
+
+class MoodPool:
+    """Compiled talks for one mood with their alias tables."""
 
-from loopbloom.constants import TALKS_PATH
+    def __init__(self, talks: Sequence[Talk]) -> None:
+        """Compile ``talks``, dropping zero-weight entries."""
+        self.talks = [t for t in talks if t.weight > 0]
+        self.prob, self.alias = build_alias([t.weight for t in self.talks])
+
+    def sample(self, rng: random.Random | None = None) -> int:
+        """Return the index of a talk drawn by weight in O(1)."""
+        randrange = rng.randrange if rng else random.randrange
+        uniform = rng.random if rng else random.random
+        i = randrange(len(self.talks))
+        return i if uniform() < self.prob[i] else self.alias[i]
+
+
+def _pack_paths() -> List[Path]:
+    """Return the bundled pack followed by user packs in name order."""
+    paths = [TALKS_PATH]
+    if USER_TALKS_DIR.is_dir():
+        paths.extend(sorted(USER_TALKS_DIR.glob("*.json")))
+    return paths
+
+
+def _cache_key(paths: Sequence[Path]) -> List[Any]:
+    """Return a key that changes whenever any pack changes."""
+    key: List[Any] = [_CACHE_VERSION]
+    for path in paths:
+        st = path.stat()
+        key.append((str(path), st.st_mtime_ns, st.st_size))
+    return key
+
+
+def _read_packs(paths: Sequence[Path]) -> Dict[str, List[Talk]]:
+    """Parse and merge talk packs; later packs add to earlier moods."""
+    moods: Dict[str, List[Talk]] = {}
+    for path in paths:
+        try:
+            pack = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Skipping unreadable talk pack %s: %s", path, exc)
+            continue
+        for mood, entries in pack.items():
+            moods.setdefault(mood, []).extend(compile_talk(e) for e in entries)
+    return moods
+
+
+def _load_cached(key: List[Any]) -> Dict[str, List[Talk]] | None:
+    """Return compiled talks from the binary cache when ``key`` matches."""
+    try:
+        with TALK_CACHE_PATH.open("rb") as fp:
+            cached_key, data = marshal.load(fp)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if cached_key != key:
+        return None
+    return {
+        mood: [Talk(text, weight, tuple(fields)) for text, weight, fields in rows]
+        for mood, rows in data.items()
+    }
+
+
+def _store_cached(key: List[Any], moods: Dict[str, List[Talk]]) -> None:
+    """Write compiled talks to the binary cache, ignoring failures."""
+    data = {
+        mood: [(t.text, t.weight, list(t.fields)) for t in talks]
+        for mood, talks in moods.items()
+    }
+    try:
+        TALK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = TALK_CACHE_PATH.with_suffix(".tmp")
+        with tmp.open("wb") as fp:
+            marshal.dump((key, data), fp)
+        os.replace(tmp, TALK_CACHE_PATH)
+    except OSError as exc:
+        logger.debug("Could not write talk cache: %s", exc)
 
 
 class TalkPool:
     """Loads pep-talk templates grouped by key (success | skip)."""
 
-    _cache: Dict[str, List[str]] | None = None
+    _cache: Dict[str, MoodPool] | None = None
+    _key: List[Any] | None = None
+    _recent: Deque[str] | None = None
 
     @classmethod
-    def _load(cls) -> Dict[str, List[str]]:
-        """Load talk templates from disk if not cached."""
-        # Lazily read and parse the bundled pep talk file only once per run.
-        # Caching avoids unnecessary disk I/O when multiple pep talks are
-        # requested in a single invocation.
-        if cls._cache is None:
-            cls._cache = json.loads(TALKS_PATH.read_text())
+    def _load(cls) -> Dict[str, MoodPool]:
+        """Load compiled talk pools, preferring the binary cache."""
+        # Compiled once per process and re-checked against the packs' stat
+        # so long-running processes pick up edited packs; across processes
+        # the marshal cache spares re-parsing the JSON.
+        paths = _pack_paths()
+        key = _cache_key(paths)
+        if cls._cache is None or cls._key != key:
+            cls._key = key
+            moods = _load_cached(key)
+            if moods is None:
+                moods = _read_packs(paths)
+                _store_cached(key, moods)
+            cls._cache = {mood: MoodPool(talks) for mood, talks in moods.items()}
         return cls._cache
 
     @classmethod
-    def random(cls, mood: str = "success") -> str:  # mood: success | skip
-        """Return a random pep talk for the given mood."""
-        # Retrieve the list for the requested mood, falling back to an
-        # empty list if the mood doesn't exist in the JSON file.
-        pool = cls._load().get(mood, [])
-        if not pool:
+    def _recent_ring(cls) -> Deque[str]:
+        """Return the persisted ring of recently shown talk texts."""
+        if cls._recent is None:
+            try:
+                items = json.loads(TALK_RECENT_PATH.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                items = []
+            cls._recent = deque(
+                (str(i) for i in items if isinstance(i, str)), maxlen=RECENT_WINDOW
+            )
+        return cls._recent
+
+    @classmethod
+    def _remember(cls, text: str) -> None:
+        """Add ``text`` to the recent ring and persist it."""
+        ring = cls._recent_ring()
+        ring.append(text)
+        try:
+            TALK_RECENT_PATH.parent.mkdir(parents=True, exist_ok=True)
+            TALK_RECENT_PATH.write_text(json.dumps(list(ring)), encoding="utf-8")
+        except OSError as exc:
+            logger.debug("Could not persist recent talks: %s", exc)
+
+    @classmethod
+    def pick(cls, mood: str = "success") -> Talk | None:
+        """Return a weighted talk for ``mood`` that was not shown recently."""
+        pool = cls._load().get(mood)
+        if pool is None or not pool.talks:
+            return None
+        # Only as many recent talks can be avoided as the pool can spare.
+        spare = len(pool.talks) - 1
+        avoid = set(list(cls._recent_ring())[-spare:]) if spare else set()
+        talk = pool.talks[pool.sample()]
+        # Rejection sampling keeps each draw O(1) when the window is small
+        # relative to the pool; tiny pools fall back to a linear pick.
+        for _ in range(8):
+            if talk.text not in avoid:
+                break
+            talk = pool.talks[pool.sample()]
+        else:
+            fresh = [t for t in pool.talks if t.text not in avoid]
+            talk = random.choices(fresh, [t.weight for t in fresh])[0]
+        cls._remember(talk.text)
+        return talk
+
+    @classmethod
+    def random(cls, mood: str = "success", **context: Any) -> str:
+        """Return a random pep talk for the given mood.
+
+        Args:
+            mood: ``success`` or ``skip``.
+            **context: Values for template placeholders such as ``goal``.
+        """
+        talk = cls.pick(mood)
+        if talk is None:
             # Default message when no templates are available.
             return "Great job!"
-        # ``random.choice`` provides an even distribution across messages.
-        return random.choice(pool)
+        return talk.render(context)
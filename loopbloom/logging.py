@@ -1,43 +1,123 @@
+"""Logging setup shared by every entry point.
+
+Records are put on an in-memory queue by a :class:`QueueHandler` on the
+root logger and written by a :class:`QueueListener` thread, so commands
+never wait on log file I/O or rotation. The listener is started once per
+process; later calls to :func:`setup_logging` (the daemon and the shell
+run one per command) only adjust the level and format. Set
+``log_format = "json"`` in ``config.toml`` for one JSON object per line.
+"""
+
+import atexit
+import copy
+import json
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict
 
-from loopbloom.core.config import APP_DIR
+from loopbloom.core import config as cfg
 
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
-def setup_logging(level: int = logging.INFO) -> None:
-    """Configure the root logger with a rotating file handler.
+# Attributes every ``LogRecord`` has; anything else was passed via ``extra``.
+_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
 
-    Args:
-        level: Logging level used for the root logger. Defaults to ``INFO``.
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as a single-line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return ``record`` as JSON including any ``extra`` fields."""
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """Queue handler that leaves exception details to the target's formatter.
+
+    The stock :meth:`QueueHandler.prepare` renders the traceback into the
+    message and clears ``exc_info``, which would leave :class:`JsonFormatter`
+    nothing to put under ``"exc"``. The queue never leaves the process, so
+    the record can keep its exception as is.
     """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of ``record`` with its message merged with args."""
+        record = copy.copy(record)
+        # Merge now: the arguments may change before the listener runs.
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+# The process-wide queue pipeline: (queue handler, listener, target handler).
+_pipeline: tuple[QueueHandler, QueueListener, logging.Handler] | None = None
+
+
+def _target() -> logging.Handler:
+    """Return the handler that writes records out."""
     # Prefer file logging, but fall back to stderr when the config directory
     # is not writable (e.g. in sandboxed environments).
-    handler: logging.Handler
-    log_file: Path | None = None
     try:
-        log_dir = APP_DIR / "logs"
+        log_dir = cfg.APP_DIR / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / "loopbloom.log"
-        handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=3)
+        return RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=3)
     except Exception:
-        handler = logging.StreamHandler()
+        return logging.StreamHandler()
 
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-    handler.setFormatter(formatter)
 
-    root_logger = logging.getLogger()
+def _stop() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _pipeline
+    if _pipeline is None:
+        return
+    handler, listener, target = _pipeline
+    _pipeline = None
+    logging.getLogger().removeHandler(handler)
+    listener.stop()
+    target.close()
+
 
+def setup_logging(level: int = logging.INFO, fmt: str | None = None) -> None:
+    """Route the root logger through a background queue listener.
+
+    Args:
+        level: Logging level used for the root logger. Defaults to ``INFO``.
+        fmt: ``"text"`` or ``"json"``; defaults to the ``log_format``
+            config setting.
+    """
+    global _pipeline
+    if fmt is None:
+        fmt = str(cfg.load().get("log_format", "text"))
+    root_logger = logging.getLogger()
+    if _pipeline is None:
+        target = _target()
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = QueueListener(records, target, respect_handler_level=True)
+        listener.start()
+        _pipeline = (_QueueHandler(records), listener, target)
+        atexit.register(_stop)
+    handler, _, target = _pipeline
+    target.setFormatter(
+        JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT)
+    )
     # Avoid adding duplicate handlers if called multiple times
-    def _same_handler(h: logging.Handler) -> bool:
-        if (
-            isinstance(handler, RotatingFileHandler)
-            and isinstance(h, RotatingFileHandler)
-            and log_file is not None
-        ):
-            return Path(h.baseFilename) == log_file
-        return type(h) is type(handler)
-
-    if not any(_same_handler(h) for h in root_logger.handlers):
+    if handler not in root_logger.handlers:
         root_logger.addHandler(handler)
     root_logger.setLevel(level)
@@ -0,0 +1,98 @@
+"""Run follow-up work off the command's critical path.
+
+Commands queue jobs such as notifications with
+:meth:`BackgroundTasks.defer`. The jobs are held until the command's
+changes have been written (see :func:`loopbloom.cli.with_goals`) and then
+run in order on a single daemon worker thread. The CLI waits for them with
+a bounded :meth:`BackgroundTasks.join` when it exits, so a slow desktop
+notification can delay the process by at most ``JOIN_TIMEOUT`` seconds.
+
+Work whose output must not be lost, such as progression feedback, is
+registered with :meth:`BackgroundTasks.after_save` instead; it runs on the
+calling thread right after the background jobs have been handed off.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import queue
+import threading
+from functools import partial
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds the CLI waits for queued jobs before exiting.
+JOIN_TIMEOUT = 5.0
+
+Job = Callable[[], None]
+
+
+class BackgroundTasks:
+    """FIFO queue of jobs executed by one lazily started worker thread."""
+
+    def __init__(self) -> None:
+        self._pending: List[Job] = []
+        self._foreground: List[Job] = []
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    def defer(self, job: Job) -> None:
+        """Hold ``job`` until :meth:`start` is called."""
+        # Run it with the caller's context, e.g. the command's clock.
+        self._pending.append(partial(contextvars.copy_context().run, job))
+
+    def after_save(self, job: Job) -> None:
+        """Run ``job`` on the calling thread when :meth:`start` is called."""
+        self._foreground.append(job)
+
+    def start(self) -> None:
+        """Hand deferred jobs to the worker, then run foreground jobs."""
+        self._start_worker()
+        foreground, self._foreground = self._foreground, []
+        for job in foreground:
+            job()
+
+    def _start_worker(self) -> None:
+        """Queue all deferred jobs on the worker thread in order."""
+        if not self._pending:
+            return
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="loopbloom-tasks", daemon=True
+            )
+            self._worker.start()
+        for job in self._pending:
+            self._queue.put(job)
+        self._pending.clear()
+
+    def join(self, timeout: float = JOIN_TIMEOUT) -> bool:
+        """Wait up to ``timeout`` seconds for started jobs to finish.
+
+        Returns:
+            bool: ``True`` if every job finished, ``False`` on timeout.
+        """
+        worker = self._worker
+        if worker is None:
+            return True
+        # Ask the worker to stop once the queue is drained.
+        self._queue.put(None)
+        worker.join(timeout)
+        if worker.is_alive():
+            logger.warning("Background jobs still running after %.1fs", timeout)
+            return False
+        self._worker = None
+        return True
+
+    def _run(self) -> None:
+        """Worker loop executing jobs until the ``None`` sentinel arrives."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception:  # pragma: no cover - defensive
+                # A failing follow-up must never affect the saved check-in.
+                logger.exception("Background job failed")
@@ -1,13 +1,107 @@
+"""Clock service resolving "now" for the rest of the application.
+
+Every command runs under its own :class:`Clock` (see :func:`use_clock`),
+which resolves the time once and then keeps answering with that instant,
+so one invocation never sees two different days even if it runs across
+midnight. Outside an invocation the default clock stays live. The clock
+in effect is a context variable, so threads (the API server's requests,
+background jobs) each see their own. The ``LOOPBLOOM_DEBUG_DATE``
+override (``YYYY-MM-DD``) is parsed once per distinct value rather than
+on every call.
+
+Tests can pin the time without touching the environment; commands run
+inside the block keep the pinned clock::
+
+    with use_clock(Clock(datetime(2024, 3, 5))):
+        ...
+"""
+
+from __future__ import annotations
+
 import os
-from datetime import datetime
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from typing import Iterator, Tuple
 
+DEBUG_DATE_ENV = "LOOPBLOOM_DEBUG_DATE"
 
-def get_current_datetime() -> datetime:
-    """Return the current datetime allowing override via env var."""
-    debug_date_str = os.environ.get("LOOPBLOOM_DEBUG_DATE")
-    if debug_date_str:
+# Last override seen in the environment and what it parsed to.
+_override: Tuple[str, datetime | None] | None = None
+
+
+def _debug_date() -> datetime | None:
+    """Return the ``LOOPBLOOM_DEBUG_DATE`` override, ``None`` if unset/invalid."""
+    global _override
+    raw = os.environ.get(DEBUG_DATE_ENV)
+    if not raw:
+        return None
+    if _override is None or _override[0] != raw:
         try:
-            return datetime.strptime(debug_date_str, "%Y-%m-%d")
+            parsed: datetime | None = datetime.strptime(raw, "%Y-%m-%d")
         except ValueError:
-            return datetime.now()
-    return datetime.now()
+            parsed = None
+        _override = (raw, parsed)
+    return _override[1]
+
+
+class Clock:
+    """Source of the current time."""
+
+    def __init__(self, at: datetime | None = None, *, freeze: bool = True) -> None:
+        """Create a clock.
+
+        Args:
+            at: Fixed instant to report; resolved on first use when omitted.
+            freeze: Keep reporting the first resolved instant. A clock
+                with ``freeze=False`` and no ``at`` follows the wall clock.
+        """
+        self._at = at
+        self.freeze = freeze
+        # Clocks built with a fixed instant are kept by nested invocations.
+        self.pinned = at is not None
+
+    def now(self) -> datetime:
+        """Return the current datetime."""
+        if self._at is not None:
+            return self._at
+        now = _debug_date() or datetime.now()
+        if self.freeze:
+            self._at = now
+        return now
+
+    def today(self) -> date:
+        """Return the current date."""
+        return self.now().date()
+
+
+# Clock used outside any :func:`use_clock` block; it follows the wall clock.
+_live = Clock(freeze=False)
+_clock: ContextVar[Clock] = ContextVar("loopbloom_clock")
+
+
+def current_clock() -> Clock:
+    """Return the clock in effect."""
+    return _clock.get(_live)
+
+
+@contextmanager
+def use_clock(clock: Clock | None = None) -> Iterator[Clock]:
+    """Install ``clock`` for the block.
+
+    Without ``clock`` a fresh frozen clock is installed, unless the clock
+    in effect is pinned to a fixed instant, which then stays in effect.
+    """
+    if clock is None:
+        previous = current_clock()
+        clock = previous if previous.pinned else Clock()
+    token = _clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _clock.reset(token)
+
+
+def get_current_datetime() -> datetime:
+    """Return the current datetime according to the clock in effect."""
+    return current_clock().now()
@@ -0,0 +1,404 @@
+"""Bulk import of check-in history.
+
+Sources are LoopBloom exports (CSV, JSON or NDJSON, optionally gzipped)
+and common habit-tracker CSV layouts: a long table with one row per
+check-in, or a wide table with a ``Date`` column followed by one column per
+habit (the Loop Habit Tracker ``Checkmarks.csv`` layout).
+
+Rows are parsed lazily, validated in fixed-size batches and grouped by
+micro-goal so each target is resolved once per batch rather than once per
+row. Everything is merged into an in-memory goal graph; callers persist it
+with a single save.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from loopbloom.core.models import Checkin, GoalArea, MicroGoal, Phase
+from loopbloom.storage.streaming import iter_json_array
+
+BATCH_SIZE = 10_000
+
+CHECKINS_ADAPTER: TypeAdapter[List[Checkin]] = TypeAdapter(List[Checkin])
+
+# Header aliases for long-format CSVs, compared case-insensitively.
+DATE_COLUMNS = ("date", "day", "timestamp")
+GOAL_COLUMNS = ("goal", "area", "category")
+PHASE_COLUMNS = ("phase",)
+MICRO_COLUMNS = ("micro", "habit", "habit name", "name", "task")
+SUCCESS_COLUMNS = ("success", "completed", "done", "status", "value", "result")
+NOTE_COLUMNS = ("note", "notes", "comment", "comments")
+
+TRUE_VALUES = frozenset({"1", "2", "true", "t", "yes", "y", "x", "done", "success"})
+FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "skip", "skipped", "fail"})
+SUCCESS_VALUES = {
+    **dict.fromkeys(TRUE_VALUES, True),
+    **dict.fromkeys(FALSE_VALUES, False),
+}
+# Loop Habit Tracker marks days without data as -1 (unknown) or 3 (skipped
+# by frequency); neither represents a check-in.
+WIDE_EMPTY_VALUES = frozenset({"", "-1", "3"})
+
+
+class ImportFormatError(RuntimeError):
+    """Raised when an import source cannot be understood."""
+
+
+class RawRow(NamedTuple):
+    """One unvalidated check-in taken from an import source."""
+
+    goal: str
+    phase: str
+    micro: str
+    date: str
+    success: str
+    note: str
+
+
+@dataclass
+class ImportReport:
+    """Counts describing what an import changed."""
+
+    rows: int = 0
+    added: int = 0
+    duplicates: int = 0
+    goals_created: int = 0
+    micros_created: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def detect_format(path: Path) -> str:
+    """Guess ``csv``, ``json`` or ``ndjson`` from ``path``'s suffixes."""
+    suffixes = [s.lower() for s in path.suffixes if s.lower() != ".gz"]
+    ext = suffixes[-1] if suffixes else ""
+    if ext in (".ndjson", ".jsonl"):
+        return "ndjson"
+    if ext == ".json":
+        return "json"
+    if ext in (".csv", ".tsv", ".txt"):
+        return "csv"
+    raise ImportFormatError(f"Cannot detect format of {path.name}; use --fmt.")
+
+
+def _open_text(path: Path) -> IO[str]:
+    """Open ``path`` for reading, transparently decompressing ``.gz`` files."""
+    if path.suffix.lower() == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return path.open("r", encoding="utf-8-sig", newline="")
+
+
+def _pick(header: List[str], aliases: Tuple[str, ...]) -> int | None:
+    """Return the index of the first column in ``header`` matching ``aliases``."""
+    lowered = [h.strip().lower() for h in header]
+    for alias in aliases:
+        if alias in lowered:
+            return lowered.index(alias)
+    return None
+
+
+def _iter_csv(fp: IO[str], default_goal: str) -> Iterator[Tuple[int, RawRow]]:
+    """Yield ``(line, row)`` pairs from a long- or wide-format CSV."""
+    reader = csv.reader(fp)
+    header = next(reader, None)
+    if header is None:
+        return
+    d_idx = _pick(header, DATE_COLUMNS)
+    if d_idx is None:
+        raise ImportFormatError("CSV has no date column.")
+    g_idx = _pick(header, GOAL_COLUMNS)
+    p_idx = _pick(header, PHASE_COLUMNS)
+    m_idx = _pick(header, MICRO_COLUMNS)
+    s_idx = _pick(header, SUCCESS_COLUMNS)
+    n_idx = _pick(header, NOTE_COLUMNS)
+    o_idx = _pick(header, ("op",))
+
+    width = len(header)
+
+    def col(idx: int | None) -> int:
+        # Missing columns point at a padding cell appended to every row.
+        return width if idx is None else idx
+
+    if m_idx is None and s_idx is None:
+        # Wide layout: every other named column is a habit.
+        habits = [
+            (i, h.strip()) for i, h in enumerate(header) if i != d_idx and h.strip()
+        ]
+        for values in reader:
+            if len(values) < width:
+                values += [""] * (width - len(values))
+            day = values[d_idx].strip()
+            for i, habit in habits:
+                value = values[i].strip()
+                if value in WIDE_EMPTY_VALUES:
+                    continue
+                success = "0" if value.lower() in FALSE_VALUES else "1"
+                yield reader.line_num, RawRow(default_goal, "", habit, day, success, "")
+        return
+
+    if m_idx is None:
+        raise ImportFormatError("CSV has no habit/micro column.")
+    gi, pi, mi, si, ni, oi = (
+        col(i) for i in (g_idx, p_idx, m_idx, s_idx, n_idx, o_idx)
+    )
+    for values in reader:
+        if not "".join(values).strip():
+            continue
+        if len(values) < width:
+            values += [""] * (width - len(values))
+        values.append("")
+        # Incremental exports may contain bookkeeping rows; only inserts
+        # carry check-ins.
+        if values[oi] not in ("", "insert"):
+            continue
+        yield reader.line_num, RawRow(
+            values[gi].strip() or default_goal,
+            values[pi].strip(),
+            values[mi].strip(),
+            values[d_idx].strip(),
+            values[si].strip() or "1",
+            values[ni],
+        )
+
+
+def _row_from_mapping(obj: Dict[str, Any], default_goal: str) -> RawRow:
+    """Convert an exported row object into a :class:`RawRow`."""
+    success = obj.get("success", "1")
+    if isinstance(success, bool):
+        success = "1" if success else "0"
+    return RawRow(
+        str(obj.get("goal") or default_goal),
+        str(obj.get("phase") or ""),
+        str(obj.get("micro") or ""),
+        str(obj.get("date") or ""),
+        str(success),
+        str(obj.get("note") or ""),
+    )
+
+
+def _is_goal_object(obj: Any) -> bool:
+    return isinstance(obj, dict) and ("phases" in obj or "micro_goals" in obj)
+
+
+def iter_items(
+    path: Path, fmt: str, default_goal: str
+) -> Iterator[Tuple[int, RawRow | Dict[str, Any]]]:
+    """Yield ``(position, item)`` pairs from ``path``.
+
+    Items are either :class:`RawRow` check-ins or raw goal-area mappings as
+    written by ``export --fmt json``/``ndjson``. The file is read lazily.
+    """
+    with _open_text(path) as fp:
+        if fmt == "csv":
+            yield from _iter_csv(fp, default_goal)
+            return
+        if fmt == "json":
+            objects: Iterable[Tuple[int, Any]] = enumerate(iter_json_array(fp), 1)
+        else:
+            objects = (
+                (n, json.loads(line)) for n, line in enumerate(fp, 1) if line.strip()
+            )
+        for pos, obj in objects:
+            if _is_goal_object(obj):
+                yield pos, obj
+            elif isinstance(obj, dict):
+                if obj.get("op", "insert") not in ("", "insert"):
+                    continue
+                yield pos, _row_from_mapping(obj, default_goal)
+            else:
+                raise ImportFormatError(f"Unsupported item at position {pos}.")
+
+
+def _normalize_date(text: str) -> str:
+    # Accept full ISO timestamps by keeping only the calendar day.
+    if len(text) > 10 and text[10] in "T ":
+        return text[:10]
+    return text
+
+
+def _parse_success(text: str) -> bool:
+    value = SUCCESS_VALUES.get(text)
+    if value is None:
+        value = SUCCESS_VALUES.get(text.lower())
+    if value is None:
+        raise ValueError(f"unrecognised success value {text!r}")
+    return value
+
+
+class BulkImporter:
+    """Merge imported check-ins into an in-memory goal graph."""
+
+    def __init__(
+        self,
+        goals: List[GoalArea],
+        *,
+        batch_size: int = BATCH_SIZE,
+        skip_invalid: bool = False,
+    ) -> None:
+        """Prepare lookup indexes over ``goals``.
+
+        Args:
+            goals: Goal graph that receives the imported data in place.
+            batch_size: Number of rows validated and grouped at once.
+            skip_invalid: Drop malformed rows instead of failing the import.
+        """
+        self.goals = goals
+        self.batch_size = batch_size
+        self.skip_invalid = skip_invalid
+        self.report = ImportReport()
+        self._goals = {g.name.lower(): g for g in goals}
+        # (goal id, phase name, micro name) -> micro-goal
+        self._micros: Dict[Tuple[str, str, str], MicroGoal] = {}
+        # micro id -> keys of check-ins already present, for de-duplication
+        self._seen: Dict[str, set[Tuple[date, bool, str | None]]] = {}
+        self._touched: Dict[str, MicroGoal] = {}
+
+    def _goal(self, name: str) -> GoalArea:
+        goal = self._goals.get(name.lower())
+        if goal is None:
+            goal = GoalArea(name=name)
+            self.goals.append(goal)
+            self._goals[name.lower()] = goal
+            self.report.goals_created += 1
+        return goal
+
+    def _micro(self, goal_name: str, phase_name: str, micro_name: str) -> MicroGoal:
+        goal = self._goal(goal_name)
+        key = (goal.id, phase_name.lower(), micro_name.lower())
+        hit = self._micros.get(key)
+        if hit is not None:
+            return hit
+        container: List[MicroGoal]
+        if phase_name:
+            phase = next(
+                (p for p in goal.phases if p.name.lower() == phase_name.lower()),
+                None,
+            )
+            if phase is None:
+                phase = Phase(name=phase_name)
+                goal.phases.append(phase)
+            container = phase.micro_goals
+        else:
+            container = goal.micro_goals
+        micro = next(
+            (m for m in container if m.name.lower() == micro_name.lower()), None
+        )
+        if micro is None:
+            micro = MicroGoal(name=micro_name)
+            container.append(micro)
+            self.report.micros_created += 1
+        self._micros[key] = micro
+        self._seen.setdefault(
+            micro.id, {(ci.date, ci.success, ci.note) for ci in micro.checkins}
+        )
+        return micro
+
+    def _extend(self, micro: MicroGoal, checkins: Iterable[Checkin]) -> None:
+        seen = self._seen[micro.id]
+        for ci in checkins:
+            k = (ci.date, ci.success, ci.note)
+            if k in seen:
+                self.report.duplicates += 1
+                continue
+            seen.add(k)
+            micro.checkins.append(ci)
+            self.report.added += 1
+        self._touched[micro.id] = micro
+
+    def _validate(self, batch: List[Tuple[int, RawRow]]) -> List[Checkin | None]:
+        """Validate ``batch`` in one call, recording errors per row."""
+        records: List[Dict[str, Any] | None] = []
+        for pos, row in batch:
+            try:
+                if not row.micro:
+                    raise ValueError("missing habit/micro name")
+                records.append(
+                    {
+                        "date": _normalize_date(row.date),
+                        "success": _parse_success(row.success),
+                        "note": row.note or None,
+                    }
+                )
+            except ValueError as exc:
+                self.report.errors.append(f"{pos}: {exc}")
+                records.append(None)
+        valid = [r for r in records if r is not None]
+        try:
+            validated: Iterator[Checkin] | None = iter(
+                CHECKINS_ADAPTER.validate_python(valid)
+            )
+        except ValidationError:
+            # Rare path: validate row by row to pinpoint the offending rows.
+            validated = None
+        out: List[Checkin | None] = []
+        for (pos, _), record in zip(batch, records, strict=True):
+            if record is None:
+                out.append(None)
+            elif validated is not None:
+                out.append(next(validated))
+            else:
+                try:
+                    out.append(Checkin.model_validate(record))
+                except ValidationError as exc:
+                    msg = exc.errors()[0]["msg"]
+                    self.report.errors.append(f"{pos}: {msg} ({record['date']!r})")
+                    out.append(None)
+        return out
+
+    def _flush(self, batch: List[Tuple[int, RawRow]]) -> None:
+        """Validate ``batch`` and append its check-ins grouped per micro-goal."""
+        groups: Dict[Tuple[str, str, str], List[Checkin]] = {}
+        for (_, row), ci in zip(batch, self._validate(batch), strict=True):
+            if ci is not None:
+                groups.setdefault((row.goal, row.phase, row.micro), []).append(ci)
+        for (goal_name, phase_name, micro_name), checkins in groups.items():
+            micro = self._micro(goal_name, phase_name, micro_name)
+            self._extend(micro, checkins)
+
+    def add_goal(self, raw: Dict[str, Any]) -> None:
+        """Merge a whole exported goal area into the graph."""
+        incoming = GoalArea.model_validate(raw)
+        if incoming.name.lower() not in self._goals:
+            # Unknown goals are adopted as-is, keeping ids and statuses.
+            self.goals.append(incoming)
+            self._goals[incoming.name.lower()] = incoming
+            self.report.goals_created += 1
+            self.report.added += sum(
+                len(m.checkins) for ph in incoming.phases for m in ph.micro_goals
+            ) + sum(len(m.checkins) for m in incoming.micro_goals)
+            return
+        for ph in incoming.phases:
+            for m in ph.micro_goals:
+                self._extend(self._micro(incoming.name, ph.name, m.name), m.checkins)
+        for m in incoming.micro_goals:
+            self._extend(self._micro(incoming.name, "", m.name), m.checkins)
+
+    def run(self, items: Iterable[Tuple[int, RawRow | Dict[str, Any]]]) -> ImportReport:
+        """Consume ``items`` in batches and return the import report."""
+        batch: List[Tuple[int, RawRow]] = []
+        for pos, item in items:
+            if isinstance(item, RawRow):
+                self.report.rows += 1
+                batch.append((pos, item))
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+                    batch = []
+            else:
+                self.add_goal(item)
+            if self.report.errors and not self.skip_invalid:
+                break
+        if batch and (self.skip_invalid or not self.report.errors):
+            self._flush(batch)
+        # Imported history may predate existing check-ins; keep every touched
+        # log chronological so streaks and windows stay correct.
+        for micro in self._touched.values():
+            micro.checkins.sort(key=lambda ci: ci.date)
+        return self.report
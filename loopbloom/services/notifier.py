@@ -1,14 +1,27 @@
-"""Cross-platform desktop notifications via plyer.
+"""Multi-channel notifications.
 
-The :func:`send` helper abstracts away optional dependencies so the rest
-of the codebase can request a notification without worrying about the
-platform.
+The :func:`send` helper fans one event out to every configured channel:
+the terminal, a desktop popup via plyer, an append-only NDJSON feed file
+and a webhook URL. ``notify`` accepts a comma-separated list such as
+``terminal,file``. Channels run concurrently, each with its own timeout,
+so a stalled desktop backend or webhook cannot hold up the others.
+
+Pause rules and channel settings are compiled from the config once and
+reused until ``config.toml`` changes on disk, so sending does not re-read
+the TOML file on every call. With ``notify_outbox`` enabled events are
+queued in :mod:`loopbloom.services.outbox` instead of delivered.
 """
 
 from __future__ import annotations
 
+import json
+import logging
+import threading
+import urllib.request
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Literal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Sequence, Tuple
 
 from loopbloom.core import config as cfg
 from loopbloom.services.datetime import get_current_datetime
@@ -19,14 +32,223 @@ except ImportError:  # pragma: no cover
     # ``plyer`` is optional; fall back to terminal notifications if missing.
     notification = None
 
-NotifyMode = Literal["terminal", "desktop", "none"]
+logger = logging.getLogger(__name__)
+
+NotifyMode = Literal["terminal", "desktop", "file", "webhook", "none"]
+
+# Seconds each channel may take before it is abandoned.
+DEFAULT_TIMEOUTS: Dict[str, float] = {
+    "terminal": 1.0,
+    "desktop": 5.0,
+    "file": 2.0,
+    "webhook": 3.0,
+}
+
+
+def _parse_date(value: Any) -> date | None:
+    """Return ``value`` as a date or ``None`` when unset or malformed."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class NotifySettings:
+    """Pause rules and channel options compiled from the config."""
+
+    pause_until: date | None = None
+    goal_pauses: Dict[str, date] = field(default_factory=dict)
+    feed_path: Path | None = None
+    webhook_url: str = ""
+    timeouts: Dict[str, float] = field(default_factory=dict)
+    outbox: bool = False
+
+    @classmethod
+    def from_config(cls, conf: Dict[str, Any]) -> "NotifySettings":
+        """Compile ``conf`` into ready-to-use settings."""
+        goal_pauses = {}
+        for name, until in (conf.get("goal_pauses") or {}).items():
+            parsed = _parse_date(until)
+            if parsed is not None:
+                goal_pauses[name] = parsed
+        feed = conf.get("notify_file") or cfg.APP_DIR / "notifications.ndjson"
+        timeouts = {**DEFAULT_TIMEOUTS, **(conf.get("notify_timeouts") or {})}
+        return cls(
+            pause_until=_parse_date(conf.get("pause_until")),
+            goal_pauses=goal_pauses,
+            feed_path=Path(feed).expanduser(),
+            webhook_url=str(conf.get("notify_webhook") or ""),
+            timeouts={k: float(v) for k, v in timeouts.items()},
+            outbox=bool(conf.get("notify_outbox")),
+        )
+
+    def paused(self, goal: str | None, today: date) -> bool:
+        """Return ``True`` if notifications for ``goal`` are paused on ``today``."""
+        if self.pause_until is not None and today <= self.pause_until:
+            return True
+        until = self.goal_pauses.get(goal) if goal else None
+        return until is not None and today <= until
+
+
+# (config path, mtime, size) the cached settings were compiled from.
+_settings_cache: Tuple[Any, NotifySettings] | None = None
+_settings_lock = threading.Lock()
+
+
+def settings() -> NotifySettings:
+    """Return compiled settings, recompiling only when the config changed."""
+    global _settings_cache
+    path = cfg.CONFIG_PATH
+    try:
+        st = path.stat()
+        key: Any = (str(path), st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        key = (str(path), None, None)
+    with _settings_lock:
+        if _settings_cache is None or _settings_cache[0] != key:
+            _settings_cache = (key, NotifySettings.from_config(cfg.load()))
+        return _settings_cache[1]
+
+
+def _terminal(title: str, message: str, goal: str | None, opts: NotifySettings) -> None:
+    """Display a simple message in the terminal."""
+    print(f"\n🔔  {title}: {message}\n")
+
+
+def _desktop(title: str, message: str, goal: str | None, opts: NotifySettings) -> None:
+    """Show a desktop popup, falling back to the terminal on failure."""
+    if notification is None:
+        print("[yellow]plyer not installed – falling back to terminal")
+        _terminal(title, message, goal, opts)
+        return
+    try:
+        notification.notify(
+            title=title,
+            message=message,
+            timeout=5,
+        )
+    except Exception:
+        # pragma: no cover - plyer may fail without backend
+        print("Desktop notify failed; falling back to terminal")
+        _terminal(title, message, goal, opts)
+
+
+_feed_lock = threading.Lock()
+
+
+def _file(title: str, message: str, goal: str | None, opts: NotifySettings) -> None:
+    """Append the event as one JSON line to the feed file."""
+    assert opts.feed_path is not None
+    line = json.dumps(
+        {
+            "ts": get_current_datetime().isoformat(timespec="seconds"),
+            "title": title,
+            "message": message,
+            "goal": goal,
+        }
+    )
+    opts.feed_path.parent.mkdir(parents=True, exist_ok=True)
+    with _feed_lock, opts.feed_path.open("a", encoding="utf-8") as fp:
+        fp.write(line + "\n")
+
+
+def _webhook(title: str, message: str, goal: str | None, opts: NotifySettings) -> None:
+    """POST the event as JSON to the configured webhook URL."""
+    if not opts.webhook_url.startswith(("http://", "https://")):
+        logger.warning("Webhook channel skipped: notify_webhook is not set")
+        return
+    body = json.dumps({"title": title, "message": message, "goal": goal})
+    req = urllib.request.Request(
+        opts.webhook_url,
+        data=body.encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(req, timeout=opts.timeouts.get("webhook")):
+        pass
+
+
+Channel = Callable[[str, str, "str | None", NotifySettings], None]
+
+CHANNELS: Dict[str, Channel] = {
+    "terminal": _terminal,
+    "desktop": _desktop,
+    "file": _file,
+    "webhook": _webhook,
+}
+
+
+def parse_mode(mode: str | Sequence[str]) -> List[str]:
+    """Split ``mode`` into known channel names, preserving order."""
+    if isinstance(mode, str):
+        names = mode.split(",")
+    elif isinstance(mode, (list, tuple)):
+        names = list(mode)
+    else:
+        # Legacy configs may hold a boolean; treat truthy as terminal.
+        names = ["terminal"] if mode else []
+    channels: List[str] = []
+    for name in (n.strip().lower() for n in names):
+        if name in CHANNELS and name not in channels:
+            channels.append(name)
+        elif name and name != "none" and name not in CHANNELS:
+            logger.warning("Unknown notification channel: %s", name)
+    return channels
+
+
+def dispatch(
+    title: str,
+    message: str,
+    channels: Sequence[str],
+    *,
+    goal: str | None = None,
+    opts: NotifySettings | None = None,
+) -> Dict[str, str]:
+    """Deliver one event to ``channels`` concurrently.
+
+    Each channel runs on its own daemon thread and is waited on for at most
+    its configured timeout; a channel that overruns is abandoned rather
+    than blocking the caller or interpreter shutdown.
+
+    Returns:
+        dict: Channel name mapped to ``ok``, ``error`` or ``timeout``.
+    """
+    opts = opts or settings()
+    results: Dict[str, str] = {}
+
+    def run(name: str) -> None:
+        try:
+            CHANNELS[name](title, message, goal, opts)
+            results[name] = "ok"
+        except Exception:
+            logger.exception("Notification channel %s failed", name)
+            results[name] = "error"
+
+    if list(channels) == ["terminal"]:
+        # Printing cannot stall, so skip the thread hand-off.
+        run("terminal")
+        return results
+    threads = []
+    for name in channels:
+        t = threading.Thread(target=run, args=(name,), daemon=True)
+        t.start()
+        threads.append((name, t))
+    for name, t in threads:
+        t.join(opts.timeouts.get(name, DEFAULT_TIMEOUTS.get(name)))
+        if t.is_alive():
+            logger.warning("Notification channel %s timed out", name)
+            results[name] = "timeout"
+    return results
 
 
 def send(
     title: str,
     message: str,
     *,
-    mode: NotifyMode = "terminal",
+    mode: str | Sequence[str] = "terminal",
     goal: str | None = None,
 ) -> None:  # noqa: D401
     """Deliver a notification to the user.
@@ -34,7 +256,9 @@ def send(
     Args:
         title: Title text for the notification.
         message: Body of the notification.
-        mode: Delivery mechanism; ``terminal``, ``desktop`` or ``none``.
+        mode: Channel name, comma-separated list or sequence of channels
+            (``terminal``, ``desktop``, ``file``, ``webhook``); ``none``
+            disables delivery.
         goal: Optional goal name used when checking pause settings.
 
     Returns:
@@ -43,41 +267,16 @@ def send(
     # ``mode`` determines how we deliver the notification. We honour the user's
     # preference but fall back gracefully when dependencies like ``plyer`` are
     # unavailable.
-    config = cfg.load()
-    pause_until = config.get("pause_until")
-    if pause_until:
-        try:
-            if get_current_datetime().date() <= date.fromisoformat(pause_until):
-                return
-        except ValueError:
-            pass
-    if goal:
-        gp = config.get("goal_pauses", {})
-        until = gp.get(goal)
-        if until:
-            try:
-                if get_current_datetime().date() <= date.fromisoformat(until):
-                    return
-            except ValueError:
-                pass
-
-    if mode == "none":
+    channels = parse_mode(mode)
+    if not channels:
         return
-    if mode == "desktop":
-        if notification is None:
-            print("[yellow]plyer not installed – falling back to terminal")
-            mode = "terminal"
-        else:
-            try:
-                notification.notify(
-                    title=title,
-                    message=message,
-                    timeout=5,
-                )
-                return
-            except Exception:
-                # pragma: no cover - plyer may fail without backend
-                print("Desktop notify failed; falling back to terminal")
-    # terminal fallback
-    # Display a simple message when desktop notifications aren't available.
-    print(f"\n🔔  {title}: {message}\n")
+    opts = settings()
+    if opts.paused(goal, get_current_datetime().date()):
+        return
+    if opts.outbox:
+        # Deferred delivery: ``loopbloom notify flush`` sends a digest later.
+        from loopbloom.services import outbox
+
+        outbox.enqueue(title, message, channels, goal=goal)
+        return
+    dispatch(title, message, channels, goal=goal, opts=opts)
@@ -0,0 +1,202 @@
+"""Disk-backed notification outbox.
+
+With ``notify_outbox`` enabled, :func:`loopbloom.services.notifier.send`
+appends each event as one JSON line to the outbox instead of delivering it.
+:func:`flush` later coalesces the queued events per channel into a single
+digest and delivers each digest once, so a batch run produces one pop-up
+rather than dozens. Flushing is triggered by ``loopbloom notify flush``,
+which is safe to run from cron: an exclusive lock on ``<outbox>.lock``
+makes a second, overlapping flush skip instead of delivering twice.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence
+
+from loopbloom import constants
+from loopbloom.services.datetime import get_current_datetime
+from loopbloom.storage.locking import try_file_lock
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the file holding events claimed by an in-progress flush.
+CLAIM_SUFFIX = ".flushing"
+
+# Suffix the outbox is renamed to before being added to a leftover claim.
+INCOMING_SUFFIX = ".incoming"
+
+# Suffix of the lock file held for the duration of a flush.
+LOCK_SUFFIX = ".lock"
+
+# Maximum distinct lines listed in one digest before summarising the rest.
+DIGEST_LINES = 10
+
+
+@dataclass
+class FlushReport:
+    """Outcome of one :func:`flush` run."""
+
+    events: int = 0
+    digests: int = 0
+    failed: int = 0
+    skipped: bool = False
+
+
+def _outbox_path(path: Path | None) -> Path:
+    """Return ``path`` or the configured outbox location."""
+    return Path(path) if path is not None else constants.OUTBOX_PATH
+
+
+def enqueue(
+    title: str,
+    message: str,
+    channels: Sequence[str],
+    *,
+    goal: str | None = None,
+    path: Path | None = None,
+    ts: str | None = None,
+) -> None:
+    """Append one event for ``channels`` to the outbox.
+
+    ``ts`` keeps the time of a re-queued event; new events are stamped now.
+    """
+    out = _outbox_path(path)
+    line = json.dumps(
+        {
+            "ts": ts or get_current_datetime().isoformat(timespec="seconds"),
+            "title": title,
+            "message": message,
+            "goal": goal,
+            "channels": list(channels),
+        }
+    )
+    out.parent.mkdir(parents=True, exist_ok=True)
+    # A single small ``O_APPEND`` write keeps concurrent writers from
+    # interleaving partial lines.
+    with out.open("a", encoding="utf-8") as fp:
+        fp.write(line + "\n")
+    logger.debug("Queued notification for %s", ",".join(channels))
+
+
+def _read_events(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield events stored in ``path``, skipping corrupt lines."""
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8") as fp:
+        for lineno, line in enumerate(fp, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping corrupt outbox line %d in %s", lineno, path)
+
+
+def pending(path: Path | None = None) -> List[Dict[str, Any]]:
+    """Return queued events, including any claimed by an interrupted flush."""
+    out = _outbox_path(path)
+    claim = out.with_name(out.name + CLAIM_SUFFIX)
+    incoming = out.with_name(out.name + INCOMING_SUFFIX)
+    return [*_read_events(claim), *_read_events(incoming), *_read_events(out)]
+
+
+def digest(events: Sequence[Dict[str, Any]]) -> tuple[str, str]:
+    """Coalesce ``events`` into a single ``(title, message)`` pair."""
+    if len(events) == 1:
+        return events[0]["title"], events[0]["message"]
+    counts = Counter(e["message"] for e in events)
+    lines = [
+        f"• {msg}" + (f" (×{n})" if n > 1 else "")
+        for msg, n in counts.most_common(DIGEST_LINES)
+    ]
+    hidden = len(counts) - DIGEST_LINES
+    if hidden > 0:
+        lines.append(f"… and {hidden} more")
+    return f"LoopBloom digest ({len(events)} updates)", "\n".join(lines)
+
+
+def flush(path: Path | None = None) -> FlushReport:
+    """Deliver queued events as one digest per channel.
+
+    The outbox is first renamed to a claim file so events appended during
+    delivery land in a fresh outbox. Events whose channel fails are
+    re-queued for that channel only, then the claim file is removed. If
+    another flush holds the lock the call returns at once with
+    ``skipped`` set.
+    """
+    out = _outbox_path(path)
+    with try_file_lock(out.with_name(out.name + LOCK_SUFFIX)) as acquired:
+        if not acquired:
+            logger.info("Outbox flush already running; skipping")
+            return FlushReport(skipped=True)
+        return _flush_locked(out)
+
+
+def _append(src: Path, dst: Path) -> None:
+    """Move the events in ``src``, which nobody writes to, onto ``dst``."""
+    with dst.open("a", encoding="utf-8") as fp:
+        fp.write(src.read_text(encoding="utf-8"))
+    src.unlink()
+
+
+def _flush_locked(out: Path) -> FlushReport:
+    """Deliver the outbox at ``out``; the caller holds the flush lock."""
+    from loopbloom.services import notifier
+
+    claim = out.with_name(out.name + CLAIM_SUFFIX)
+    incoming = out.with_name(out.name + INCOMING_SUFFIX)
+    # Leftover claim or incoming files mean an earlier flush was
+    # interrupted; deliver those events together with the new ones. The
+    # outbox is always renamed before it is read, so an event appended
+    # meanwhile lands in a fresh outbox instead of being lost.
+    if incoming.exists():
+        _append(incoming, claim)
+    if out.exists():
+        if claim.exists():
+            os.replace(out, incoming)
+            _append(incoming, claim)
+        else:
+            os.replace(out, claim)
+    events = list(_read_events(claim))
+    report = FlushReport(events=len(events))
+    if not events:
+        claim.unlink(missing_ok=True)
+        return report
+
+    by_channel: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for event in events:
+        for channel in event.get("channels", []):
+            by_channel[channel].append(event)
+
+    opts = notifier.settings()
+    for channel, batch in by_channel.items():
+        title, message = digest(batch)
+        goal = batch[0].get("goal") if len(batch) == 1 else None
+        result = notifier.dispatch(title, message, [channel], goal=goal, opts=opts)
+        report.digests += 1
+        if result.get(channel) != "ok":
+            logger.warning("Re-queuing %d event(s) for %s", len(batch), channel)
+            report.failed += len(batch)
+            for event in batch:
+                enqueue(
+                    event["title"],
+                    event["message"],
+                    [channel],
+                    goal=event.get("goal"),
+                    path=out,
+                    ts=event.get("ts"),
+                )
+    claim.unlink(missing_ok=True)
+    logger.info(
+        "Flushed %d event(s) in %d digest(s), %d failed",
+        report.events,
+        report.digests,
+        report.failed,
+    )
+    return report
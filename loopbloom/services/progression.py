@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from typing import Any, Dict, Iterable
+
+from loopbloom.core import config as cfg
 from loopbloom.core.models import GoalArea
 from loopbloom.core.progression import get_progression_reasons, should_advance
 
@@ -10,11 +13,14 @@ class ProgressionService:
     """Handles the business logic for goal progression."""
 
     @staticmethod
-    def check_progression(goal: GoalArea) -> tuple[bool, list[str]]:
+    def check_progression(
+        goal: GoalArea, *, conf: Dict[str, Any] | None = None
+    ) -> tuple[bool, list[str]]:
         """Assess whether ``goal`` should move to its next micro-habit.
 
         Args:
             goal: The goal area containing the micro-goal hierarchy.
+            conf: Optional pre-loaded ``advance`` config section.
 
         Returns:
             tuple[bool, list[str]]: A flag indicating progression eligibility
@@ -23,6 +29,29 @@ class ProgressionService:
         micro = goal.get_active_micro_goal()
         if micro is None:
             return False, ["No active micro-goal."]
-        should_progress = should_advance(micro)
-        reasons = get_progression_reasons(micro)
+        # Read the config once for both the decision and its explanation.
+        if conf is None:
+            conf = cfg.load().get("advance", {})
+        should_progress = should_advance(micro, conf=conf)
+        reasons = get_progression_reasons(micro, conf=conf)
         return should_progress, reasons
+
+    @classmethod
+    def check_many(
+        cls, goals: Iterable[GoalArea]
+    ) -> list[tuple[GoalArea, bool, list[str]]]:
+        """Evaluate several goals against a single config read.
+
+        Args:
+            goals: Goal areas to evaluate.
+
+        Returns:
+            list[tuple[GoalArea, bool, list[str]]]: One result per goal in the
+            order given.
+        """
+        conf = cfg.load().get("advance", {})
+        results = []
+        for goal in goals:
+            should_progress, reasons = cls.check_progression(goal, conf=conf)
+            results.append((goal, should_progress, reasons))
+        return results
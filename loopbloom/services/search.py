@@ -0,0 +1,482 @@
+"""Full-text search over journal entries, reviews and check-in notes.
+
+Text is kept in a persistent inverted index in the cache directory; it is
+derived data and is rebuilt from scratch if deleted. SQLite
+FTS5 is used when the interpreter's SQLite supports it; otherwise a
+tokenized JSON index provides the same behaviour in pure Python.
+
+The index is synced incrementally before each query. Journal and review
+segments are append-only, so only the bytes past the offset recorded for
+each segment are read. Goals are skipped entirely while the store's
+content hash is unchanged; after saves, only goals reported by the
+store's change feed are rescanned. Check-in notes are tracked per
+micro-goal by count and a digest of the notes already indexed; a
+micro-goal is only re-indexed when earlier notes were edited, or dropped
+when it no longer exists.
+"""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from loopbloom import constants
+from loopbloom.core import segments
+from loopbloom.core.models import GoalArea
+from loopbloom.storage.base import Storage
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("journal", "review", "checkin")
+
+# Bookkeeping source remembering the store content last indexed.
+STORE_SOURCE = "store"
+
+# Characters shown either side of the first match in a result snippet.
+SNIPPET_RADIUS = 40
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# (kind, goal, day, text) for one searchable document.
+Doc = Tuple[str, Optional[str], str, str]
+
+
+@dataclass
+class Hit:
+    """One search result."""
+
+    kind: str
+    goal: Optional[str]
+    day: str
+    text: str
+
+
+def tokenize(text: str) -> List[str]:
+    """Split ``text`` into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def parse_query(query: str) -> List[Tuple[str, bool]]:
+    """Return ``(token, is_prefix)`` terms; a trailing ``*`` marks a prefix."""
+    terms: List[Tuple[str, bool]] = []
+    for raw in query.split():
+        toks = tokenize(raw)
+        terms.extend((tok, False) for tok in toks[:-1])
+        if toks:
+            terms.append((toks[-1], raw.endswith("*")))
+    return terms
+
+
+def snippet(text: str, terms: Sequence[Tuple[str, bool]]) -> str:
+    """Return a one-line excerpt of ``text`` around the first matched term."""
+    flat = " ".join(text.split())
+    lower = flat.lower()
+    hits = [i for i in (lower.find(t) for t, _ in terms) if i >= 0]
+    start = max(min(hits, default=0) - SNIPPET_RADIUS, 0)
+    end = start + 2 * SNIPPET_RADIUS
+    excerpt = flat[start:end]
+    return ("…" if start else "") + excerpt + ("…" if end < len(flat) else "")
+
+
+def fts5_available() -> bool:
+    """Return ``True`` if the bundled SQLite supports FTS5."""
+    try:
+        with sqlite3.connect(":memory:") as conn:
+            conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+class SearchIndex(abc.ABC):
+    """Incremental refresh logic shared by both index backends.
+
+    Subclasses provide document storage through the abstract primitives
+    below; :meth:`refresh` and :meth:`sync` drive them.
+    """
+
+    @abc.abstractmethod
+    def get_state(self, source: str) -> Any:
+        """Return the bookkeeping stored for ``source`` or ``None``."""
+
+    @abc.abstractmethod
+    def put(self, source: str, docs: List[Doc], state: Any, *, reset: bool) -> None:
+        """Add ``docs`` for ``source`` (replacing old ones when ``reset``)."""
+
+    @abc.abstractmethod
+    def drop(self, source: str) -> None:
+        """Remove every document and the state of ``source``."""
+
+    @abc.abstractmethod
+    def sources(self, prefix: str) -> List[str]:
+        """Return indexed sources starting with ``prefix``."""
+
+    @abc.abstractmethod
+    def search(
+        self,
+        terms: Sequence[Tuple[str, bool]],
+        *,
+        goal: str | None = None,
+        since: date | None = None,
+        until: date | None = None,
+        kinds: Sequence[str] = KINDS,
+        limit: int = 20,
+    ) -> List[Hit]:
+        """Return newest-first hits containing every term."""
+
+    @abc.abstractmethod
+    def commit(self) -> None:
+        """Persist pending changes."""
+
+    def close(self) -> None:
+        """Release resources held by the index."""
+        return None
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- refresh -------------------------------------------------------------
+
+    def refresh(self, goals: Iterable[GoalArea]) -> None:
+        """Index everything added or changed since the previous refresh."""
+        self._refresh_all_segments()
+        self._refresh_checkins(goals)
+        self.commit()
+
+    def sync(self, store: Storage) -> None:
+        """Like :meth:`refresh`, reading only what changed in ``store``.
+
+        Goals are not read at all when the store's content is unchanged
+        since the last sync, and only the goals its change feed reports
+        are re-indexed after ordinary saves.
+        """
+        self._refresh_all_segments()
+        content = store.content_hash()
+        generation = store.generation()
+        prev = self.get_state(STORE_SOURCE)
+        changed: Set[str] | None
+        if content is None or prev is None:
+            changed = None
+        elif prev["content"] == content:
+            changed = set()
+        elif prev["generation"] != generation:
+            changed = store.changes_since(prev["generation"])
+        else:
+            # Edited without a save (e.g. by hand): the feed cannot tell.
+            changed = None
+        if changed is None:
+            self._refresh_checkins(store.iter_goals())
+        elif changed:
+            goals = (g for g in store.iter_goals() if g.id in changed)
+            self._refresh_checkins(goals, only=changed)
+        state = {"content": content, "generation": generation}
+        self.put(STORE_SOURCE, [], state, reset=False)
+        self.commit()
+
+    def _refresh_all_segments(self) -> None:
+        """Index new journal and review records."""
+        segments.migrate_legacy(constants.JOURNAL_PATH, constants.JOURNAL_DIR)
+        segments.migrate_legacy(constants.REVIEW_PATH, constants.REVIEW_DIR)
+        self._refresh_segments("journal", constants.JOURNAL_DIR)
+        self._refresh_segments("review", constants.REVIEW_DIR)
+
+    def _refresh_segments(self, kind: str, root: Path) -> None:
+        """Index records appended to ``root`` since their recorded offsets."""
+        present = set()
+        for path in segments.segments(root):
+            source = f"{kind}/{path.name}"
+            present.add(source)
+            offset = self.get_state(source) or 0
+            size = path.stat().st_size
+            if size == offset:
+                continue
+            # A shrunken segment was rewritten (e.g. migration); start over.
+            reset = size < offset
+            start = 0 if reset else offset
+            with path.open("rb") as fp:
+                fp.seek(start)
+                data = fp.read()
+            # Leave a partially written final line for the next refresh.
+            end = data.rfind(b"\n") + 1
+            docs = []
+            for line in data[:end].splitlines():
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                docs.append(_record_doc(kind, obj))
+            self.put(source, docs, start + end, reset=reset)
+        for source in self.sources(f"{kind}/"):
+            if source not in present:
+                self.drop(source)
+
+    def _refresh_checkins(
+        self, goals: Iterable[GoalArea], only: Set[str] | None = None
+    ) -> None:
+        """Index check-in notes, re-indexing micro-goals whose history changed.
+
+        With ``only``, ``goals`` holds just those goal ids and micro-goals of
+        other goals are left alone instead of being dropped.
+        """
+        present = set()
+        for g in goals:
+            micros = [m for ph in g.phases for m in ph.micro_goals]
+            micros.extend(g.micro_goals)
+            for m in micros:
+                source = f"micro:{m.id}"
+                present.add(source)
+                notes = [(str(ci.date), ci.note) for ci in m.checkins if ci.note]
+                prev = self.get_state(source)
+                count = prev["count"] if prev else 0
+                h = hashlib.sha1(g.name.encode("utf-8"))
+                for day, note in notes[:count]:
+                    h.update(f"{day}|{note}\n".encode("utf-8"))
+                reset = prev is not None and (
+                    count > len(notes) or h.hexdigest() != prev["digest"]
+                )
+                if reset:
+                    fresh = notes
+                    h = hashlib.sha1(g.name.encode("utf-8"))
+                else:
+                    fresh = notes[count:]
+                if not fresh and not reset and prev is not None:
+                    if prev.get("goal") == g.id:
+                        continue
+                    fresh = []
+                for day, note in fresh:
+                    h.update(f"{day}|{note}\n".encode("utf-8"))
+                docs: List[Doc] = [("checkin", g.name, day, n) for day, n in fresh]
+                state = {"count": len(notes), "digest": h.hexdigest(), "goal": g.id}
+                self.put(source, docs, state, reset=reset)
+        for source in self.sources("micro:"):
+            if source in present:
+                continue
+            if only is None or (self.get_state(source) or {}).get("goal") in only:
+                self.drop(source)
+
+
+def _record_doc(kind: str, obj: Dict[str, Any]) -> Doc:
+    """Turn a journal or review record into a searchable document."""
+    day = str(obj.get("timestamp", ""))[:10]
+    if kind == "review":
+        return kind, None, day, f"{obj.get('period', '')}: {obj.get('went_well', '')}"
+    return kind, obj.get("goal"), day, str(obj.get("text", ""))
+
+
+class FTSIndex(SearchIndex):
+    """Index stored in an SQLite FTS5 table."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5("
+            "text, kind UNINDEXED, goal UNINDEXED, day UNINDEXED, "
+            "source UNINDEXED)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sources (source TEXT PRIMARY KEY, state TEXT)"
+        )
+
+    def get_state(self, source: str) -> Any:
+        row = self._conn.execute(
+            "SELECT state FROM sources WHERE source = ?", (source,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, source: str, docs: List[Doc], state: Any, *, reset: bool) -> None:
+        if reset:
+            self._conn.execute("DELETE FROM docs WHERE source = ?", (source,))
+        self._conn.executemany(
+            "INSERT INTO docs (text, kind, goal, day, source) VALUES (?, ?, ?, ?, ?)",
+            [(text, kind, goal, day, source) for kind, goal, day, text in docs],
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sources (source, state) VALUES (?, ?)",
+            (source, json.dumps(state)),
+        )
+
+    def drop(self, source: str) -> None:
+        self._conn.execute("DELETE FROM docs WHERE source = ?", (source,))
+        self._conn.execute("DELETE FROM sources WHERE source = ?", (source,))
+
+    def sources(self, prefix: str) -> List[str]:
+        rows = self._conn.execute(
+            "SELECT source FROM sources WHERE substr(source, 1, ?) = ?",
+            (len(prefix), prefix),
+        )
+        return [r[0] for r in rows]
+
+    def search(
+        self,
+        terms: Sequence[Tuple[str, bool]],
+        *,
+        goal: str | None = None,
+        since: date | None = None,
+        until: date | None = None,
+        kinds: Sequence[str] = KINDS,
+        limit: int = 20,
+    ) -> List[Hit]:
+        if not terms:
+            return []
+        match = " ".join(f'"{tok}"' + ("*" if prefix else "") for tok, prefix in terms)
+        sql = "SELECT kind, goal, day, text FROM docs WHERE docs MATCH ?"
+        params: List[Any] = [match]
+        if goal:
+            sql += " AND lower(goal) = lower(?)"
+            params.append(goal)
+        if since:
+            sql += " AND day >= ?"
+            params.append(since.isoformat())
+        if until:
+            sql += " AND day <= ?"
+            params.append(until.isoformat())
+        sql += f" AND kind IN ({', '.join('?' * len(kinds))})"
+        params.extend(kinds)
+        sql += " ORDER BY day DESC, rowid DESC LIMIT ?"
+        params.append(limit)
+        return [Hit(*row) for row in self._conn.execute(sql, params)]
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class TokenIndex(SearchIndex):
+    """Pure-Python inverted index persisted as a JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._dirty = False
+        data: Dict[str, Any] = {}
+        if path.exists():
+            with path.open("r", encoding="utf-8") as fp:
+                data = json.load(fp)
+        self._sources: Dict[str, Any] = data.get("sources", {})
+        # doc id -> [kind, goal, day, text, source]
+        self._docs: Dict[str, List[Any]] = data.get("docs", {})
+        self._postings: Dict[str, List[str]] = data.get("postings", {})
+        self._next_id: int = data.get("next_id", 0)
+
+    def get_state(self, source: str) -> Any:
+        return self._sources.get(source)
+
+    def put(self, source: str, docs: List[Doc], state: Any, *, reset: bool) -> None:
+        if reset:
+            self._remove_docs(source)
+        for kind, goal, day, text in docs:
+            doc_id = str(self._next_id)
+            self._next_id += 1
+            self._docs[doc_id] = [kind, goal, day, text, source]
+            for tok in set(tokenize(text)):
+                self._postings.setdefault(tok, []).append(doc_id)
+        self._sources[source] = state
+        self._dirty = True
+
+    def _remove_docs(self, source: str) -> None:
+        """Delete the documents of ``source`` and their postings."""
+        for doc_id, doc in list(self._docs.items()):
+            if doc[4] != source:
+                continue
+            for tok in set(tokenize(doc[3])):
+                ids = self._postings.get(tok, [])
+                if doc_id in ids:
+                    ids.remove(doc_id)
+                if not ids:
+                    self._postings.pop(tok, None)
+            del self._docs[doc_id]
+
+    def drop(self, source: str) -> None:
+        self._remove_docs(source)
+        self._sources.pop(source, None)
+        self._dirty = True
+
+    def sources(self, prefix: str) -> List[str]:
+        return [s for s in self._sources if s.startswith(prefix)]
+
+    def _matching(self, tok: str, prefix: bool) -> set[str]:
+        """Return ids of documents containing ``tok`` (or a word it prefixes)."""
+        if not prefix:
+            return set(self._postings.get(tok, ()))
+        ids: set[str] = set()
+        for word, postings in self._postings.items():
+            if word.startswith(tok):
+                ids.update(postings)
+        return ids
+
+    def search(
+        self,
+        terms: Sequence[Tuple[str, bool]],
+        *,
+        goal: str | None = None,
+        since: date | None = None,
+        until: date | None = None,
+        kinds: Sequence[str] = KINDS,
+        limit: int = 20,
+    ) -> List[Hit]:
+        if not terms:
+            return []
+        # Intersect the rarest term first to keep the candidate set small.
+        sets = sorted((self._matching(t, p) for t, p in terms), key=len)
+        ids = set.intersection(*sets)
+        lo = since.isoformat() if since else ""
+        hi = until.isoformat() if until else "9999-99-99"
+        wanted = goal.lower() if goal else None
+        hits = []
+        for doc_id in ids:
+            kind, g, day, text, _ = self._docs[doc_id]
+            if kind not in kinds or not lo <= day <= hi:
+                continue
+            if wanted is not None and (g or "").lower() != wanted:
+                continue
+            hits.append((day, int(doc_id), Hit(kind, g, day, text)))
+        hits.sort(key=lambda h: (h[0], h[1]), reverse=True)
+        return [h[2] for h in hits[:limit]]
+
+    def commit(self) -> None:
+        if not self._dirty:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fp:
+            json.dump(
+                {
+                    "version": 1,
+                    "sources": self._sources,
+                    "docs": self._docs,
+                    "postings": self._postings,
+                    "next_id": self._next_id,
+                },
+                fp,
+            )
+        os.replace(tmp, self._path)
+        self._dirty = False
+
+
+def open_index(base: Path | None = None, *, backend: str = "auto") -> SearchIndex:
+    """Open the search index, preferring FTS5 when ``backend`` is ``auto``.
+
+    Args:
+        base: Index path without extension; defaults to
+            :data:`loopbloom.constants.SEARCH_INDEX_PATH`.
+        backend: ``auto``, ``fts5`` or ``python``.
+    """
+    base = Path(base) if base is not None else constants.SEARCH_INDEX_PATH
+    if backend == "fts5" or (backend == "auto" and fts5_available()):
+        return FTSIndex(base.with_suffix(".db"))
+    logger.debug("FTS5 unavailable; using the pure-Python search index")
+    return TokenIndex(base.with_suffix(".json"))
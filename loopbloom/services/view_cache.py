@@ -0,0 +1,153 @@
+"""Persistent cache of computed summary and report views.
+
+Summary rows, heatmap day counts and success bars depend only on the goal
+data, the configuration and the current day. Their computed values are
+kept as small JSON files under ``CACHE_DIR/views`` named after a hash of
+those three inputs plus the view's own parameters, so repeating a command
+on unchanged data skips loading and aggregating the check-in history.
+
+Entries are derived data and never need invalidating: any change to an
+input produces a different key. Instead the directory is kept under
+:data:`~loopbloom.constants.VIEW_CACHE_BYTES` by deleting the least
+recently used files; a hit refreshes its file's mtime.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from loopbloom import constants
+from loopbloom.core import config as cfg
+from loopbloom.storage.base import Storage
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Bump when the shape of a cached value changes.
+FORMAT_VERSION = 1
+
+
+def _hash(value: Any) -> str:
+    """Return a stable hex digest of the JSON encoding of ``value``."""
+    raw = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def config_hash() -> str:
+    """Return a fingerprint of the effective configuration."""
+    return _hash(cfg.load())
+
+
+class ViewCache:
+    """Directory of JSON values with size-bounded LRU eviction."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+        """Use ``root`` (default ``VIEW_CACHE_DIR``) holding ``max_bytes``."""
+        self.root = root if root is not None else constants.VIEW_CACHE_DIR
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else constants.VIEW_CACHE_BYTES
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Return the value stored under ``key`` or ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+            # Mark the entry as recently used.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable view cache entry %s: %s", path, exc)
+            return None
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` and evict old entries if needed."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(value), encoding="utf-8")
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until under the byte budget."""
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class Views:
+    """Cached views of one store's data as of ``today``."""
+
+    def __init__(
+        self,
+        content: str | None,
+        today: date,
+        cache: ViewCache | None = None,
+        **scope: Any,
+    ) -> None:
+        """Cache views of data fingerprinted ``content``; ``None`` disables.
+
+        ``scope`` holds parameters shared by every view, such as a goal
+        filter applied before the views are computed.
+        """
+        self.content = content
+        self.today = today
+        self.cache = cache if cache is not None else ViewCache()
+        self.scope = scope
+
+    @classmethod
+    def for_store(cls, store: Storage, today: date, **scope: Any) -> "Views":
+        """Return the views of ``store``'s current data."""
+        return cls(store.content_hash(), today, **scope)
+
+    def get(self, view: str, compute: Callable[[], T], **params: Any) -> T:
+        """Return ``compute()`` for ``view``, reusing a cached result.
+
+        ``compute`` must return JSON-compatible data made of lists rather
+        than tuples so hits and misses look the same to the caller.
+        """
+        if self.content is None:
+            return compute()
+        key = _hash(
+            [
+                FORMAT_VERSION,
+                view,
+                self.content,
+                config_hash(),
+                self.today.isoformat(),
+                {**self.scope, **params},
+            ]
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug("View cache hit for %s", view)
+            return cached  # type: ignore[no-any-return]
+        value = compute()
+        try:
+            self.cache.put(key, value)
+        except OSError as exc:
+            logger.warning("Could not write view cache: %s", exc)
+        return value
@@ -7,7 +7,7 @@ mechanism.
 
 from __future__ import annotations
 
-from typing import ContextManager, List, Protocol
+from typing import ContextManager, Iterator, List, Protocol, Set, Tuple
 
 from loopbloom.core.models import GoalArea
 
@@ -16,6 +16,15 @@ class StorageError(RuntimeError):
     """Raised on IO failures."""
 
 
+class ConflictError(StorageError):
+    """Raised when a save collides with changes made by another process."""
+
+    def __init__(self, message: str, goal_ids: List[str]) -> None:
+        super().__init__(message)
+        # Ids of the goals both writers changed (empty when unknown).
+        self.goal_ids = goal_ids
+
+
 class Storage(Protocol):
     """Persistence interface."""
 
@@ -30,12 +39,68 @@ class Storage(Protocol):
             list[GoalArea]: Parsed goal areas from the backend.
         """
 
+    def iter_goals(self) -> Iterator[GoalArea]:
+        """Yield goal areas one at a time without loading the whole graph.
+
+        Backends that can parse their data incrementally should override this
+        so read-only consumers like ``export`` keep memory flat. The default
+        simply walks :meth:`load`.
+        """
+        yield from self.load()
+
     def save(self, goals: List[GoalArea]) -> None:  # noqa: D401
         """Persist the entire goal graph in one operation."""
 
     def save_goal_area(self, goal: GoalArea) -> None:
         """Update or append ``goal`` in storage."""
 
+    def commit(self, goals: List[GoalArea], base: int) -> Tuple[List[GoalArea], int]:
+        """Save ``goals`` that were loaded at generation ``base``.
+
+        Backends tracking generations merge the save with goals another
+        process changed since ``base`` and raise :class:`ConflictError` when
+        both changed the same goal. The default simply saves.
+
+        Returns:
+            The goal graph that was written and its generation.
+        """
+        self.save(goals)
+        return goals, self.generation()
+
+    def snapshot(self) -> Tuple[List[GoalArea], int]:
+        """Return every goal area together with the generation it belongs to.
+
+        Both are read under :meth:`lock`, so a concurrent save cannot pair
+        its new generation with the old data; pass the generation to
+        :meth:`commit`.
+        """
+        with self.lock():
+            return self.load(), self.generation()
+
+    def generation(self) -> int:
+        """Return a number that grows with every save that changes data.
+
+        Backends that do not track changes return ``0``.
+        """
+        return 0
+
+    def changes_since(self, generation: int) -> Set[str] | None:
+        """Return ids of goals added, changed or removed after ``generation``.
+
+        ``None`` means the backend cannot tell (untracked, or ``generation``
+        is too old) and callers should assume everything changed.
+        """
+        return None
+
+    def content_hash(self) -> str | None:
+        """Return a fingerprint of the stored goal data.
+
+        Equal values mean :meth:`load` returns equal goals, so results
+        derived from the data can be reused. ``None`` means the backend
+        cannot tell cheaply.
+        """
+        return None
+
     def lock(self) -> ContextManager[None]:  # noqa: D401
         """Return an advisory lock if the backend supports it."""
         from contextlib import nullcontext
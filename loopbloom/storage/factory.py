@@ -0,0 +1,68 @@
+"""Select and open the configured storage backend.
+
+The backend is chosen from, in order of precedence, an explicit data path
+(whose extension decides between JSON and SQLite), the
+``LOOPBLOOM_STORAGE_BACKEND`` environment variable and the ``storage``
+config key. The CLI, the daemon and embedding callers all share this
+resolution so they agree on which file a command touches.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Mapping, Tuple
+
+from loopbloom.core import config as cfg
+from loopbloom.storage.base import Storage
+from loopbloom.storage.json_store import DEFAULT_PATH as JSON_DEFAULT_PATH
+from loopbloom.storage.json_store import JSONStore
+from loopbloom.storage.sqlite_store import DEFAULT_PATH as SQLITE_DEFAULT_PATH
+from loopbloom.storage.sqlite_store import SQLiteStore
+
+
+def resolve(
+    data_path: str | os.PathLike[str] | None = None,
+    *,
+    env: Mapping[str, str] | None = None,
+    config: Dict[str, Any] | None = None,
+) -> Tuple[str, Path]:
+    """Return the ``(backend, path)`` a store would be opened with.
+
+    Args:
+        data_path: Explicit path, e.g. from ``--data-path``.
+        env: Environment to read overrides from; defaults to ``os.environ``.
+        config: Loaded configuration; read from disk when omitted.
+    """
+    env = os.environ if env is None else env
+    config = cfg.load() if config is None else config
+    backend = env.get("LOOPBLOOM_STORAGE_BACKEND", config.get("storage", "json"))
+    # Precedence: explicit path > env var > config
+    path = data_path or env.get("LOOPBLOOM_DATA_PATH") or config.get("data_path")
+
+    # If an explicit data path is provided, prefer a backend based on
+    # the file extension to avoid mismatches (e.g., tests may set
+    # LOOPBLOOM_DATA_PATH to a JSON file regardless of user config).
+    if path:
+        lower = str(path).lower()
+        if lower.endswith(".json"):
+            backend = "json"
+        elif lower.endswith(".db") or lower.endswith(".sqlite"):
+            backend = "sqlite"
+
+    if backend == "sqlite":
+        return "sqlite", Path(path or SQLITE_DEFAULT_PATH)
+    return "json", Path(path or JSON_DEFAULT_PATH)
+
+
+def open_store(
+    data_path: str | os.PathLike[str] | None = None,
+    *,
+    env: Mapping[str, str] | None = None,
+    config: Dict[str, Any] | None = None,
+) -> Storage:
+    """Open the backend selected by :func:`resolve`."""
+    backend, path = resolve(data_path, env=env, config=config)
+    if backend == "sqlite":
+        return SQLiteStore(path)
+    return JSONStore(path)
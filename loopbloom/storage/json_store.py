@@ -1,19 +1,33 @@
 """JSON-file implementation of :class:`~loopbloom.storage.base.Storage`.
 
 Goals are serialized to a single JSON document on disk making this backend
-easy to inspect and backup.
+easy to inspect and backup. Pep talks are interned in a small
+``<name>.talks.json`` table next to it and check-ins reference them by id;
+files written by older versions, with the text inline, load unchanged and
+are converted on the next save. The generation counter and change feed
+(see :mod:`loopbloom.storage.changes`) live in ``<name>.meta.json``.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, ContextManager, Iterable, List
+from typing import ContextManager, Dict, Iterator, List, Set, Tuple
 
 from loopbloom.constants import JSON_STORE_PATH
 from loopbloom.core.models import GoalArea
 from loopbloom.storage.base import Storage, StorageError
+from loopbloom.storage.changes import ChangeLog, reconcile
+from loopbloom.storage.locking import file_lock
+from loopbloom.storage.streaming import (
+    digest,
+    dump_goal_chunks,
+    iter_json_array,
+    join_chunks,
+    validate_goal,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +44,79 @@ class JSONStore(Storage):
             path: Location of the JSON file used for persistence.
         """
         self._path = Path(path)
+        self._talks_path = self._path.with_name(self._path.stem + ".talks.json")
+        self._meta_path = self._path.with_name(self._path.stem + ".meta.json")
+
+    @property
+    def path(self) -> Path:
+        """Location of the JSON data file."""
+        return self._path
+
+    @property
+    def talks_path(self) -> Path:
+        """Location of the interned pep-talk table next to the data file."""
+        return self._talks_path
+
+    def watched_paths(self) -> List[Path]:
+        """Return the files whose changes alter what :meth:`load` returns."""
+        return [self._path, self._talks_path]
+
+    def _load_talks(self) -> Dict[str, str]:
+        """Return the interned pep-talk table, empty if none was written."""
+        if not self._talks_path.exists():
+            return {}
+        try:
+            with self._talks_path.open("r", encoding="utf-8") as fp:
+                return dict(json.load(fp)["talks"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            # Saving over a data file whose talks cannot be resolved would
+            # drop them for good, so refuse instead.
+            raise StorageError(f"Unreadable talk table {self._talks_path}") from exc
+
+    def _save_talks(self, talks: Dict[str, str]) -> None:
+        """Merge ``talks`` into the table file, writing only if it grew."""
+        existing = self._load_talks()
+        merged = {**existing, **talks}
+        if merged == existing:
+            return
+        # Ids are never dropped, so a data file written before a crash can
+        # still resolve every talk it references.
+        tmp = self._talks_path.with_name(self._talks_path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": 1, "talks": merged}), encoding="utf-8")
+        os.replace(tmp, self._talks_path)
+
+    def _load_meta(self) -> ChangeLog:
+        """Return the change log, starting a new one if none is readable."""
+        try:
+            return ChangeLog.loads(self._meta_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return ChangeLog()
+        except (OSError, ValueError) as exc:
+            logger.warning("Resetting unreadable %s: %s", self._meta_path, exc)
+            return ChangeLog.fresh()
+
+    def _save_meta(self, meta: ChangeLog) -> None:
+        """Atomically replace the change log file."""
+        tmp = self._meta_path.with_name(self._meta_path.name + ".tmp")
+        tmp.write_text(meta.dumps(), encoding="utf-8")
+        os.replace(tmp, self._meta_path)
+
+    def generation(self) -> int:
+        """Return the generation of the last save that changed data."""
+        return self._load_meta().generation
+
+    def changes_since(self, generation: int) -> Set[str] | None:
+        """Return goal ids touched by saves after ``generation``."""
+        return self._load_meta().since(generation)
+
+    def content_hash(self) -> str | None:
+        """Return a fingerprint of the data file's bytes."""
+        # Talk ids are derived from their text, so the data file alone
+        # determines the goals that load.
+        try:
+            return digest(self._path.read_bytes())
+        except FileNotFoundError:
+            return digest(b"[]")
 
     def load(self) -> List[GoalArea]:  # noqa: D401
         """Load goal areas from the JSON data file.
@@ -46,26 +133,77 @@ class JSONStore(Storage):
         try:
             with self._path.open("r", encoding="utf-8") as fp:
                 raw = json.load(fp)
-            goals = [GoalArea.model_validate(obj) for obj in raw]
+            # The table only grows, so reading it after the data covers
+            # every id the data references.
+            talks = self._load_talks()
+            goals = [validate_goal(obj, talks) for obj in raw]
             logger.debug("Loaded %d goal areas", len(goals))
             return goals
         except Exception as exc:  # pragma: no cover
             logger.error("Error loading %s: %s", self._path, exc)
             raise StorageError(str(exc)) from exc
 
+    def iter_goals(self) -> Iterator[GoalArea]:
+        """Yield goal areas while parsing the data file incrementally."""
+        if not self._path.exists():
+            return
+        try:
+            with self._path.open("r", encoding="utf-8") as fp:
+                talks = self._load_talks()
+                for obj in iter_json_array(fp):
+                    yield validate_goal(obj, talks)
+        except StorageError:
+            raise
+        except Exception as exc:  # pragma: no cover
+            logger.error("Error streaming %s: %s", self._path, exc)
+            raise StorageError(str(exc)) from exc
+
     def save(self, goals: List[GoalArea]) -> None:
         """Persist the entire goal graph atomically."""
+        self._save(goals, None)
+
+    def commit(self, goals: List[GoalArea], base: int) -> Tuple[List[GoalArea], int]:
+        """Save ``goals`` loaded at generation ``base``, merging if needed."""
+        return self._save(goals, base)
+
+    def _save(
+        self, goals: List[GoalArea], base: int | None
+    ) -> Tuple[List[GoalArea], int]:
+        """Write ``goals``; with a ``base`` generation reconcile them first."""
         logger.debug("Saving %d goals to %s", len(goals), self._path)
         try:
             # Ensure parent directory exists before writing.
             self._path.parent.mkdir(parents=True, exist_ok=True)
-            with self._path.open("w", encoding="utf-8") as fp:
-                # Use Pydantic v2 JSON-mode dump to serialize dates/datetimes.
-                payload: Iterable[dict[str, Any]] = (
-                    g.model_dump(mode="json") for g in goals
-                )
-                json.dump(list(payload), fp, indent=2)
+            with self.lock():
+                # Pydantic's native encoder serializes dates/datetimes in JSON
+                # mode and stays fast even with indentation enabled.
+                talks: Dict[str, str] = {}
+                chunks = dump_goal_chunks(goals, indent=2, talks=talks)
+                digests = {g.id: digest(c) for g, c in zip(goals, chunks, strict=True)}
+                meta = self._load_meta()
+                if base is not None and meta.generation != base:
+                    goals = reconcile(meta, base, goals, digests, self.load())
+                    logger.info("Merged with changes saved since %d", base)
+                    talks = {}
+                    chunks = dump_goal_chunks(goals, indent=2, talks=talks)
+                    digests = {
+                        g.id: digest(c) for g, c in zip(goals, chunks, strict=True)
+                    }
+                # The table goes first so the data never references missing
+                # ids, and the generation is bumped before the data changes
+                # so a crash in between can only cause a spurious
+                # invalidation. The data file is replaced atomically so
+                # readers see either the old or the new document.
+                self._save_talks(talks)
+                if meta.record(digests):
+                    self._save_meta(meta)
+                tmp = self._path.with_name(self._path.name + ".tmp")
+                tmp.write_bytes(join_chunks(chunks, indent=2))
+                os.replace(tmp, self._path)
             logger.debug("Save successful")
+            return goals, meta.generation
+        except StorageError:
+            raise
         except Exception as exc:  # pragma: no cover
             logger.error("Error saving %s: %s", self._path, exc)
             raise StorageError(str(exc)) from exc
@@ -73,24 +211,25 @@ class JSONStore(Storage):
     def save_goal_area(self, goal: GoalArea) -> None:
         """Persist a single goal area by updating or appending it."""
         goals = self.load()
-        logger.debug(f"Saving goal: {goal.name} (ID: {goal.id})")
+        # Checked once so the loop pays nothing when debug logging is off.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        logger.debug("Saving goal: %s (ID: %s)", goal.name, goal.id)
         found = False
         for i, g in enumerate(goals):
-            logger.debug(f"  Comparing with existing goal: {g.name} (ID: {g.id})")
+            if debug:
+                logger.debug(
+                    "  Comparing with existing goal: %s (ID: %s)", g.name, g.id
+                )
             if g.id == goal.id:
-                logger.debug(f"    Match by ID: {g.id}")
+                logger.debug("    Match by ID: %s", g.id)
                 goals[i] = goal
                 found = True
                 break
         if not found:
-            logger.debug(f"  No match found, appending new goal: {goal.name}")
+            logger.debug("  No match found, appending new goal: %s", goal.name)
             goals.append(goal)
         self.save(goals)
 
-    # Advisory lock not required for single-process Phase 1
     def lock(self) -> ContextManager[None]:
-        """Return an empty context manager when locking isn't required."""
-        from contextlib import nullcontext
-
-        # JSON files don't need locking in single-user mode.
-        return nullcontext()
+        """Return an exclusive lock serialising writers of this data file."""
+        return file_lock(self._path.with_name(self._path.name + ".lock"))
@@ -0,0 +1,69 @@
+"""Inter-process file locks for the storage backends.
+
+The lock is tied to an open lock file, so it is released even if the
+holding process crashes.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+from loopbloom.storage.base import StorageError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    # Windows has no ``fcntl``; fall back to ``msvcrt`` byte-range locks.
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+# Seconds to wait for another writer before giving up.
+LOCK_TIMEOUT = 10.0
+# Pause between attempts while the lock is held elsewhere.
+POLL_INTERVAL = 0.01
+
+
+def _try_lock(fp: IO[bytes]) -> None:
+    """Take the lock without blocking; raise ``OSError`` if it is held."""
+    if fcntl is not None:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:  # pragma: no cover
+        msvcrt.locking(fp.fileno(), msvcrt.LK_NBLCK, 1)
+
+
+@contextmanager
+def try_file_lock(path: Path, timeout: float = 0.0) -> Iterator[bool]:
+    """Try to hold an exclusive lock on ``path`` for the block.
+
+    Yields ``True`` once the lock is held, or ``False`` if another process
+    still holds it after ``timeout`` seconds (by default without waiting).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    with path.open("a+b") as fp:
+        while True:
+            try:
+                _try_lock(fp)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    yield False
+                    return
+                time.sleep(POLL_INTERVAL)
+        yield True
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` for the duration of the block.
+
+    Raises:
+        StorageError: If the lock is not acquired within ``timeout`` seconds.
+    """
+    with try_file_lock(path, timeout) as held:
+        if not held:
+            raise StorageError(f"Timed out waiting for {path}")
+        yield
@@ -0,0 +1,235 @@
+"""Keep a loaded goal graph in memory across several commands.
+
+:class:`SessionStore` wraps a backend and hands the same parsed goal list
+to every command, so long-lived callers such as the daemon and the shell
+pay the load and validation cost once. Saves either write through to the
+backend immediately or are held until :meth:`SessionStore.flush`.
+
+The backend's files are watched by mtime and size: when another process
+changes them and the session holds no unsaved changes, the next
+:meth:`SessionStore.load` re-reads the data. Writes go through
+:meth:`Storage.commit` with the generation the cache was loaded at, so
+changes other processes made to different goals are merged rather than
+overwritten.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+)
+
+from loopbloom.core.models import GoalArea
+from loopbloom.storage.base import ConflictError, Storage
+
+logger = logging.getLogger(__name__)
+
+# (path, mtime in ns, size) per watched file; ``None`` fields when missing.
+Signature = Tuple[Tuple[str, Any, Any], ...]
+
+
+def file_signature(paths: Iterable[Path]) -> Signature:
+    """Return a value that changes whenever any of ``paths`` changes."""
+    sig: List[Tuple[str, Any, Any]] = []
+    for path in paths:
+        try:
+            st = path.stat()
+            sig.append((str(path), st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            sig.append((str(path), None, None))
+    return tuple(sig)
+
+
+class SessionStore(Storage):
+    """Cache the goal graph of ``backend`` in memory."""
+
+    def __init__(self, backend: Storage, *, write_through: bool = True) -> None:
+        """Wrap ``backend``.
+
+        Args:
+            backend: Store the data is read from and written to.
+            write_through: Save to ``backend`` on every :meth:`save`; when
+                ``False`` changes are held until :meth:`flush`.
+        """
+        self.backend = backend
+        self.write_through = write_through
+        self._goals: List[GoalArea] | None = None
+        self._sig: Signature | None = None
+        self._dirty = False
+        # Set while a command holds the list from :meth:`load` without
+        # having saved it back.
+        self._lent = False
+        # Copy of the held changes taken by :meth:`begin_command`.
+        self._checkpoint: List[GoalArea] | None = None
+        self._revision = 0
+        # Backend generation the cached goals were loaded or written at.
+        self._base = 0
+        # Follow-up work of held changes, run once they are written.
+        self._after_flush: List[Callable[[], None]] = []
+
+    @property
+    def dirty(self) -> bool:
+        """``True`` when changes are held that the backend has not seen."""
+        return self._dirty
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped whenever the cached goals are re-read or saved.
+
+        Unlike :meth:`generation` it also notices edits made without the
+        store (e.g. by hand), but values are only comparable within this
+        session.
+        """
+        return self._revision
+
+    def generation(self) -> int:
+        """Return the backend's persistent generation."""
+        return self.backend.generation()
+
+    def changes_since(self, generation: int) -> Set[str] | None:
+        """Return the backend's change feed since ``generation``."""
+        return self.backend.changes_since(generation)
+
+    def content_hash(self) -> str | None:
+        """Return the backend's fingerprint unless changes are held."""
+        return None if self._dirty else self.backend.content_hash()
+
+    def _signature(self) -> Signature | None:
+        """Return the backend's file signature, if it exposes its files."""
+        watched = getattr(self.backend, "watched_paths", None)
+        return file_signature(watched()) if watched is not None else None
+
+    def load(self) -> List[GoalArea]:
+        """Return the cached goals, re-reading them if changed on disk."""
+        if self._goals is not None and not self._dirty:
+            if self._signature() != self._sig:
+                logger.info("Data changed on disk; reloading")
+                self._goals = None
+        if self._goals is None:
+            # Take the signature first so a write racing the load is seen
+            # as a change next time rather than missed.
+            sig = self._signature()
+            self._goals, self._base = self.backend.snapshot()
+            self._sig = sig
+            self._revision += 1
+        self._lent = True
+        return self._goals
+
+    def snapshot(self) -> Tuple[List[GoalArea], int]:
+        """Return the cached goals and the generation they were loaded at."""
+        goals = self.load()
+        return goals, self._base
+
+    def iter_goals(self) -> Iterator[GoalArea]:
+        """Yield the cached goals for read-only consumers."""
+        lent = self._lent
+        yield from self.load()
+        self._lent = lent
+
+    def save(self, goals: List[GoalArea]) -> None:
+        """Adopt ``goals`` and write them unless changes are being held."""
+        self._goals = goals
+        self._lent = False
+        self._revision += 1
+        if self.write_through:
+            self._write(goals)
+        else:
+            self._dirty = True
+
+    def commit(self, goals: List[GoalArea], base: int) -> Tuple[List[GoalArea], int]:
+        """Save ``goals``; the session tracks its own ``base`` generation."""
+        self.save(goals)
+        return self._goals or goals, self._base
+
+    def _write(self, goals: List[GoalArea]) -> None:
+        """Persist ``goals`` to the backend and remember its new state.
+
+        Raises:
+            ConflictError: If another process changed the same goals; the
+                cached graph and held changes are dropped.
+        """
+        try:
+            self._goals, self._base = self.backend.commit(goals, self._base)
+        except ConflictError:
+            self.discard()
+            raise
+        self._sig = self._signature()
+        self._dirty = False
+
+    def after_flush(self, job: Callable[[], None]) -> None:
+        """Run ``job`` once the held changes are written.
+
+        Jobs queued while changes are held, such as a command's
+        notifications, belong to those changes: :meth:`discard` drops them.
+        """
+        self._after_flush.append(job)
+
+    def flush(self) -> bool:
+        """Write held changes to the backend; return ``True`` if any were."""
+        if not self._dirty or self._goals is None:
+            return False
+        self._write(self._goals)
+        jobs, self._after_flush = self._after_flush, []
+        for job in jobs:
+            job()
+        return True
+
+    def discard(self) -> None:
+        """Forget the cached graph and any held changes."""
+        self._goals = None
+        self._sig = None
+        self._dirty = False
+        self._lent = False
+        self._checkpoint = None
+        self._after_flush = []
+
+    def begin_command(self) -> None:
+        """Remember the held changes so :meth:`end_command` can restore them.
+
+        Only needed when later commands may fail or run with ``--dry-run``
+        while changes are held; without held changes the disk copy already
+        serves as the checkpoint.
+        """
+        self._checkpoint = None
+        if self._dirty and self._goals is not None:
+            self._checkpoint = [g.model_copy(deep=True) for g in self._goals]
+
+    def end_command(self) -> None:
+        """Roll back if a command loaded the graph but never saved it back.
+
+        Such a command either failed or ran with ``--dry-run`` and may have
+        left the shared list half-modified. Without held changes the disk
+        copy is the truth, so the cache is simply dropped; otherwise the
+        state from :meth:`begin_command` is restored when one was taken.
+        """
+        if self._lent:
+            if not self._dirty:
+                self.discard()
+            elif self._checkpoint is not None:
+                self._goals = self._checkpoint
+        self._lent = False
+        self._checkpoint = None
+
+    def save_goal_area(self, goal: GoalArea) -> None:
+        """Replace or append ``goal`` in the cached graph and save it."""
+        goals = self.load()
+        for i, g in enumerate(goals):
+            if g.id == goal.id:
+                goals[i] = goal
+                break
+        else:
+            goals.append(goal)
+        self.save(goals)
+
+    def lock(self) -> ContextManager[None]:
+        """Delegate locking to the backend."""
+        return self.backend.lock()
@@ -3,9 +3,11 @@ SQLAlchemy Core for lightweight database access."""
 
 from __future__ import annotations
 
+import codecs
 import json
+from contextlib import closing
 from pathlib import Path
-from typing import List
+from typing import Any, ContextManager, Dict, Iterator, List, Set, Tuple
 
 from sqlalchemy import (
     Column,
@@ -24,6 +26,15 @@ from sqlalchemy.exc import SQLAlchemyError
 from loopbloom.constants import SQLITE_STORE_PATH
 from loopbloom.core.models import GoalArea
 from loopbloom.storage.base import Storage, StorageError
+from loopbloom.storage.changes import ChangeLog, reconcile
+from loopbloom.storage.locking import file_lock
+from loopbloom.storage.streaming import (
+    digest,
+    dump_goal_chunks,
+    iter_json_array,
+    join_chunks,
+    validate_goal,
+)
 
 DEFAULT_PATH = SQLITE_STORE_PATH
 
@@ -38,6 +49,26 @@ raw_table = Table(
     Column("payload", String, nullable=False),
 )
 
+# Each distinct pep talk is stored once; check-ins in the payload refer to
+# it by id.
+talks_table = Table(
+    "talks",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("text", String, nullable=False),
+)
+
+# Key/value metadata; ``changelog`` holds the generation counter and change
+# feed (see :mod:`loopbloom.storage.changes`).
+meta_table = Table(
+    "meta",
+    metadata,
+    Column("key", String, primary_key=True),
+    Column("value", String, nullable=False),
+)
+
+CHANGELOG_KEY = "changelog"
+
 
 class SQLiteStore(Storage):
     """Store goals in a single-row SQLite table."""
@@ -58,30 +89,156 @@ class SQLiteStore(Storage):
         # Create table schema if the DB file didn't exist yet.
         metadata.create_all(self._engine)
 
+    @property
+    def path(self) -> Path:
+        """Location of the SQLite database file."""
+        return self._path
+
+    def watched_paths(self) -> List[Path]:
+        """Return the files whose changes alter what :meth:`load` returns."""
+        # Writers in WAL mode touch the ``-wal`` file before the database.
+        return [self._path, self._path.with_name(self._path.name + "-wal")]
+
+    def _load_talks(self, conn: Any) -> Dict[str, str]:
+        """Return the interned pep-talk table using ``conn``."""
+        rows = conn.execute(select(talks_table.c.id, talks_table.c.text))
+        return {tid: text for tid, text in rows}
+
+    def _load_meta(self, conn: Any) -> ChangeLog:
+        """Return the change log stored in the ``meta`` table."""
+        query = select(meta_table.c.value).where(meta_table.c.key == CHANGELOG_KEY)
+        text = conn.execute(query).scalar()
+        if text is None:
+            return ChangeLog()
+        try:
+            return ChangeLog.loads(text)
+        except ValueError:
+            return ChangeLog.fresh()
+
+    def generation(self) -> int:
+        """Return the generation of the last save that changed data."""
+        try:
+            with self._engine.connect() as conn:
+                return self._load_meta(conn).generation
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise StorageError(str(exc)) from exc
+
+    def changes_since(self, generation: int) -> Set[str] | None:
+        """Return goal ids touched by saves after ``generation``."""
+        try:
+            with self._engine.connect() as conn:
+                return self._load_meta(conn).since(generation)
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise StorageError(str(exc)) from exc
+
+    def content_hash(self) -> str | None:
+        """Return a fingerprint of the stored payload."""
+        try:
+            with self._engine.connect() as conn:
+                payload = conn.execute(select(raw_table.c.payload)).scalar()
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise StorageError(str(exc)) from exc
+        return digest((payload or "[]").encode("utf-8"))
+
     def load(self) -> List[GoalArea]:
         """Load GoalAreas from the SQLite database."""
         try:
             with self._engine.begin() as conn:
                 query = select(raw_table.c.payload)
                 rows = conn.execute(query).scalars().all()
+                talks = self._load_talks(conn) if rows else {}
             if not rows:
                 return []
             # Only one row is ever stored; deserialize its JSON payload.
             data = json.loads(rows[0])
-            return [GoalArea.model_validate(obj) for obj in data]
-        except SQLAlchemyError as exc:  # pragma: no cover
+            return [validate_goal(obj, talks) for obj in data]
+        except (SQLAlchemyError, ValueError) as exc:
+            raise StorageError(str(exc)) from exc
+
+    def iter_goals(self) -> Iterator[GoalArea]:
+        """Yield GoalAreas by reading the payload through a cursor.
+
+        The payload row is located with a plain DB-API cursor and then read
+        through SQLite's incremental blob I/O so the JSON text is never held
+        in memory as a whole. Python builds without ``blobopen`` (3.10) fall
+        back to fetching the payload in one piece.
+        """
+        try:
+            with closing(self._engine.raw_connection()) as raw:
+                dbapi: Any = raw.driver_connection
+                cur = dbapi.cursor()
+                cur.execute("SELECT id, text FROM talks")
+                talks = dict(cur.fetchall())
+                cur.execute("SELECT id FROM raw_json ORDER BY id LIMIT 1")
+                row = cur.fetchone()
+                if row is None:
+                    return
+                if hasattr(dbapi, "blobopen"):
+                    with dbapi.blobopen("raw_json", "payload", row[0]) as blob:
+                        reader = codecs.getreader("utf-8")(blob)
+                        for obj in iter_json_array(reader):
+                            yield validate_goal(obj, talks)
+                    return
+                cur.execute("SELECT payload FROM raw_json WHERE id = ?", row)
+                (payload,) = cur.fetchone()
+            for obj in json.loads(payload):
+                yield validate_goal(obj, talks)
+        except (SQLAlchemyError, ValueError) as exc:
             raise StorageError(str(exc)) from exc
 
     def save(self, goals: List[GoalArea]) -> None:
         """Persist GoalAreas atomically."""
-        payload = json.dumps([g.model_dump(mode="json") for g in goals])
+        self._save(goals, None)
+
+    def commit(self, goals: List[GoalArea], base: int) -> Tuple[List[GoalArea], int]:
+        """Save ``goals`` loaded at generation ``base``, merging if needed."""
+        return self._save(goals, base)
+
+    def _save(
+        self, goals: List[GoalArea], base: int | None
+    ) -> Tuple[List[GoalArea], int]:
+        """Write ``goals``; with a ``base`` generation reconcile them first."""
+        talks: Dict[str, str] = {}
+        chunks = dump_goal_chunks(goals, talks=talks)
+        digests = {g.id: digest(c) for g, c in zip(goals, chunks, strict=True)}
         try:
-            with self._engine.begin() as conn:
-                # Replace the single row with the new payload.
-                conn.execute(delete(raw_table))
-                conn.execute(insert(raw_table).values(payload=payload))
+            with self.lock():
+                if base is not None:
+                    with self._engine.connect() as conn:
+                        meta = self._load_meta(conn)
+                    if meta.generation != base:
+                        goals = reconcile(meta, base, goals, digests, self.load())
+                        talks = {}
+                        chunks = dump_goal_chunks(goals, talks=talks)
+                        digests = {
+                            g.id: digest(c) for g, c in zip(goals, chunks, strict=True)
+                        }
+                payload = join_chunks(chunks).decode("utf-8")
+                with self._engine.begin() as conn:
+                    known = set(self._load_talks(conn))
+                    fresh = [
+                        {"id": k, "text": v} for k, v in talks.items() if k not in known
+                    ]
+                    if fresh:
+                        conn.execute(insert(talks_table), fresh)
+                    # Replace the single row with the new payload.
+                    conn.execute(delete(raw_table))
+                    conn.execute(insert(raw_table).values(payload=payload))
+                    # Same transaction, so the generation and data move
+                    # together.
+                    meta = self._load_meta(conn)
+                    if meta.record(digests):
+                        conn.execute(
+                            delete(meta_table).where(meta_table.c.key == CHANGELOG_KEY)
+                        )
+                        conn.execute(
+                            insert(meta_table).values(
+                                key=CHANGELOG_KEY, value=meta.dumps()
+                            )
+                        )
         except SQLAlchemyError as exc:  # pragma: no cover
             raise StorageError(str(exc)) from exc
+        return goals, meta.generation
 
     def save_goal_area(self, goal: GoalArea) -> None:
         """Persist a single goal area back to the database."""
@@ -93,3 +250,7 @@ class SQLiteStore(Storage):
         else:
             goals.append(goal)
         self.save(goals)
+
+    def lock(self) -> ContextManager[None]:
+        """Return an exclusive lock serialising writers of this database."""
+        return file_lock(self._path.with_name(self._path.name + ".lock"))
@@ -0,0 +1,168 @@
+"""JSON encoding and incremental parsing helpers for the storage backends.
+
+Both backends persist the goal graph as one JSON array. Decoding it with
+``json.load`` materialises every goal at once; :func:`iter_json_array`
+instead reads the document in chunks and yields one element at a time so
+callers such as ``export`` keep memory proportional to a single goal.
+:func:`dump_goals` encodes the graph with Pydantic's native serializer,
+which avoids the pure-Python path ``json.dump`` takes when indenting.
+
+Pep talks repeat across thousands of check-ins, so backends intern them:
+:func:`dump_goals` can collect each distinct talk into a table and write
+only its id, and :func:`validate_goal` resolves the ids again on load.
+
+Goals are encoded one by one (:func:`dump_goal_chunks`) so backends can
+fingerprint each goal's bytes with :func:`digest` while saving and tell
+which goals a save touched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, Iterator, List, Protocol
+
+from pydantic import TypeAdapter
+
+from loopbloom.core.models import GoalArea
+from loopbloom.storage.base import StorageError
+
+GOAL_ADAPTER: TypeAdapter[GoalArea] = TypeAdapter(GoalArea)
+
+# Initial read size. Reads double whenever an element spans the buffer so
+# very large goals are still decoded in amortised linear time.
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class TextReader(Protocol):
+    """Anything with a text ``read(size)`` method."""
+
+    def read(self, size: int = -1, /) -> str:  # noqa: D102
+        ...
+
+
+def iter_json_array(fp: TextReader, *, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the elements of the top-level JSON array in ``fp`` lazily.
+
+    Args:
+        fp: Text stream positioned at the start of a JSON array.
+        chunk_size: Number of characters requested per read.
+
+    Raises:
+        StorageError: If the document is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+    size = chunk_size
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        data = fp.read(size)
+        if not data:
+            eof = True
+            return False
+        # Drop the consumed prefix so the buffer never holds more than the
+        # element currently being decoded.
+        buf = buf[pos:] + data
+        pos = 0
+        return True
+
+    def skip_ws() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf) or not fill():
+                return
+
+    skip_ws()
+    if pos >= len(buf):
+        # An empty document is treated like an empty array.
+        return
+    if buf[pos] != "[":
+        raise StorageError("Expected a JSON array")
+    pos += 1
+    first = True
+    while True:
+        skip_ws()
+        if pos >= len(buf):
+            raise StorageError("Unterminated JSON array")
+        if buf[pos] == "]":
+            return
+        if not first:
+            if buf[pos] != ",":
+                raise StorageError(f"Expected ',' at offset {pos}")
+            pos += 1
+            skip_ws()
+        first = False
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as exc:
+                if fill():
+                    size *= 2
+                    continue
+                raise StorageError(str(exc)) from exc
+            # A value touching the end of the buffer may be a truncated
+            # scalar (e.g. ``12`` of ``123``); read more before accepting it.
+            if end == len(buf) and fill():
+                size *= 2
+                continue
+            break
+        size = chunk_size
+        pos = end
+        yield obj
+
+
+def dump_goal_chunks(
+    goals: List[GoalArea],
+    *,
+    indent: int | None = None,
+    talks: Dict[str, str] | None = None,
+) -> List[bytes]:
+    """Encode each goal of ``goals`` as a separate UTF-8 JSON object.
+
+    Args:
+        goals: Goal graph to encode.
+        indent: Optional pretty-print indentation.
+        talks: When given, pep talks are added to this id -> text table and
+            check-ins store only the id.
+    """
+    context = {"talks": talks} if talks is not None else None
+    return [GOAL_ADAPTER.dump_json(g, indent=indent, context=context) for g in goals]
+
+
+def join_chunks(chunks: List[bytes], *, indent: int | None = None) -> bytes:
+    """Join encoded goals from :func:`dump_goal_chunks` into a JSON array."""
+    if not chunks:
+        return b"[]"
+    if indent is None:
+        return b"[" + b",".join(chunks) + b"]"
+    return b"[\n" + b",\n".join(chunks) + b"\n]"
+
+
+def dump_goals(
+    goals: List[GoalArea],
+    *,
+    indent: int | None = None,
+    talks: Dict[str, str] | None = None,
+) -> bytes:
+    """Encode ``goals`` as a UTF-8 JSON array (see :func:`dump_goal_chunks`)."""
+    chunks = dump_goal_chunks(goals, indent=indent, talks=talks)
+    return join_chunks(chunks, indent=indent)
+
+
+def digest(chunk: bytes) -> str:
+    """Return a short fingerprint of one encoded goal."""
+    return hashlib.blake2b(chunk, digest_size=8).hexdigest()
+
+
+def validate_goal(obj: Any, talks: Dict[str, str] | None = None) -> GoalArea:
+    """Build a :class:`GoalArea` from ``obj``, resolving interned talk ids."""
+    return GoalArea.model_validate(obj, context={"talks": talks or {}})
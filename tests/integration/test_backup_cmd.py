@@ -29,3 +29,31 @@ def test_backup_creates_file(tmp_path, monkeypatch):
     backup_dir = Path(tmp_path) / "loopbloom" / "backups"
     files = list(backup_dir.iterdir())
     assert files and "backup" in files[0].name
+
+
+def test_backup_keeps_pep_talks(tmp_path, monkeypatch):
+    """The talk table is copied so the backup loads with its pep talks."""
+    from loopbloom.core.models import Checkin, GoalArea, MicroGoal
+    from loopbloom.storage.json_store import JSONStore
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    data_file = tmp_path / "data.json"
+    monkeypatch.setenv("LOOPBLOOM_DATA_PATH", str(data_file))
+    monkeypatch.delenv("LOOPBLOOM_SQLITE_PATH", raising=False)
+
+    import loopbloom.core.config as cfg_mod
+
+    importlib.reload(cfg_mod)
+    import loopbloom.__main__ as main
+
+    importlib.reload(main)
+
+    checkin = Checkin(success=True, self_talk_generated="Nice work!")
+    micro = MicroGoal(name="Walk", checkins=[checkin])
+    JSONStore(data_file).save([GoalArea(name="Keep", micro_goals=[micro])])
+    res = CliRunner().invoke(main.cli, ["backup"])
+    assert res.exit_code == 0
+    backup_dir = Path(tmp_path) / "loopbloom" / "backups"
+    (backup,) = backup_dir.glob("*-backup-*[0-9].json")
+    (goal,) = JSONStore(backup).load()
+    assert goal.micro_goals[0].checkins[0].self_talk_generated == "Nice work!"
@@ -0,0 +1,99 @@
+"""Integration tests for ``loopbloom batch``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from loopbloom import __main__ as main
+
+SCRIPT = """\
+# provision a goal
+goal add "Sleep Hygiene"
+micro add "Lights out" --goal "Sleep Hygiene"
+checkin "Sleep Hygiene" --success
+"""
+
+
+def test_batch_commits_once(tmp_path: Path) -> None:
+    """All commands in the script are saved together."""
+    data = tmp_path / "data.json"
+    script = tmp_path / "setup.txt"
+    script.write_text(SCRIPT)
+    res = CliRunner().invoke(
+        main.cli, ["batch", str(script)], env={"LOOPBLOOM_DATA_PATH": str(data)}
+    )
+    assert res.exit_code == 0, res.output
+    assert "Ran 3 commands" in res.output
+    (goal,) = json.loads(data.read_text())
+    assert goal["name"] == "Sleep Hygiene"
+    assert len(goal["micro_goals"][0]["checkins"]) == 1
+
+
+def test_batch_rolls_back_on_failure(tmp_path: Path) -> None:
+    """A failing line leaves the data file untouched."""
+    data = tmp_path / "data.json"
+    env = {"LOOPBLOOM_DATA_PATH": str(data)}
+    runner = CliRunner()
+    runner.invoke(main.cli, ["goal", "add", "Exercise"], env=env)
+    before = data.read_text()
+    res = runner.invoke(
+        main.cli,
+        ["batch", "-"],
+        input='goal add Sleep\nmicro add Walk --goal "Nope"\ngoal add Never\n',
+        env=env,
+    )
+    assert res.exit_code == 1
+    assert "Line 2 failed" in res.output
+    assert data.read_text() == before
+
+
+def test_batch_prompts_fail_instead_of_reading_script(tmp_path: Path) -> None:
+    """Commands that would prompt abort rather than consume script lines."""
+    data = tmp_path / "data.json"
+    res = CliRunner().invoke(
+        main.cli,
+        ["batch", "-"],
+        input="goal add Sleep\ngoal rm Sleep\ngoal add Never\n",
+        env={"LOOPBLOOM_DATA_PATH": str(data)},
+    )
+    assert res.exit_code == 1
+    assert "needs input" in res.output
+    assert not data.exists()
+
+
+def test_batch_runs_follow_ups_only_after_commit(tmp_path: Path, monkeypatch) -> None:
+    """Notifications wait for the final save and are dropped on failure."""
+    import loopbloom.cli.checkin as checkin_mod
+
+    sent = []
+    monkeypatch.setattr(checkin_mod, "_notify", lambda msg, goal: sent.append(goal))
+    data = tmp_path / "data.json"
+    env = {"LOOPBLOOM_DATA_PATH": str(data)}
+    runner = CliRunner()
+    res = runner.invoke(
+        main.cli, ["batch", "-"], input=SCRIPT + "micro add X --goal Nope\n", env=env
+    )
+    assert res.exit_code == 1
+    assert sent == []
+
+    res = runner.invoke(main.cli, ["batch", "-"], input=SCRIPT, env=env)
+    assert res.exit_code == 0, res.output
+    assert sent == ["Sleep Hygiene"]
+
+
+def test_batch_rejects_store_options(tmp_path: Path) -> None:
+    """A line choosing another data file fails the whole batch."""
+    data = tmp_path / "data.json"
+    other = tmp_path / "other.json"
+    res = CliRunner().invoke(
+        main.cli,
+        ["batch", "-"],
+        input=f"goal add Sleep\n--data-path={other} goal add Walk\n",
+        env={"LOOPBLOOM_DATA_PATH": str(data)},
+    )
+    assert res.exit_code == 1
+    assert "'--data-path' cannot be used in a batch" in res.output
+    assert not data.exists() and not other.exists()
@@ -0,0 +1,102 @@
+"""Integration tests for batch and backfilled check-ins."""
+
+from __future__ import annotations
+
+import json
+
+from click.testing import CliRunner
+
+from loopbloom.__main__ import cli
+from loopbloom.storage.json_store import JSONStore
+
+
+def _setup(runner: CliRunner, env: dict[str, str], *goals: str) -> None:
+    """Create ``goals`` each with one active micro-habit."""
+    for name in goals:
+        runner.invoke(cli, ["goal", "add", name], env=env)
+        runner.invoke(cli, ["micro", "add", f"{name} habit", "--goal", name], env=env)
+
+
+def test_checkin_several_goals(tmp_path) -> None:
+    """Multiple goal names are recorded with one save and one pep talk."""
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    _setup(runner, env, "Sleep", "Walk")
+
+    res = runner.invoke(cli, ["checkin", "Sleep", "Walk"], env=env)
+
+    assert res.exit_code == 0
+    assert "Recorded 2 check-in(s)." in res.output
+    data = json.loads((tmp_path / "data.json").read_text())
+    assert [len(g["micro_goals"][0]["checkins"]) for g in data] == [1, 1]
+
+
+def test_checkin_all_active_and_unknown_goal(tmp_path) -> None:
+    """``--all-active`` covers every goal; an unknown name records nothing."""
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    _setup(runner, env, "Sleep", "Walk")
+
+    res = runner.invoke(cli, ["checkin", "Sleep", "Nope"], env=env)
+    assert "Goal not found" in res.output
+    data = json.loads((tmp_path / "data.json").read_text())
+    assert all(not g["micro_goals"][0]["checkins"] for g in data)
+
+    res = runner.invoke(cli, ["checkin", "--all-active", "--skip"], env=env)
+    assert res.exit_code == 0
+    data = json.loads((tmp_path / "data.json").read_text())
+    assert all(g["micro_goals"][0]["checkins"][0]["success"] is False for g in data)
+
+
+def test_checkin_from_file_and_range(tmp_path) -> None:
+    """File rows override success/notes and ranges skip logged days."""
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    _setup(runner, env, "Sleep", "Walk")
+    src = tmp_path / "list.csv"
+    src.write_text("# goal,status,note\nSleep\nWalk,skip,rain\n")
+
+    res = runner.invoke(
+        cli, ["checkin", "--from-file", str(src), "--date", "2024-05-03"], env=env
+    )
+    assert res.exit_code == 0
+    walk = json.loads((tmp_path / "data.json").read_text())[1]
+    ci = walk["micro_goals"][0]["checkins"][0]
+    assert (ci["date"], ci["success"], ci["note"]) == ("2024-05-03", False, "rain")
+
+    res = runner.invoke(
+        cli, ["checkin", "Walk", "--range", "2024-05-01..2024-05-05"], env=env
+    )
+    assert res.exit_code == 0
+    assert "1 day(s) already logged" in res.output
+    walk = json.loads((tmp_path / "data.json").read_text())[1]
+    dates = [c["date"] for c in walk["micro_goals"][0]["checkins"]]
+    assert dates == [f"2024-05-0{d}" for d in range(1, 6)]
+
+
+def test_checkin_batch_talk_per_mood_and_dedup(tmp_path, monkeypatch) -> None:
+    """Skips never store a success talk and repeated goals record once."""
+    monkeypatch.setattr(
+        "loopbloom.cli.checkin.TalkPool.random", lambda mood="success", **_: mood
+    )
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    _setup(runner, env, "Sleep", "Walk")
+    src = tmp_path / "list.csv"
+    src.write_text("Sleep\nWalk,skip\n")
+
+    res = runner.invoke(cli, ["checkin", "--from-file", str(src)], env=env)
+    assert res.exit_code == 0
+    goals = JSONStore(tmp_path / "data.json").load()
+    talks = [g.micro_goals[0].checkins[0].self_talk_generated for g in goals]
+    assert talks == ["✓ success", "skip"]
+
+    res = runner.invoke(
+        cli, ["checkin", "Sleep", "Sleep", "--date", "2024-05-03"], env=env
+    )
+    assert res.exit_code == 0
+    assert "Recorded 1 check-in(s)." in res.output
+    res = runner.invoke(
+        cli, ["checkin", "--all-active", "Walk", "--date", "2024-05-04"], env=env
+    )
+    assert "Recorded 2 check-in(s)." in res.output
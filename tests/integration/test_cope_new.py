@@ -6,17 +6,16 @@ from click.testing import CliRunner
 
 
 def test_cope_new(tmp_path, monkeypatch):
-    """Interactively create a plan and verify the YAML output."""
+    """Interactively create a plan in the user's coping directory."""
     runner = CliRunner()
     env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
     coping_dir = tmp_path / "coping"
-    coping_dir.mkdir()
 
     import loopbloom.constants as const_mod
     import loopbloom.core.coping as cp_mod
 
-    monkeypatch.setattr(const_mod, "COPING_DIR", coping_dir)
-    monkeypatch.setattr(cp_mod, "COPING_DIR", coping_dir)
+    monkeypatch.setattr(const_mod, "USER_COPING_DIR", coping_dir)
+    monkeypatch.setattr(cp_mod, "USER_COPING_DIR", coping_dir)
     import loopbloom.cli as cli_mod
     import loopbloom.cli.cope as cope_mod
 
@@ -51,3 +50,5 @@ def test_cope_new(tmp_path, monkeypatch):
     content = yaml.safe_load(created.read_text())
     assert content["id"] == "myplan"
     assert content["steps"][0]["prompt"] == "What is up?"
+    assert not (const_mod.COPING_DIR / "myplan.yml").exists()
+    assert cp_mod.PlanRepository.get("myplan").title == "My Plan"
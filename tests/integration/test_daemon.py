@@ -0,0 +1,70 @@
+"""Integration tests for the daemon and its thin client."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from loopbloom import client
+
+
+@pytest.fixture()
+def running_daemon(tmp_path, monkeypatch):
+    """Serve a daemon for ``tmp_path/data.json`` on a temporary socket."""
+    from loopbloom.cli.daemon import Daemon, serve
+
+    sock = tmp_path / "d.sock"
+    data = tmp_path / "data.json"
+    monkeypatch.setenv("LOOPBLOOM_SOCKET", str(sock))
+    monkeypatch.setenv("LOOPBLOOM_DATA_PATH", str(data))
+    monkeypatch.delenv("LOOPBLOOM_NO_DAEMON", raising=False)
+    daemon = Daemon(str(data))
+    thread = threading.Thread(target=serve, args=(sock, daemon), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if sock.exists():
+            break
+        time.sleep(0.01)
+    yield daemon, data
+    client.request({"op": "stop"})
+    thread.join(5)
+
+
+def test_commands_forward_and_write_through(running_daemon, capsys) -> None:
+    """Forwarded commands share the warm store and persist immediately."""
+    daemon, data = running_daemon
+    assert client.forward(["goal", "add", "Sleep"]) == 0
+    assert json.loads(data.read_text())[0]["name"] == "Sleep"
+    assert client.forward(["goal", "list"]) == 0
+    assert "Sleep" in capsys.readouterr().out
+
+    # An edit made outside the daemon invalidates its cached graph.
+    raw = json.loads(data.read_text())
+    raw[0]["name"] = "Rest"
+    time.sleep(0.01)
+    data.write_text(json.dumps(raw))
+    assert client.forward(["goal", "list"]) == 0
+    assert "Rest" in capsys.readouterr().out
+
+    # Dry runs do not leak into the cached graph.
+    assert client.forward(["--dry-run", "goal", "add", "Walk"]) == 0
+    capsys.readouterr()
+    client.forward(["goal", "list"])
+    assert "Walk" not in capsys.readouterr().out
+
+
+def test_client_falls_back(running_daemon, tmp_path, monkeypatch) -> None:
+    """Other data files, prompts and local commands run in-process."""
+    assert client.forward(["--data-path", str(tmp_path / "x.json"), "tree"]) is None
+    # ``review`` prompts, which needs the caller's terminal.
+    assert client.forward(["review"]) is None
+    assert client.forward(["shell"]) is None
+    monkeypatch.setenv("LOOPBLOOM_NO_DAEMON", "1")
+    assert client.forward(["goal", "list"]) is None
+    monkeypatch.delenv("LOOPBLOOM_NO_DAEMON")
+    client.request({"op": "stop"})
+    time.sleep(0.05)
+    assert client.forward(["goal", "list"]) is None
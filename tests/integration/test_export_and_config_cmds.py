@@ -62,3 +62,102 @@ def test_export_json_and_csv(tmp_path):
     data = json.loads(json_path.read_text())
     assert data and data[0]["name"] == "Sleep"
     assert sum(1 for _ in csv.reader(csv_path.open())) == 2
+
+
+def test_export_ndjson_and_gzip(tmp_path):
+    """NDJSON writes one goal per line and .gz outputs are compressed."""
+    import gzip
+
+    from loopbloom import __main__ as main
+
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    runner.invoke(main.cli, ["goal", "add", "Sleep"], env=env)
+    runner.invoke(main.cli, ["goal", "add", "Walk"], env=env)
+    runner.invoke(main.cli, ["micro", "add", "Bed", "--goal", "Sleep"], env=env)
+    runner.invoke(main.cli, ["checkin", "Sleep"], env=env)
+
+    nd_path = tmp_path / "export.ndjson"
+    res = runner.invoke(
+        main.cli, ["export", "--fmt", "ndjson", "--out", str(nd_path)], env=env
+    )
+    assert "Exported NDJSON" in res.output
+    lines = nd_path.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["Sleep", "Walk"]
+
+    gz_path = tmp_path / "export.csv.gz"
+    runner.invoke(main.cli, ["export", "--fmt", "csv", "--out", str(gz_path)], env=env)
+    with gzip.open(gz_path, "rt", newline="") as fp:
+        rows = list(csv.reader(fp))
+    assert rows[0][0] == "date" and rows[1][1] == "Sleep"
+
+    js_path = tmp_path / "export.json"
+    runner.invoke(
+        main.cli,
+        ["export", "--fmt", "json", "--gzip", "--out", str(js_path)],
+        env=env,
+    )
+    with gzip.open(js_path, "rt") as fp:
+        assert [g["name"] for g in json.load(fp)] == ["Sleep", "Walk"]
+
+
+def test_export_since_last_emits_only_changes(tmp_path):
+    """Incremental exports advance a watermark and report renames/deletes."""
+    from loopbloom import __main__ as main
+
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    wm = str(tmp_path / "wm.json")
+    runner.invoke(main.cli, ["goal", "add", "Sleep"], env=env)
+    runner.invoke(main.cli, ["micro", "add", "Bed", "--goal", "Sleep"], env=env)
+    runner.invoke(main.cli, ["checkin", "Sleep"], env=env)
+
+    def export_changes(name, *extra):
+        out = tmp_path / name
+        args = ["export", "--fmt", "csv", "--out", str(out), "--since-last"]
+        res = runner.invoke(main.cli, [*args, "--watermark", wm, *extra], env=env)
+        assert res.exit_code == 0, res.output
+        return list(csv.DictReader(out.open()))
+
+    out = tmp_path / "dry.csv"
+    args = ["--dry-run", "export", "--fmt", "csv", "--out", str(out), "--since-last"]
+    res = runner.invoke(main.cli, [*args, "--watermark", wm], env=env)
+    assert "Watermark not updated" in res.output
+    assert not (tmp_path / "wm.json").exists()
+
+    first = export_changes("1.csv")
+    assert [r["op"] for r in first] == ["insert"]
+    assert export_changes("2.csv") == []
+
+    runner.invoke(main.cli, ["checkin", "Sleep", "--skip"], env=env)
+    third = export_changes("3.csv")
+    assert [(r["op"], r["success"]) for r in third] == [("insert", "0")]
+
+    from loopbloom.storage.json_store import JSONStore
+
+    store = JSONStore(tmp_path / "data.json")
+    goals = store.load()
+    goals[0].micro_goals[0].name = "Sleep 10"
+    store.save(goals)
+    fourth = export_changes("4.csv", "--with-deletions")
+    assert [r["op"] for r in fourth] == ["rename"]
+    assert json.loads(fourth[0]["previous"])["micro"] == "Bed"
+
+    runner.invoke(main.cli, ["goal", "rm", "Sleep", "--yes"], env=env)
+    fifth = export_changes("5.csv", "--with-deletions")
+    assert [(r["op"], r["micro"]) for r in fifth] == [("delete", "Sleep 10")]
+
+    res = runner.invoke(
+        main.cli,
+        [
+            "export",
+            "--fmt",
+            "csv",
+            "--out",
+            str(tmp_path / "6.csv"),
+            "--with-deletions",
+        ],
+        env=env,
+    )
+    assert res.exit_code == 2
+    assert "--with-deletions requires --since-last" in res.output
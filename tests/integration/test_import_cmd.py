@@ -0,0 +1,96 @@
+"""Integration tests for the bulk ``import`` command."""
+
+import json
+
+from click.testing import CliRunner
+
+from loopbloom.__main__ import cli
+
+
+def _load(path):
+    return json.loads(path.read_text())
+
+
+def test_import_roundtrips_loopbloom_exports(tmp_path) -> None:  # noqa: D103
+    runner = CliRunner()
+    src_env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "src.json")}
+    runner.invoke(cli, ["goal", "add", "Sleep"], env=src_env)
+    runner.invoke(cli, ["goal", "phase", "add", "Sleep", "Base"], env=src_env)
+    runner.invoke(
+        cli, ["micro", "add", "Bed", "--goal", "Sleep", "--phase", "Base"], env=src_env
+    )
+    runner.invoke(cli, ["checkin", "Sleep", "--note", "early"], env=src_env)
+    for fmt in ("csv", "json", "ndjson"):
+        runner.invoke(
+            cli,
+            ["export", "--fmt", fmt, "--out", str(tmp_path / f"out.{fmt}")],
+            env=src_env,
+        )
+
+    for fmt in ("csv", "json", "ndjson"):
+        dest = tmp_path / f"dest_{fmt}.json"
+        env = {"LOOPBLOOM_DATA_PATH": str(dest)}
+        res = runner.invoke(cli, ["import", str(tmp_path / f"out.{fmt}")], env=env)
+        assert res.exit_code == 0, res.output
+        assert "Imported 1 check-in(s)" in res.output
+        micro = _load(dest)[0]["phases"][0]["micro_goals"][0]
+        assert micro["name"] == "Bed"
+        assert micro["checkins"][0]["note"] == "early"
+        # Re-importing the same file is idempotent.
+        res = runner.invoke(cli, ["import", str(tmp_path / f"out.{fmt}")], env=env)
+        assert "Imported 0 check-in(s) (1 duplicate(s)" in res.output
+
+
+def test_import_wide_habit_tracker_csv(tmp_path) -> None:  # noqa: D103
+    src = tmp_path / "Checkmarks.csv"
+    src.write_text(
+        "Date,Meditate,Read,\n"
+        "2024-01-03,2,0,\n"
+        "2024-01-02,-1,2,\n"
+        "2024-01-01,2,3,\n"
+    )
+    data = tmp_path / "data.json"
+    res = CliRunner().invoke(
+        cli,
+        ["import", str(src), "--goal", "Mind"],
+        env={"LOOPBLOOM_DATA_PATH": str(data)},
+    )
+    assert res.exit_code == 0, res.output
+    goal = _load(data)[0]
+    assert goal["name"] == "Mind"
+    meditate, read = goal["micro_goals"]
+    assert [c["date"] for c in meditate["checkins"]] == ["2024-01-01", "2024-01-03"]
+    assert [c["success"] for c in read["checkins"]] == [True, False]
+
+
+def test_import_invalid_rows_abort_without_saving(tmp_path) -> None:  # noqa: D103
+    src = tmp_path / "log.csv"
+    src.write_text("date,habit,completed\n2024-01-01,Walk,yes\nnot-a-date,Walk,no\n")
+    data = tmp_path / "data.json"
+    env = {"LOOPBLOOM_DATA_PATH": str(data)}
+    runner = CliRunner()
+    res = runner.invoke(cli, ["import", str(src)], env=env)
+    assert res.exit_code == 1
+    assert "Invalid row 3" in res.output
+    assert not data.exists()
+
+    res = runner.invoke(cli, ["import", str(src), "--skip-invalid"], env=env)
+    assert res.exit_code == 0
+    assert len(_load(data)[0]["micro_goals"][0]["checkins"]) == 1
+
+
+def test_import_malformed_sources_fail_cleanly(tmp_path) -> None:  # noqa: D103
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    bad_json = tmp_path / "bad.json"
+    bad_json.write_text('[{"name": "G", "phases": []}, {"name": ')
+    bad_csv = tmp_path / "bad.csv"
+    # Fields beyond the csv module's size limit raise ``csv.Error``.
+    bad_csv.write_text(f"date,goal,micro,success\n2024-01-01,G,\"{'x' * 200_000}")
+    for src in (bad_json, bad_csv):
+        res = runner.invoke(cli, ["import", str(src)], env=env)
+        assert res.exit_code == 1, res.output
+        assert "Import failed:" in res.output
+        assert (
+            not (tmp_path / "data.json").exists() or _load(tmp_path / "data.json") == []
+        )
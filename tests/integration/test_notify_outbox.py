@@ -0,0 +1,93 @@
+"""Integration tests for the notification outbox."""
+
+from __future__ import annotations
+
+import importlib
+
+from click.testing import CliRunner
+
+
+def test_outbox_queues_and_flushes_digest(tmp_path, monkeypatch) -> None:
+    """Queued check-in notifications are delivered as one digest."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    import loopbloom.core.config as cfg_mod
+
+    importlib.reload(cfg_mod)
+    import loopbloom.__main__ as main
+
+    importlib.reload(main)
+    monkeypatch.setattr("loopbloom.constants.OUTBOX_PATH", tmp_path / "outbox.ndjson")
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    runner.invoke(main.cli, ["config", "set", "notify", "terminal"], env=env)
+    runner.invoke(main.cli, ["config", "set", "notify_outbox", "true"], env=env)
+    for name in ("A", "B"):
+        runner.invoke(main.cli, ["goal", "add", name], env=env)
+        runner.invoke(main.cli, ["micro", "add", "M", "--goal", name], env=env)
+        res = runner.invoke(main.cli, ["checkin", name], env=env)
+        assert "🔔" not in res.output
+
+    res = runner.invoke(main.cli, ["notify", "status"], env=env)
+    assert "2 queued notification(s)" in res.output
+    assert "terminal: 2" in res.output
+
+    res = runner.invoke(main.cli, ["notify", "flush"], env=env)
+    assert res.exit_code == 0
+    assert res.output.count("🔔") == 1
+    assert "LoopBloom digest (2 updates)" in res.output
+    assert "Delivered 2 notification(s) in 1 digest(s)." in res.output
+
+    res = runner.invoke(main.cli, ["notify", "flush"], env=env)
+    assert "Outbox empty." in res.output
+
+
+def test_flush_skips_while_locked(tmp_path, monkeypatch) -> None:
+    """A flush started while another holds the lock delivers nothing."""
+    from loopbloom.services import outbox
+
+    out = tmp_path / "outbox.ndjson"
+    outbox.enqueue("T", "hello", ["terminal"], path=out)
+    sent: list[str] = []
+    monkeypatch.setattr(
+        "loopbloom.services.notifier.dispatch",
+        lambda title, message, channels, **kw: sent.append(message)
+        or {c: "ok" for c in channels},
+    )
+
+    from loopbloom.storage.locking import try_file_lock
+
+    with try_file_lock(out.with_name(out.name + outbox.LOCK_SUFFIX)):
+        report = outbox.flush(out)
+    assert report.skipped and not sent
+    assert len(outbox.pending(out)) == 1
+
+    report = outbox.flush(out)
+    assert not report.skipped and sent == ["hello"]
+    assert outbox.pending(out) == []
+
+
+def test_flush_keeps_leftovers_and_requeue_times(tmp_path, monkeypatch) -> None:
+    """Interrupted flushes are resumed and failed events keep their time."""
+    from loopbloom.services import outbox
+
+    out = tmp_path / "outbox.ndjson"
+    outbox.enqueue("T", "old", ["file"], path=out, ts="2024-01-01T08:00:00")
+    # Simulate a flush that died after claiming and renaming.
+    out.rename(out.with_name(out.name + outbox.CLAIM_SUFFIX))
+    outbox.enqueue("T", "mid", ["file"], path=out, ts="2024-01-01T09:00:00")
+    out.rename(out.with_name(out.name + outbox.INCOMING_SUFFIX))
+    outbox.enqueue("T", "new", ["file"], path=out, ts="2024-01-01T10:00:00")
+    assert [e["message"] for e in outbox.pending(out)] == ["old", "mid", "new"]
+    monkeypatch.setattr(
+        "loopbloom.services.notifier.dispatch",
+        lambda title, message, channels, **kw: {c: "failed" for c in channels},
+    )
+
+    report = outbox.flush(out)
+    assert report.events == 3 and report.failed == 3
+    assert [e["ts"] for e in outbox.pending(out)] == [
+        "2024-01-01T08:00:00",
+        "2024-01-01T09:00:00",
+        "2024-01-01T10:00:00",
+    ]
+    assert not out.with_name(out.name + outbox.CLAIM_SUFFIX).exists()
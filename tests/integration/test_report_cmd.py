@@ -20,3 +20,37 @@ def test_report_command_outputs(tmp_path) -> None:  # noqa: D103
     assert "Heatmap" in res2.output
     res3 = runner.invoke(cli, ["report", "--mode", "line"], env=env)
     assert "Success Rate" in res3.output
+
+
+def test_report_calendar_year_and_goal_filter(tmp_path) -> None:  # noqa: D103
+    runner = CliRunner()
+    env = {
+        "LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json"),
+        "LOOPBLOOM_DEBUG_DATE": "2024-03-05",
+    }
+    runner.invoke(cli, ["goal", "add", "Health"], env=env)
+    runner.invoke(cli, ["micro", "add", "Walk", "--goal", "Health"], env=env)
+    runner.invoke(cli, ["goal", "add", "Sleep"], env=env)
+    runner.invoke(cli, ["micro", "add", "Bed", "--goal", "Sleep"], env=env)
+    runner.invoke(cli, ["checkin", "Health"], env=env)
+
+    res = runner.invoke(cli, ["report", "--year", "2024", "--goal", "Sleep"], env=env)
+    assert res.exit_code == 0
+    assert "0/0 successful check-ins" in res.output
+    res = runner.invoke(cli, ["report", "--year", "2024"], env=env)
+    assert "1/1 successful check-ins" in res.output
+    res = runner.invoke(cli, ["report", "--months", "2"], env=env)
+    assert "February 2024" in res.output and "March 2024" in res.output
+    res = runner.invoke(cli, ["report", "--goal", "Nope"], env=env)
+    assert "Goal not found" in res.output
+
+
+def test_report_rejects_conflicting_flags(tmp_path) -> None:  # noqa: D103
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    res = runner.invoke(cli, ["report", "--mode", "line", "--months", "3"], env=env)
+    assert res.exit_code == 2
+    assert "only apply to --mode calendar" in res.output
+    res = runner.invoke(cli, ["report", "--months", "3", "--year", "2024"], env=env)
+    assert res.exit_code == 2
+    assert "either --months or --year" in res.output
@@ -0,0 +1,102 @@
+"""Integration tests for the ``loopbloom serve`` HTTP API."""
+
+from __future__ import annotations
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+import pytest
+
+from loopbloom.api import Client
+from loopbloom.cli.serve import ApiServer
+
+
+@pytest.fixture()
+def server(tmp_path: Path) -> Iterator[Tuple[str, Client]]:
+    """Serve ``tmp_path/data.json`` on a free local port."""
+    client = Client(tmp_path / "data.json")
+    client.add_goal("Sleep")
+    client.add_micro("Lights out", goal="Sleep")
+    srv = ApiServer(("127.0.0.1", 0), client)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_port}", client
+    srv.shutdown()
+    srv.server_close()
+
+
+def _get(url: str, etag: str | None = None) -> Tuple[int, Dict[str, str], Any]:
+    req = urllib.request.Request(url)
+    if etag:
+        req.add_header("If-None-Match", etag)
+    try:
+        with urllib.request.urlopen(req) as resp:
+            body = resp.read()
+            return resp.status, dict(resp.headers), json.loads(body or b"null")
+    except urllib.error.HTTPError as exc:
+        return exc.code, dict(exc.headers), json.loads(exc.read() or b"null")
+
+
+def test_etag_revalidation(server: Tuple[str, Client]) -> None:
+    """Unchanged data answers 304; a check-in changes the tag."""
+    base, _ = server
+    status, headers, goals = _get(base + "/goals")
+    assert status == 200 and goals[0]["name"] == "Sleep"
+    etag = headers["ETag"]
+    assert _get(base + "/goals", etag)[0] == 304
+
+    req = urllib.request.Request(
+        base + "/checkins",
+        data=json.dumps({"goal": "sleep", "date": "2024-05-01"}).encode(),
+        method="POST",
+    )
+    with urllib.request.urlopen(req) as resp:
+        assert resp.status == 201
+        assert json.loads(resp.read())["micro"] == "Lights out"
+
+    status, headers, _ = _get(base + "/goals", etag)
+    assert status == 200 and headers["ETag"] != etag
+    status, _, report = _get(base + "/report?mode=success")
+    assert report["goals"] == [{"goal": "Sleep", "successes": 1, "total": 1}]
+
+
+def test_errors_and_external_changes(server: Tuple[str, Client], tmp_path) -> None:
+    """Unknown names are 404s and edits by other processes bump the tag."""
+    base, _ = server
+    assert _get(base + "/goals/Nope")[0] == 404
+    assert _get(base + "/report?months=x")[0] == 400
+    status, headers, rows = _get(base + "/summary")
+    assert status == 200 and rows[0]["goal"] == "Sleep"
+
+    _, _, feed = _get(base + "/changes")
+    Client(tmp_path / "data.json").add_goal("Exercise")
+    status, _, rows = _get(base + "/summary", headers["ETag"])
+    assert status == 200 and [r["goal"] for r in rows] == ["Sleep", "Exercise"]
+    _, _, changes = _get(base + f"/changes?since={feed['generation']}")
+    assert changes["generation"] == feed["generation"] + 1
+    assert [g["name"] for g in changes["goals"]] == ["Exercise"]
+
+
+def test_conflicting_checkin_is_409(server: Tuple[str, Client], monkeypatch) -> None:
+    """A save colliding with another writer answers ``409 Conflict``."""
+    from loopbloom.storage.base import ConflictError
+
+    base, client = server
+
+    def commit(goals, base):
+        raise ConflictError("Sleep was changed by another process", ["x"])
+
+    monkeypatch.setattr(client.session.backend, "commit", commit)
+    req = urllib.request.Request(
+        base + "/checkins",
+        data=json.dumps({"goal": "sleep", "date": "2024-05-01"}).encode(),
+        method="POST",
+    )
+    with pytest.raises(urllib.error.HTTPError) as info:
+        urllib.request.urlopen(req)
+    assert info.value.code == 409
+    assert "another process" in json.loads(info.value.read())["error"]
@@ -0,0 +1,95 @@
+"""Integration tests for ``loopbloom shell``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from loopbloom import __main__ as main
+from loopbloom.cli.shell import Shell
+from loopbloom.storage.json_store import JSONStore
+from loopbloom.storage.session import SessionStore
+
+
+def test_shell_holds_changes_until_save(tmp_path: Path) -> None:
+    """Changes stay in memory until ``save`` and are flushed on exit."""
+    data = tmp_path / "data.json"
+    script = "\n".join(
+        [
+            'goal add "Sleep Hygiene"',
+            'micro add "Lights out" --goal "Sleep Hygiene"',
+            "goal list",
+            "save",
+            "goal add Exercise",
+            "--dry-run goal add Walk",
+            "goal add",  # usage error: must not lose held changes
+            "exit",
+        ]
+    )
+    res = CliRunner().invoke(
+        main.cli,
+        ["shell"],
+        input=script + "\n",
+        env={"LOOPBLOOM_DATA_PATH": str(data)},
+    )
+    assert res.exit_code == 0, res.output
+    assert "Saved." in res.output
+    names = [g["name"] for g in json.loads(data.read_text())]
+    assert names == ["Sleep Hygiene", "Exercise"]
+
+
+def test_shell_dry_run_never_writes(tmp_path: Path) -> None:
+    """``loopbloom --dry-run shell`` keeps every change in memory."""
+    data = tmp_path / "data.json"
+    res = CliRunner().invoke(
+        main.cli,
+        ["--dry-run", "shell"],
+        input="goal add Sleep\nexit\n",
+        env={"LOOPBLOOM_DATA_PATH": str(data)},
+    )
+    assert res.exit_code == 0
+    assert "DRY RUN" in res.output
+    assert not data.exists()
+
+
+def test_shell_rejects_store_options(tmp_path: Path) -> None:
+    """``--data-path`` inside a line is refused instead of being ignored."""
+    data = tmp_path / "data.json"
+    other = tmp_path / "other.json"
+    res = CliRunner().invoke(
+        main.cli,
+        ["shell"],
+        input=f"--data-path {other} goal add Sleep\nexit\n",
+        env={"LOOPBLOOM_DATA_PATH": str(data)},
+    )
+    assert res.exit_code == 0
+    assert "'--data-path' cannot be used inside the shell" in res.output
+    assert not data.exists() and not other.exists()
+
+
+def test_shell_completes_names_from_graph(tmp_path: Path) -> None:
+    """Subcommands and names complete from the CLI and the loaded goals."""
+    data = tmp_path / "data.json"
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(data)}
+    runner.invoke(main.cli, ["goal", "add", "Sleep Hygiene"], env=env)
+    runner.invoke(
+        main.cli, ["micro", "add", "Stretch", "--goal", "Sleep Hygiene"], env=env
+    )
+
+    repl = Shell(SessionStore(JSONStore(data), write_through=False))
+    assert "checkin" in repl.completenames("che")
+    line = "micro "
+    assert "add" in repl.completedefault("a", line + "a", len(line), len(line) + 1)
+    line = "checkin "
+    assert repl.completedefault("sl", line + "sl", len(line), len(line) + 2) == [
+        "'Sleep Hygiene'"
+    ]
+    line = "micro complete "
+    assert repl.completedefault("St", line + "St", len(line), len(line) + 2) == [
+        "Stretch"
+    ]
+    line = "checkin "
+    assert "--success" in repl.completedefault("--s", line + "--s", 8, 11)
@@ -483,7 +483,7 @@ def test_cope_new_existing(
     from loopbloom import __main__ as main
 
     monkeypatch.setattr(cp_mod, "COPING_DIR", tmp_path)
-    monkeypatch.setattr(cp_mod.PlanRepository, "get", lambda *_: True)
+    monkeypatch.setattr(cp_mod.PlanRepository, "exists", lambda *_: True)
     monkeypatch.setattr(click, "prompt", lambda *_, **__: "X")
     importlib.reload(cope_mod)
     importlib.reload(main)
@@ -505,7 +505,7 @@ def test_cope_new_invalid(
     from loopbloom import __main__ as main
 
     monkeypatch.setattr(cp_mod, "COPING_DIR", tmp_path)
-    monkeypatch.setattr(cp_mod.PlanRepository, "get", lambda *_: None)
+    monkeypatch.setattr(cp_mod.PlanRepository, "exists", lambda *_: False)
     responses = iter(["new", "Title", "x", "q"])
     monkeypatch.setattr(click, "prompt", lambda *_, **__: next(responses))
     importlib.reload(cope_mod)
@@ -0,0 +1,55 @@
+"""Tests for the embeddable :mod:`loopbloom.api` client."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from loopbloom.api import Client, ClientError, NotFoundError
+
+
+def test_client_round_trip(tmp_path: Path) -> None:
+    """Operations persist immediately and return plain data."""
+    data = tmp_path / "data.json"
+    with Client(data) as lb:
+        goal = lb.add_goal("Sleep")
+        assert goal["name"] == "Sleep"
+        lb.add_micro("Lights out", goal="sleep", phase="Evening")
+        ci = lb.checkin("Sleep", day=date(2024, 5, 2))
+        assert ci["micro"] == "Lights out" and ci["streak"] == 1 and ci["talk"]
+        lb.checkin("Sleep", success=False, day=date(2024, 5, 1))
+
+        rows = lb.summary(window=7, today=date(2024, 5, 2))
+        assert rows[0]["successes"] == 1 and rows[0]["total"] == 2
+        cal = lb.report_data(today=date(2024, 5, 20))
+        assert cal["start"] == "2024-05-01" and cal["end"] == "2024-05-31"
+        assert cal["days"][0] == {"date": "2024-05-01", "successes": 0, "total": 1}
+        bars = lb.report_data("success")
+        assert bars["goals"] == [{"goal": "Sleep", "successes": 1, "total": 2}]
+        json.dumps(lb.goals())
+
+    stored = json.loads(data.read_text())
+    checkins = stored[0]["phases"][0]["micro_goals"][0]["checkins"]
+    # The backfilled skip is kept in date order.
+    assert [c["date"] for c in checkins] == ["2024-05-01", "2024-05-02"]
+
+
+def test_client_errors_and_external_edits(tmp_path: Path) -> None:
+    """Unknown names raise, and edits by other processes are picked up."""
+    data = tmp_path / "data.json"
+    lb = Client(data)
+    lb.add_goal("Sleep")
+    with pytest.raises(ClientError):
+        lb.add_goal("sleep")
+    with pytest.raises(NotFoundError):
+        lb.checkin("Nope")
+    with pytest.raises(NotFoundError):
+        lb.checkin("Sleep")  # no active micro-habit yet
+
+    other = Client(data)
+    other.add_goal("Exercise")
+    assert [g["name"] for g in lb.goals()] == ["Sleep", "Exercise"]
+    assert lb.goal("exercise")["name"] == "Exercise"
@@ -0,0 +1,91 @@
+"""Tests for the background task queue."""
+
+import json
+import threading
+
+from click.testing import CliRunner
+
+from loopbloom.__main__ import cli
+from loopbloom.core import config as cfg
+from loopbloom.services.background import BackgroundTasks
+
+
+def test_jobs_wait_for_start_and_run_in_order():
+    """Deferred jobs only run after ``start`` and keep their order."""
+    tasks = BackgroundTasks()
+    seen: list[int] = []
+    tasks.defer(lambda: seen.append(1))
+    tasks.defer(lambda: seen.append(2))
+    assert tasks.join() is True
+    assert seen == []
+    tasks.start()
+    assert tasks.join() is True
+    assert seen == [1, 2]
+
+
+def test_join_is_bounded():
+    """A stuck job does not block ``join`` past its timeout."""
+    tasks = BackgroundTasks()
+    gate = threading.Event()
+    tasks.defer(gate.wait)
+    tasks.start()
+    assert tasks.join(timeout=0.05) is False
+    gate.set()
+
+
+def test_checkin_notifies_after_save(tmp_path, monkeypatch):
+    """The notification is sent once the check-in is on disk."""
+    runner = CliRunner()
+    data = tmp_path / "data.json"
+    env = {"LOOPBLOOM_DATA_PATH": str(data)}
+    runner.invoke(cli, ["goal", "add", "G"], env=env)
+    runner.invoke(cli, ["micro", "add", "M", "--goal", "G"], env=env)
+
+    saved: list[int] = []
+
+    def fake_send(title, message, *, mode="terminal", goal=None):
+        goals = json.loads(data.read_text())
+        saved.append(len(goals[0]["micro_goals"][0]["checkins"]))
+
+    monkeypatch.setattr("loopbloom.services.notifier.send", fake_send)
+    res = runner.invoke(cli, ["checkin", "G"], env=env)
+
+    assert res.exit_code == 0
+    assert saved == [1]
+    assert "Keep up the great work" in res.output
+
+
+def test_progression_prints_when_desktop_stalls(tmp_path, monkeypatch):
+    """A stalled desktop backend cannot swallow the progression feedback."""
+    runner = CliRunner()
+    data = tmp_path / "data.json"
+    env = {"LOOPBLOOM_DATA_PATH": str(data), "XDG_CONFIG_HOME": str(tmp_path)}
+    runner.invoke(cli, ["goal", "add", "G"], env=env)
+    runner.invoke(cli, ["micro", "add", "M", "--goal", "G"], env=env)
+
+    gate = threading.Event()
+
+    class Stalled:
+        @staticmethod
+        def notify(**kwargs):
+            gate.wait()
+
+    monkeypatch.setattr("loopbloom.services.notifier.notification", Stalled)
+    conf = {**cfg.DEFAULTS, "notify": "desktop"}
+    monkeypatch.setattr(cfg, "load", lambda: conf)
+    monkeypatch.setattr(BackgroundTasks.join, "__defaults__", (0.05,))
+    res = runner.invoke(cli, ["checkin", "G"], env=env)
+    gate.set()
+
+    assert res.exit_code == 0
+    assert "Keep up the great work" in res.output
+
+
+def test_after_save_runs_inline_after_handoff():
+    """Foreground jobs run on the caller once background jobs are queued."""
+    tasks = BackgroundTasks()
+    seen: list[str] = []
+    tasks.after_save(lambda: seen.append(threading.current_thread().name))
+    assert seen == []
+    tasks.start()
+    assert seen == [threading.current_thread().name]
@@ -0,0 +1,55 @@
+"""Tests for the storage generation counter and change feed."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from loopbloom.core.models import GoalArea, MicroGoal
+from loopbloom.storage.changes import LOG_SIZE, ChangeLog
+from loopbloom.storage.json_store import JSONStore
+from loopbloom.storage.sqlite_store import SQLiteStore
+
+
+@pytest.mark.parametrize(
+    "store_cls,name", [(JSONStore, "d.json"), (SQLiteStore, "d.db")]
+)
+def test_generation_and_changes_since(tmp_path: Path, store_cls, name) -> None:
+    """Saves that change goals bump the generation and list their ids."""
+    store = store_cls(tmp_path / name)
+    assert store.generation() == 0
+    a, b = GoalArea(name="A"), GoalArea(name="B")
+    store.save([a, b])
+    assert store.generation() == 1
+    assert store.changes_since(0) == {a.id, b.id}
+
+    # A fresh instance sees the same persisted counter.
+    reopened = store_cls(tmp_path / name)
+    goals = reopened.load()
+    goals[1].micro_goals.append(MicroGoal(name="m"))
+    goals[1].micro_goals[0].record_checkin(date(2024, 1, 1), True)
+    reopened.save(goals)
+    assert store.generation() == 2
+    assert store.changes_since(1) == {b.id}
+
+    # Saving unchanged data is not a new generation.
+    store.save(store.load())
+    assert store.generation() == 2
+    assert store.changes_since(2) == set()
+
+    store.save([g for g in store.load() if g.id != a.id])
+    assert store.changes_since(2) == {a.id}
+    assert store.changes_since(0) == {a.id, b.id}
+    assert store.changes_since(99) is None
+
+
+def test_change_log_forgets_old_generations() -> None:
+    """Generations older than the feed report unknown changes."""
+    log = ChangeLog()
+    for i in range(LOG_SIZE + 5):
+        assert log.record({"g": str(i)})
+    assert log.since(log.generation - 1) == {"g"}
+    assert log.since(4) is None
+    assert ChangeLog.loads(log.dumps()) == log
+    with pytest.raises(ValueError):
+        ChangeLog.loads('{"generation": 1}')
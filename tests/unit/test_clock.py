@@ -0,0 +1,66 @@
+"""Tests for the clock service."""
+
+import json
+import threading
+from datetime import datetime
+
+from click.testing import CliRunner
+
+from loopbloom.services import datetime as clock_mod
+from loopbloom.services.datetime import Clock, get_current_datetime, use_clock
+
+
+def test_default_clock_follows_debug_date(monkeypatch) -> None:
+    """Outside a command the override is re-read, but parsed once per value."""
+    monkeypatch.setenv("LOOPBLOOM_DEBUG_DATE", "2024-03-05")
+    assert get_current_datetime() == datetime(2024, 3, 5)
+    parsed = clock_mod._override
+    assert get_current_datetime() == datetime(2024, 3, 5)
+    assert clock_mod._override is parsed
+    monkeypatch.setenv("LOOPBLOOM_DEBUG_DATE", "2024-03-06")
+    assert get_current_datetime() == datetime(2024, 3, 6)
+    monkeypatch.setenv("LOOPBLOOM_DEBUG_DATE", "not-a-date")
+    assert get_current_datetime().year >= 2024
+
+
+def test_use_clock_freezes_and_restores(monkeypatch) -> None:
+    """A fresh clock keeps its first answer until the block ends."""
+    monkeypatch.setenv("LOOPBLOOM_DEBUG_DATE", "2024-03-05")
+    with use_clock() as clock:
+        assert clock.today().isoformat() == "2024-03-05"
+        monkeypatch.setenv("LOOPBLOOM_DEBUG_DATE", "2024-03-06")
+        assert get_current_datetime() == datetime(2024, 3, 5)
+    assert get_current_datetime() == datetime(2024, 3, 6)
+
+
+def test_clock_is_per_thread_and_reaches_background_jobs() -> None:
+    """Another thread keeps its own clock; deferred jobs keep the caller's."""
+    from loopbloom.services.background import BackgroundTasks
+
+    seen = []
+    tasks = BackgroundTasks()
+    with use_clock(Clock(datetime(2021, 6, 1))):
+        worker = threading.Thread(target=lambda: seen.append(get_current_datetime()))
+        worker.start()
+        worker.join()
+        tasks.defer(lambda: seen.append(get_current_datetime()))
+    tasks.start()
+    assert tasks.join()
+    assert seen[0] != datetime(2021, 6, 1)
+    assert seen[1] == datetime(2021, 6, 1)
+
+
+def test_pinned_clock_reaches_commands(tmp_path) -> None:
+    """Commands run under a pinned clock instead of resolving their own."""
+    from loopbloom.__main__ import cli
+
+    data = tmp_path / "data.json"
+    env = {"LOOPBLOOM_DATA_PATH": str(data)}
+    runner = CliRunner()
+    runner.invoke(cli, ["goal", "add", "Sleep"], env=env)
+    runner.invoke(cli, ["micro", "add", "Bed", "--goal", "Sleep"], env=env)
+    with use_clock(Clock(datetime(2021, 6, 1, 9, 30))):
+        res = runner.invoke(cli, ["checkin", "Sleep"], env=env)
+    assert res.exit_code == 0
+    (goal,) = json.loads(data.read_text())
+    assert goal["micro_goals"][0]["checkins"][0]["date"] == "2021-06-01"
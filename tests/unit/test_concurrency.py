@@ -0,0 +1,134 @@
+"""Tests for optimistic concurrency control on saves."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from loopbloom.core.models import GoalArea
+from loopbloom.storage.base import ConflictError
+from loopbloom.storage.json_store import JSONStore
+from loopbloom.storage.sqlite_store import SQLiteStore
+
+BACKENDS = [(JSONStore, "d.json"), (SQLiteStore, "d.db")]
+
+
+def _seed(store) -> None:
+    store.save([GoalArea(name="A"), GoalArea(name="B"), GoalArea(name="C")])
+
+
+@pytest.mark.parametrize("store_cls,name", BACKENDS)
+def test_disjoint_saves_merge(tmp_path: Path, store_cls, name) -> None:
+    """Writers touching different goals both keep their changes."""
+    _seed(store_cls(tmp_path / name))
+    mine, theirs = store_cls(tmp_path / name), store_cls(tmp_path / name)
+    base = mine.generation()
+    goals = mine.load()
+
+    other = theirs.load()
+    other[1].notes = "theirs"
+    del other[2]
+    theirs.commit(other, theirs.generation())
+
+    goals[0].notes = "mine"
+    goals.append(GoalArea(name="D"))
+    written, generation = mine.commit(goals, base)
+    assert generation == base + 2
+    assert [(g.name, g.notes) for g in mine.load()] == [
+        ("A", "mine"),
+        ("B", "theirs"),
+        ("D", None),
+    ]
+    assert [g.name for g in written] == ["A", "B", "D"]
+
+
+@pytest.mark.parametrize("store_cls,name", BACKENDS)
+def test_same_goal_conflicts(tmp_path: Path, store_cls, name) -> None:
+    """Both writers changing one goal fail the later save."""
+    _seed(store_cls(tmp_path / name))
+    mine, theirs = store_cls(tmp_path / name), store_cls(tmp_path / name)
+    base = mine.generation()
+    goals = mine.load()
+
+    other = theirs.load()
+    other[0].notes = "theirs"
+    theirs.save(other)
+
+    goals[0].notes = "mine"
+    with pytest.raises(ConflictError) as info:
+        mine.commit(goals, base)
+    assert info.value.goal_ids == [goals[0].id]
+    assert mine.load()[0].notes == "theirs"
+
+    # The same edit on both sides is not a conflict.
+    goals[0].notes = "theirs"
+    mine.commit(goals, base)
+
+
+def test_cli_reports_conflicts(tmp_path: Path, monkeypatch) -> None:
+    """A command whose goal changed underneath it fails without saving."""
+    from loopbloom import __main__ as main
+
+    data = tmp_path / "data.json"
+    env = {"LOOPBLOOM_DATA_PATH": str(data)}
+    runner = CliRunner()
+    runner.invoke(main.cli, ["goal", "add", "Sleep"], env=env)
+    real_snapshot = JSONStore.snapshot
+    raced = []
+
+    def racing_snapshot(self):
+        goals, base = real_snapshot(self)
+        if not raced:
+            # Another process edits the goal right after the command loads it.
+            raced.append(True)
+            other = self.load()
+            other[0].notes = "edited elsewhere"
+            JSONStore(data).save(other)
+        return goals, base
+
+    monkeypatch.setattr(JSONStore, "snapshot", racing_snapshot)
+    res = runner.invoke(
+        main.cli, ["micro", "add", "Lights out", "--goal", "Sleep"], env=env
+    )
+    assert res.exit_code == 1
+    assert "Changed by another process meanwhile: Sleep" in res.output
+    (goal,) = json.loads(data.read_text())
+    assert goal["notes"] == "edited elsewhere" and not goal["micro_goals"]
+
+
+def test_load_waits_for_save_in_progress(tmp_path: Path, monkeypatch) -> None:
+    """A command starting between a save's meta and data writes keeps it."""
+    from loopbloom import __main__ as main
+
+    data = tmp_path / "data.json"
+    env = {"LOOPBLOOM_DATA_PATH": str(data)}
+    runner = CliRunner()
+    runner.invoke(main.cli, ["goal", "add", "Sleep"], env=env)
+    real_save_meta = JSONStore._save_meta
+    results: list = []
+    commands: list = []
+
+    def interleaved_save_meta(self, meta):
+        real_save_meta(self, meta)
+        if commands:
+            return
+        # The new generation is on disk but the data file is not yet.
+        command = threading.Thread(
+            target=lambda: results.append(
+                runner.invoke(main.cli, ["goal", "add", "Read"], env=env)
+            )
+        )
+        commands.append(command)
+        command.start()
+        command.join(0.2)
+
+    monkeypatch.setattr(JSONStore, "_save_meta", interleaved_save_meta)
+    store = JSONStore(data)
+    goals, base = store.snapshot()
+    store.commit([*goals, GoalArea(name="Walk")], base)
+    commands[0].join()
+    assert results[0].exit_code == 0, results[0].output
+    names = [g["name"] for g in json.loads(data.read_text())]
+    assert names == ["Sleep", "Walk", "Read"]
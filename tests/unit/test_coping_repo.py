@@ -9,3 +9,164 @@ def test_can_list_and_get_plans():
     assert plans, "At least one plan expected"
     plan = PlanRepository.get(plans[0].id)
     assert plan.title == plans[0].title
+
+
+def _write_plan(path, title="Calm"):
+    path.write_text(f"id: {path.stem}\ntitle: {title}\nsteps:\n  - message: hi\n")
+
+
+def _counting(monkeypatch):
+    import loopbloom.core.coping as cp_mod
+
+    calls = []
+    real = cp_mod._load_yaml
+
+    def load(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(cp_mod, "_load_yaml", load)
+    return calls
+
+
+def test_plan_index_hits_and_invalidates(tmp_path, monkeypatch):
+    """Unchanged files are served from the index; edits trigger a re-parse."""
+    import os
+
+    from loopbloom.core.coping import PlanIndex
+
+    calls = _counting(monkeypatch)
+    plan = tmp_path / "calm.yml"
+    _write_plan(plan)
+    index = PlanIndex()
+    assert index.get(tmp_path, "calm").title == "Calm"
+    assert index.get(tmp_path, "calm").title == "Calm"
+    assert len(index.list(tmp_path)) == 1
+    assert len(calls) == 1
+
+    # Same size, newer mtime.
+    _write_plan(plan, title="Cool")
+    st = plan.stat()
+    os.utime(plan, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert index.get(tmp_path, "calm").title == "Cool"
+    # Different size.
+    _write_plan(plan, title="Collected")
+    assert index.get(tmp_path, "calm").title == "Collected"
+    assert len(calls) == 3
+    assert index.get(tmp_path, "missing") is None
+
+
+def test_plan_index_persists_cache(tmp_path, monkeypatch):
+    """A fresh index reuses parsed plans from the cache file."""
+    from loopbloom.core.coping import PlanIndex
+
+    plans = tmp_path / "plans"
+    plans.mkdir()
+    _write_plan(plans / "calm.yml")
+    cache = tmp_path / "cache" / "plans.json"
+    PlanIndex(cache).list(plans)
+    assert cache.exists()
+
+    calls = _counting(monkeypatch)
+    assert PlanIndex(cache).get(plans, "calm").title == "Calm"
+    assert calls == []
+
+
+def test_yaml_loader_falls_back_without_libyaml(monkeypatch):
+    """``SafeLoader`` is used when PyYAML lacks the C extension."""
+    import importlib
+
+    import yaml
+
+    import loopbloom.core.coping as cp_mod
+
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    try:
+        importlib.reload(cp_mod)
+        assert cp_mod._YamlLoader is yaml.SafeLoader
+    finally:
+        monkeypatch.undo()
+        importlib.reload(cp_mod)
+
+
+def test_search_path_precedence(tmp_path, monkeypatch):
+    """User plans shadow team plans, which shadow bundled ones."""
+    import loopbloom.core.coping as cp_mod
+
+    user, team, bundled = (tmp_path / n for n in ("user", "team", "bundled"))
+    for d in (user, team, bundled):
+        d.mkdir()
+    _write_plan(bundled / "calm.yml", title="Bundled")
+    _write_plan(bundled / "walk.yml", title="Walk")
+    _write_plan(team / "calm.yml", title="Team")
+    _write_plan(team / "focus.yml", title="Focus")
+    monkeypatch.setattr(cp_mod, "USER_COPING_DIR", user)
+    monkeypatch.setattr(cp_mod, "COPING_DIR", bundled)
+    monkeypatch.setattr(cp_mod, "_index", cp_mod.PlanIndex())
+    monkeypatch.setattr(cp_mod.cfg, "load", lambda: {"coping_dirs": []})
+    monkeypatch.setenv("LOOPBLOOM_COPING_PATH", str(team))
+
+    assert cp_mod.search_path() == [user, team, bundled]
+    plans = cp_mod.PlanRepository.list_plans()
+    assert [(p.id, p.title) for p in plans] == [
+        ("calm", "Team"),
+        ("focus", "Focus"),
+        ("walk", "Walk"),
+    ]
+    _write_plan(user / "calm.yml", title="Mine")
+    assert cp_mod.PlanRepository.get("calm").title == "Mine"
+    assert cp_mod.PlanRepository.exists("focus")
+
+
+def test_directory_listing_cached_by_mtime(tmp_path, monkeypatch):
+    """Unchanged directories are not re-scanned; a new file invalidates."""
+    import os
+
+    import loopbloom.core.coping as cp_mod
+
+    plans = tmp_path / "plans"
+    plans.mkdir()
+    _write_plan(plans / "calm.yml")
+    old = plans.stat().st_mtime_ns - 10_000_000_000
+    os.utime(plans, ns=(old, old))
+    cache = tmp_path / "cache.json"
+    cp_mod.PlanIndex(cache).list(plans)
+
+    scans = []
+    real = os.scandir
+    monkeypatch.setattr(cp_mod.os, "scandir", lambda p: scans.append(p) or real(p))
+    index = cp_mod.PlanIndex(cache)
+    assert [p.id for p in index.list(plans)] == ["calm"]
+    assert scans == []
+
+    _write_plan(plans / "walk.yml")
+    assert [p.id for p in index.list(plans)] == ["calm", "walk"]
+    assert len(scans) == 1
+
+
+def test_catalog_reused_and_dated_plans_cached(tmp_path, monkeypatch):
+    """Repeat lookups reuse the catalog; YAML dates do not break the cache."""
+    import json
+    import os
+
+    from loopbloom.core.coping import PlanIndex
+
+    plans = tmp_path / "plans"
+    plans.mkdir()
+    (plans / "calm.yml").write_text(
+        "id: calm\ntitle: Calm\nreviewed: 2024-03-05\nsteps:\n  - message: hi\n"
+    )
+    old = plans.stat().st_mtime_ns - 10_000_000_000
+    os.utime(plans, ns=(old, old))
+    cache = tmp_path / "cache.json"
+    index = PlanIndex(cache)
+    assert index.get(plans, "calm").title == "Calm"
+    raw = json.loads(cache.read_text())
+    assert raw["files"][str(plans / "calm.yml")]["content"]["reviewed"] == "2024-03-05"
+
+    catalog = index.catalog([plans])
+    writes = []
+    monkeypatch.setattr(json, "dump", lambda *a, **k: writes.append(a))
+    assert index.get(plans, "calm").title == "Calm"
+    assert index.catalog([plans]) is catalog
+    assert writes == []
@@ -39,3 +39,18 @@ def test_csv_flatten() -> None:
     writer.writerows(rows)
     sio.seek(0)
     assert len(list(csv.reader(sio))) == 2
+
+
+def test_iter_changes_resets_edited_history() -> None:
+    """Editing an exported check-in re-sends the micro-goal's history."""
+    from loopbloom.cli.export import _iter_changes
+
+    m = MicroGoal(name="Walk 5", checkins=[Checkin(success=True)])
+    g = GoalArea(name="Exercise", micro_goals=[m])
+    marks: dict = {}
+    list(_iter_changes([g], {}, marks, deletions=False))
+    m.checkins[0].note = "edited"
+    new_marks: dict = {}
+    ops = [r["op"] for r in _iter_changes([g], marks, new_marks, deletions=False)]
+    assert ops == ["reset", "insert"]
+    assert new_marks[m.id]["count"] == 1
@@ -30,7 +30,82 @@ def test_journal_creates_entry(tmp_path: Path, monkeypatch) -> None:
         env={},
     )
     assert "Entry saved" in res.output
-    journal_file = Path(tmp_path) / "loopbloom" / "journal.json"
-    data = json.loads(journal_file.read_text())
+    (journal_file,) = (Path(tmp_path) / "loopbloom" / "journal").glob("*.ndjson")
+    data = [json.loads(line) for line in journal_file.read_text().splitlines()]
     assert data[0]["text"] == "test entry"
     assert data[0]["goal"] == "Sleep"
+
+
+def test_journal_migrates_legacy_file(tmp_path: Path, monkeypatch) -> None:
+    _reload_cli(tmp_path, monkeypatch)
+    import loopbloom.core.journal as journal_mod
+
+    legacy = Path(tmp_path) / "loopbloom" / "journal.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(
+        json.dumps([{"timestamp": "2023-01-05T10:00:00", "text": "old", "goal": None}])
+    )
+    journal_mod.add_entry("new")
+
+    assert [e.text for e in journal_mod.iter_entries()] == ["old", "new"]
+    assert (legacy.parent / "journal" / "2023-01.ndjson").exists()
+    assert not legacy.exists()
+
+
+def test_journal_migration_resumes_without_duplicates(
+    tmp_path: Path, monkeypatch
+) -> None:
+    _reload_cli(tmp_path, monkeypatch)
+    from loopbloom.core import segments
+
+    legacy = tmp_path / "journal.json"
+    root = tmp_path / "journal"
+    legacy.write_text(
+        json.dumps(
+            [
+                {"timestamp": "2023-01-05T10:00:00", "text": "jan"},
+                {"timestamp": "2023-02-05T10:00:00", "text": "feb"},
+            ]
+        )
+    )
+    real_replace = segments.os.replace
+    calls: list[Path] = []
+
+    def crash_after_first(src, dst):
+        real_replace(src, dst)
+        calls.append(Path(dst))
+        if len(calls) == 1:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(segments.os, "replace", crash_after_first)
+    try:
+        segments.migrate_legacy(legacy, root)
+    except KeyboardInterrupt:
+        pass
+    monkeypatch.setattr(segments.os, "replace", real_replace)
+    assert not legacy.exists()
+    assert (tmp_path / "journal.json.migrating").exists()
+
+    segments.migrate_legacy(legacy, root)
+    segments.migrate_legacy(legacy, root)
+
+    assert [r["text"] for r in segments.iter_records(root)] == ["jan", "feb"]
+    assert (tmp_path / "journal.json.migrated").exists()
+    assert not (tmp_path / "journal.json.migrating").exists()
+
+
+def test_journal_list_reads_newest(tmp_path: Path, monkeypatch) -> None:
+    cli = _reload_cli(tmp_path, monkeypatch)
+    runner = CliRunner()
+    for i in range(5):
+        goal = ["--goal", "Sleep"] if i % 2 == 0 else []
+        runner.invoke(cli, ["journal", "add", f"entry {i}", *goal], env={})
+
+    res = runner.invoke(cli, ["journal", "list", "--last", "2"], env={})
+    assert res.exit_code == 0
+    assert res.output.index("entry 3") < res.output.index("entry 4")
+    assert "entry 2" not in res.output
+
+    res = runner.invoke(cli, ["journal", "list", "--goal", "sleep", "--last", "2"])
+    assert "entry 2" in res.output and "entry 4" in res.output
+    assert "entry 3" not in res.output
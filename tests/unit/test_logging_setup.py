@@ -0,0 +1,62 @@
+"""Tests for the queued logging pipeline."""
+
+import io
+import json
+import logging
+
+from loopbloom import logging as lb_logging
+
+
+def test_records_are_written_by_the_listener_as_json(monkeypatch) -> None:
+    """Records go through the queue and come out as JSON lines."""
+    out = io.StringIO()
+    lb_logging._stop()
+    monkeypatch.setattr(lb_logging, "_target", lambda: logging.StreamHandler(out))
+    try:
+        lb_logging.setup_logging(logging.DEBUG, fmt="json")
+        # Repeated setup (one per shell command) keeps a single handler.
+        lb_logging.setup_logging(logging.DEBUG, fmt="json")
+        root = logging.getLogger()
+        assert sum(isinstance(h, lb_logging.QueueHandler) for h in root.handlers) == 1
+        logging.getLogger("loopbloom.test").info(
+            "Saved %d goals", 3, extra={"goal_id": "abc"}
+        )
+    finally:
+        lb_logging._stop()
+    (line,) = out.getvalue().splitlines()
+    entry = json.loads(line)
+    assert entry["message"] == "Saved 3 goals"
+    assert entry["level"] == "INFO" and entry["logger"] == "loopbloom.test"
+    assert entry["goal_id"] == "abc"
+
+
+def test_exceptions_keep_their_traceback(monkeypatch) -> None:
+    """``logger.exception`` records carry the traceback under ``exc``."""
+    out = io.StringIO()
+    lb_logging._stop()
+    monkeypatch.setattr(lb_logging, "_target", lambda: logging.StreamHandler(out))
+    try:
+        lb_logging.setup_logging(logging.INFO, fmt="json")
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logging.getLogger("loopbloom.test").exception("Save failed")
+    finally:
+        lb_logging._stop()
+    (line,) = out.getvalue().splitlines()
+    entry = json.loads(line)
+    assert entry["message"] == "Save failed"
+    assert "RuntimeError: boom" in entry["exc"]
+
+
+def test_text_format_is_the_default(monkeypatch) -> None:
+    """Without a JSON setting records use the plain text layout."""
+    out = io.StringIO()
+    lb_logging._stop()
+    monkeypatch.setattr(lb_logging, "_target", lambda: logging.StreamHandler(out))
+    try:
+        lb_logging.setup_logging(logging.INFO, fmt="text")
+        logging.getLogger("loopbloom.test").warning("Careful")
+    finally:
+        lb_logging._stop()
+    assert out.getvalue().rstrip().endswith("[WARNING] loopbloom.test: Careful")
@@ -9,3 +9,47 @@ def test_terminal_notify_caps(monkeypatch, capsys):
     notifier.send("Title", "Msg", mode="desktop")
     captured = capsys.readouterr()
     assert "Title" in captured.out
+
+
+def test_fan_out_to_terminal_and_file(tmp_path, monkeypatch, capsys):
+    """A comma list delivers to every channel and the feed gets one line."""
+    feed = tmp_path / "feed.ndjson"
+    opts = notifier.NotifySettings(feed_path=feed, timeouts=notifier.DEFAULT_TIMEOUTS)
+    monkeypatch.setattr(notifier, "settings", lambda: opts)
+    notifier.send("Title", "Msg", mode="terminal, file", goal="G")
+    assert "Title: Msg" in capsys.readouterr().out
+    lines = feed.read_text().splitlines()
+    assert len(lines) == 1 and '"goal": "G"' in lines[0]
+
+
+def test_slow_channel_times_out(monkeypatch):
+    """A channel exceeding its timeout is abandoned."""
+    import threading
+
+    gate = threading.Event()
+
+    class Slow:
+        def notify(self, *_, **__):
+            gate.wait()
+
+    monkeypatch.setattr(notifier, "notification", Slow())
+    opts = notifier.NotifySettings(timeouts={"desktop": 0.05, "terminal": 1.0})
+    results = notifier.dispatch("T", "M", ["desktop", "terminal"], opts=opts)
+    gate.set()
+    assert results["terminal"] == "ok"
+    assert results["desktop"] == "timeout"
+
+
+def test_pause_rules_recompile_on_config_change(tmp_path, monkeypatch):
+    """Compiled pause rules follow edits to ``config.toml``."""
+    from datetime import date
+
+    from loopbloom.core import config as cfg
+
+    monkeypatch.setattr(cfg, "CONFIG_PATH", tmp_path / "config.toml")
+    first = notifier.settings()
+    assert first is notifier.settings()
+    cfg.CONFIG_PATH.write_text('[goal_pauses]\nG = "2099-01-01"\n')
+    rules = notifier.settings()
+    assert rules.paused("G", date(2024, 1, 1))
+    assert not rules.paused("H", date(2024, 1, 1))
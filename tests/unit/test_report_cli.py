@@ -22,3 +22,28 @@ def test_report_helpers(capsys) -> None:  # noqa: D103
     _line_chart([goal])
     out3 = capsys.readouterr().out
     assert "Success Rate" in out3
+
+
+def test_calendar_heatmap_spans_multiple_months(capsys) -> None:  # noqa: D103
+    goal = GoalArea(name="G", micro_goals=[MicroGoal(name="M")])
+    _calendar_heatmap([goal], months=3)
+    out = capsys.readouterr().out
+    assert out.count("LoopBloom Check-in Heatmap") == 3
+
+
+def test_year_heatmap_counts_only_that_year(capsys) -> None:  # noqa: D103
+    from loopbloom.cli.report import _year_heatmap
+
+    micro = MicroGoal(name="M")
+    micro.checkins.extend(
+        [
+            Checkin(date=date(2023, 12, 31), success=True),
+            Checkin(date=date(2024, 1, 1), success=True),
+            Checkin(date=date(2024, 6, 1), success=False),
+        ]
+    )
+    _year_heatmap([GoalArea(name="G", micro_goals=[micro])], 2024)
+    out = capsys.readouterr().out
+    assert "Heatmap – 2024" in out
+    assert "Jan" in out and "Dec" in out
+    assert "1/2 successful check-ins across 2 day(s)" in out
@@ -30,7 +30,7 @@ def test_review_creates_entry(tmp_path: Path, monkeypatch) -> None:
         input="Great progress\n",
     )
     assert "Review saved" in res.output
-    review_file = Path(tmp_path) / "loopbloom" / "reviews.json"
-    data = json.loads(review_file.read_text())
+    (review_file,) = (Path(tmp_path) / "loopbloom" / "reviews").glob("*.ndjson")
+    data = [json.loads(line) for line in review_file.read_text().splitlines()]
     assert data[0]["period"] == "week"
     assert data[0]["went_well"] == "Great progress"
@@ -0,0 +1,137 @@
+"""Tests for the full-text search index."""
+
+from __future__ import annotations
+
+import importlib
+from datetime import date
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from loopbloom.core.models import Checkin, GoalArea, MicroGoal
+
+
+def _reload(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    import loopbloom.constants as const_mod
+    import loopbloom.core.config as cfg_mod
+    import loopbloom.core.journal as journal_mod
+
+    importlib.reload(cfg_mod)
+    importlib.reload(const_mod)
+    importlib.reload(journal_mod)
+    return journal_mod
+
+
+def _goals(note: str) -> list[GoalArea]:
+    micro = MicroGoal(
+        name="Walk",
+        checkins=[Checkin(date=date(2024, 3, 1), success=True, note=note)],
+    )
+    return [GoalArea(name="Fitness", micro_goals=[micro])]
+
+
+@pytest.mark.parametrize("backend", ["fts5", "python"])
+def test_incremental_refresh_and_filters(tmp_path, monkeypatch, backend) -> None:
+    """New journal lines and edited notes show up; filters narrow results."""
+    journal_mod = _reload(tmp_path, monkeypatch)
+    from loopbloom.services import search as srch
+
+    journal_mod.add_entry("Rainy morning walk by the river", goal="Fitness")
+    goals = _goals("river was flooded")
+    base = tmp_path / "idx"
+    with srch.open_index(base, backend=backend) as index:
+        index.refresh(goals)
+        hits = index.search(srch.parse_query("river"))
+        assert {h.kind for h in hits} == {"journal", "checkin"}
+
+    journal_mod.add_entry("Slept early", goal="Sleep")
+    goals[0].micro_goals[0].checkins[0].note = "sunny path"
+    with srch.open_index(base, backend=backend) as index:
+        index.refresh(goals)
+        assert [h.kind for h in index.search(srch.parse_query("river"))] == ["journal"]
+        assert index.search(srch.parse_query("sun*"))[0].day == "2024-03-01"
+        assert index.search(srch.parse_query("slept"), goal="fitness") == []
+        hits = index.search(srch.parse_query("path"), until=date(2024, 2, 1))
+        assert hits == []
+
+
+def test_search_cli(tmp_path, monkeypatch) -> None:
+    """``loopbloom search`` prints matching check-in notes and journal text."""
+    _reload(tmp_path, monkeypatch)
+    import loopbloom.__main__ as main
+
+    importlib.reload(main)
+    runner = CliRunner()
+    env = {"LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json")}
+    runner.invoke(main.cli, ["goal", "add", "Sleep"], env=env)
+    runner.invoke(main.cli, ["micro", "add", "Bed by 11", "--goal", "Sleep"], env=env)
+    runner.invoke(
+        main.cli, ["checkin", "Sleep", "--note", "Groggy but did it"], env=env
+    )
+    runner.invoke(main.cli, ["journal", "Felt groggy all day"], env=env)
+
+    res = runner.invoke(main.cli, ["search", "groggy"], env=env)
+    assert res.exit_code == 0
+    assert list((tmp_path / "cache" / "loopbloom").glob("search_index.*"))
+    assert "checkin [Sleep]  Groggy but did it" in res.output
+    assert "journal" in res.output
+
+    res = runner.invoke(main.cli, ["search", "groggy", "--kind", "journal"], env=env)
+    assert "checkin" not in res.output
+
+
+def test_index_primitives_are_abstract() -> None:
+    """A backend missing a storage primitive cannot be instantiated."""
+    from loopbloom.services import search as srch
+
+    class Partial(srch.SearchIndex):
+        def get_state(self, source):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()  # type: ignore[abstract]
+
+
+def test_sync_reads_goals_only_after_changes(tmp_path, monkeypatch) -> None:
+    """Unchanged stores are not re-read; saves rescan only touched goals."""
+    _reload(tmp_path, monkeypatch)
+    from loopbloom.services import search as srch
+    from loopbloom.storage.json_store import JSONStore
+
+    store = JSONStore(tmp_path / "data.json")
+    goals = _goals("river was flooded")
+    goals.append(GoalArea(name="Sleep"))
+    store.save(goals)
+    base = tmp_path / "idx"
+    with srch.open_index(base, backend="python") as index:
+        index.sync(store)
+        assert [h.kind for h in index.search(srch.parse_query("river"))] == ["checkin"]
+
+    reads = []
+    real_iter = JSONStore.iter_goals
+
+    def counting(self):
+        for g in real_iter(self):
+            reads.append(g.name)
+            yield g
+
+    monkeypatch.setattr(JSONStore, "iter_goals", counting)
+    with srch.open_index(base, backend="python") as index:
+        index.sync(store)
+    assert reads == []
+
+    goals[0].micro_goals[0].checkins[0].note = "sunny path"
+    store.save(goals)
+    with srch.open_index(base, backend="python") as index:
+        index.sync(store)
+        assert index.search(srch.parse_query("river")) == []
+        assert len(index.search(srch.parse_query("sunny"))) == 1
+
+    del goals[0]
+    store.save(goals)
+    with srch.open_index(base, backend="python") as index:
+        index.sync(store)
+        assert index.search(srch.parse_query("sunny")) == []
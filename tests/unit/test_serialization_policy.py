@@ -45,7 +45,8 @@ def _reload_journal(tmp_path: Path, monkeypatch):
 def test_review_json_timestamp_is_iso(tmp_path: Path, monkeypatch) -> None:
     review_mod = _reload_review(tmp_path, monkeypatch)
     review_mod.add_entry("week", "Great work")
-    data = json.loads(review_mod.REVIEW_PATH.read_text())
+    (segment,) = review_mod.REVIEW_DIR.glob("*.ndjson")
+    data = [json.loads(line) for line in segment.read_text().splitlines()]
     assert isinstance(data[0]["timestamp"], str)
     datetime.fromisoformat(data[0]["timestamp"])  # parseable
 
@@ -53,6 +54,7 @@ def test_review_json_timestamp_is_iso(tmp_path: Path, monkeypatch) -> None:
 def test_journal_json_timestamp_is_iso(tmp_path: Path, monkeypatch) -> None:
     journal_mod = _reload_journal(tmp_path, monkeypatch)
     journal_mod.add_entry("note", goal="G1")
-    data = json.loads(journal_mod.JOURNAL_PATH.read_text())
+    (segment,) = journal_mod.JOURNAL_DIR.glob("*.ndjson")
+    data = [json.loads(line) for line in segment.read_text().splitlines()]
     assert isinstance(data[0]["timestamp"], str)
     datetime.fromisoformat(data[0]["timestamp"])  # parseable
@@ -0,0 +1,99 @@
+"""Tests for incremental JSON parsing and streaming goal iteration."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from loopbloom.core.models import Checkin, GoalArea, MicroGoal, talk_id
+from loopbloom.storage.base import StorageError
+from loopbloom.storage.json_store import JSONStore
+from loopbloom.storage.sqlite_store import SQLiteStore
+from loopbloom.storage.streaming import iter_json_array
+
+
+def test_iter_json_array_small_chunks() -> None:
+    """Elements spanning many reads are decoded intact."""
+    doc = ' [ {"a": "x,]y"}, 123 ,[1, 2],\n"s" ] '
+    out = list(iter_json_array(io.StringIO(doc), chunk_size=1))
+    assert out == [{"a": "x,]y"}, 123, [1, 2], "s"]
+
+
+def test_iter_json_array_empty_and_invalid() -> None:
+    """Empty input yields nothing; malformed input raises."""
+    assert list(iter_json_array(io.StringIO(""))) == []
+    assert list(iter_json_array(io.StringIO("[]"))) == []
+    with pytest.raises(StorageError):
+        list(iter_json_array(io.StringIO("{}")))
+    with pytest.raises(StorageError):
+        list(iter_json_array(io.StringIO('[{"a": 1} {"b": 2}]')))
+
+
+@pytest.mark.parametrize(
+    "store_cls,name", [(JSONStore, "d.json"), (SQLiteStore, "d.db")]
+)
+def test_iter_goals_matches_load(tmp_path: Path, store_cls, name) -> None:
+    """Both backends stream the same goals they load."""
+    store = store_cls(tmp_path / name)
+    assert list(store.iter_goals()) == []
+    goals = [GoalArea(name="A" * 100_000), GoalArea(name="B")]
+    store.save(goals)
+    assert [g.name for g in store.iter_goals()] == [g.name for g in goals]
+
+
+@pytest.mark.parametrize(
+    "store_cls,name", [(JSONStore, "d.json"), (SQLiteStore, "d.db")]
+)
+def test_pep_talks_are_interned(tmp_path: Path, store_cls, name) -> None:
+    """Check-ins store a talk id; loading and streaming resolve the text."""
+    talk = "Keep going! " * 20
+    checkins = [Checkin(success=True, self_talk_generated=talk) for _ in range(50)]
+    goals = [GoalArea(name="G", micro_goals=[MicroGoal(name="M", checkins=checkins)])]
+    store = store_cls(tmp_path / name)
+    store.save(goals)
+
+    if store_cls is JSONStore:
+        raw = (tmp_path / name).read_text()
+        assert talk not in raw and raw.count(talk_id(talk)) == 50
+        assert json.loads(raw)[0]["name"] == "G"
+    for loaded in (store.load(), list(store.iter_goals())):
+        texts = {c.self_talk_generated for c in loaded[0].micro_goals[0].checkins}
+        assert texts == {talk}
+
+
+def test_unknown_talk_id_refuses_to_load(tmp_path: Path) -> None:
+    """A data file without its talk table fails instead of losing talks."""
+    checkins = [Checkin(success=True, self_talk_generated="Hi")]
+    goals = [GoalArea(name="G", micro_goals=[MicroGoal(name="M", checkins=checkins)])]
+    store = JSONStore(tmp_path / "d.json")
+    store.save(goals)
+    store.talks_path.unlink()
+    with pytest.raises(StorageError, match="unknown pep talk id"):
+        store.load()
+    with pytest.raises(StorageError):
+        list(store.iter_goals())
+
+
+def test_legacy_inline_talks_migrate(tmp_path: Path) -> None:
+    """Files with inline talk text load and are interned on the next save."""
+    path = tmp_path / "data.json"
+    legacy = GoalArea(
+        name="G",
+        micro_goals=[
+            MicroGoal(
+                name="M", checkins=[Checkin(success=True, self_talk_generated="Hi")]
+            )
+        ],
+    )
+    path.write_text(json.dumps([legacy.model_dump(mode="json")]))
+    store = JSONStore(path)
+    goals = store.load()
+    assert goals[0].micro_goals[0].checkins[0].self_talk_generated == "Hi"
+
+    store.save(goals)
+    assert "self_talk_generated" not in path.read_text()
+    assert json.loads((tmp_path / "data.talks.json").read_text())["talks"] == {
+        talk_id("Hi"): "Hi"
+    }
+    assert store.load()[0].micro_goals[0].checkins[0].self_talk_generated == "Hi"
@@ -1,5 +1,9 @@
 """Unit tests for pep-talk utilities."""
 
+import json
+import random
+from collections import Counter
+
 from loopbloom.core.talks import TalkPool
 
 
@@ -7,3 +11,62 @@ def test_random_talks_provide_variation() -> None:
     """Ensure random() returns varied results."""
     seen = {TalkPool.random("success") for _ in range(10)}
     assert len(seen) >= 2  # Variation expected
+
+
+def _isolate(tmp_path, monkeypatch, packs=None):
+    """Point the talk pool at ``tmp_path`` and reset its caches."""
+    import loopbloom.core.talks as talks_mod
+
+    user = tmp_path / "talks"
+    user.mkdir()
+    for name, pack in (packs or {}).items():
+        (user / name).write_text(json.dumps(pack))
+    monkeypatch.setattr(talks_mod, "USER_TALKS_DIR", user)
+    monkeypatch.setattr(talks_mod, "TALK_CACHE_PATH", tmp_path / "talks.marshal")
+    monkeypatch.setattr(talks_mod, "TALK_RECENT_PATH", tmp_path / "recent.json")
+    monkeypatch.setattr(TalkPool, "_cache", None)
+    monkeypatch.setattr(TalkPool, "_recent", None)
+    return talks_mod
+
+
+def test_alias_sampling_follows_weights() -> None:
+    """Alias tables reproduce the configured weights."""
+    from loopbloom.core.talks import MoodPool, Talk
+
+    pool = MoodPool([Talk("a", 1.0), Talk("b", 3.0), Talk("c", 0.0)])
+    rng = random.Random(7)
+    counts = Counter(pool.sample(rng) for _ in range(20000))
+    assert set(counts) == {0, 1}
+    assert 0.7 < counts[1] / 20000 < 0.8
+
+
+def test_user_packs_templates_and_cache(tmp_path, monkeypatch) -> None:
+    """User packs merge with bundled talks and the compiled pool is cached."""
+    talks_mod = _isolate(
+        tmp_path,
+        monkeypatch,
+        {"mine.json": {"cheer": [{"text": "Go {goal}, day {streak}!", "weight": 2}]}},
+    )
+    assert TalkPool.random("cheer", goal="Sleep", streak=3) == "Go Sleep, day 3!"
+    assert TalkPool.random("cheer") == "Go your goal, day 0!"
+    assert "success" in TalkPool._load()
+    assert (tmp_path / "talks.marshal").exists()
+
+    def fail(*_):
+        raise AssertionError("packs re-parsed")
+
+    monkeypatch.setattr(talks_mod, "_read_packs", fail)
+    monkeypatch.setattr(TalkPool, "_cache", None)
+    assert TalkPool._load()["cheer"].talks[0].fields == ("goal", "streak")
+
+
+def test_recent_talks_do_not_repeat(tmp_path, monkeypatch) -> None:
+    """Talks in the persisted recent ring are not picked again."""
+    _isolate(tmp_path, monkeypatch, {"mine.json": {"calm": ["a", "b", "c", "d"]}})
+    shown = [TalkPool.random("calm") for _ in range(4)]
+    assert len(set(shown)) == 4
+
+    monkeypatch.setattr(TalkPool, "_recent", None)
+    recent = json.loads((tmp_path / "recent.json").read_text())
+    assert recent == shown[-3:]
+    assert TalkPool.random("calm") == shown[0]
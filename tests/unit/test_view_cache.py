@@ -0,0 +1,76 @@
+"""Tests for the persistent summary and report view cache."""
+
+import os
+from datetime import date
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from loopbloom import constants
+from loopbloom.services.view_cache import ViewCache, Views
+from loopbloom.storage.json_store import JSONStore
+
+
+def test_views_reuse_results_until_inputs_change(tmp_path: Path) -> None:
+    """A view is computed once per data, day and parameters."""
+    cache = ViewCache(tmp_path)
+    calls = []
+
+    def compute() -> list:
+        calls.append(1)
+        return [len(calls)]
+
+    day = date(2024, 3, 5)
+    assert Views("abc", day, cache).get("summary", compute, window=7) == [1]
+    assert Views("abc", day, cache).get("summary", compute, window=7) == [1]
+    assert Views("abd", day, cache).get("summary", compute, window=7) == [2]
+    assert Views("abc", date(2024, 3, 6), cache).get("summary", compute) == [3]
+    assert Views("abc", day, cache).get("summary", compute, window=8) == [4]
+    # Unknown content is never cached.
+    assert Views(None, day, cache).get("summary", compute, window=7) == [5]
+    assert Views(None, day, cache).get("summary", compute, window=7) == [6]
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Old entries are dropped once the directory exceeds its budget."""
+    cache = ViewCache(tmp_path, max_bytes=25)
+    cache.put("a", "x" * 8)
+    cache.put("b", "y" * 8)
+    os.utime(tmp_path / "a.json", ns=(1, 1))
+    os.utime(tmp_path / "b.json", ns=(2, 2))
+    assert cache.get("a") == "x" * 8  # refreshes "a"
+    cache.put("c", "z" * 8)
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 8 and cache.get("c") == "z" * 8
+
+
+def test_summary_hit_skips_loading(tmp_path: Path, monkeypatch) -> None:
+    """Repeating a summary on unchanged data reads it from the cache."""
+    from loopbloom.__main__ import cli
+
+    monkeypatch.setattr(constants, "VIEW_CACHE_DIR", tmp_path / "views")
+    env = {
+        "LOOPBLOOM_DATA_PATH": str(tmp_path / "data.json"),
+        "LOOPBLOOM_DEBUG_DATE": "2024-03-05",
+    }
+    runner = CliRunner()
+    runner.invoke(cli, ["goal", "add", "Health"], env=env)
+    runner.invoke(cli, ["micro", "add", "Walk", "--goal", "Health"], env=env)
+    first = runner.invoke(cli, ["summary"], env=env)
+    report = runner.invoke(cli, ["report", "--mode", "success"], env=env)
+
+    def fail(self):
+        raise AssertionError("data was loaded")
+        yield
+
+    monkeypatch.setattr(JSONStore, "iter_goals", fail)
+    assert runner.invoke(cli, ["summary"], env=env).output == first.output
+    again = runner.invoke(cli, ["report", "--mode", "success"], env=env)
+    assert again.output == report.output
+
+    monkeypatch.undo()
+    monkeypatch.setattr(constants, "VIEW_CACHE_DIR", tmp_path / "views")
+    runner.invoke(cli, ["checkin", "Health"], env=env)
+    res = runner.invoke(cli, ["summary"], env=env)
+    # The new check-in replaces the empty ratio with a progress bar.
+    assert "\u2013" in first.output and "\u2013" not in res.output